@@ -0,0 +1,62 @@
+"""
+Benchmarks the time needed to compile a `DataFeed` from synthetic graphs of
+different sizes.
+
+Usage::
+
+    python benchmarks/bench_compile.py [sizes ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from tensortrade.feed import DataFeed, Stream
+
+
+def build_graph(n_nodes: int, n_sources: int = 10, seed: int = 0) -> "DataFeed":
+    """Builds a feed over a random graph of derived float streams.
+
+    Every derived stream combines one or two earlier streams, similar to a
+    feature set computed for several assets. All streams that are not used
+    by another stream are outputs of the feed.
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.standard_normal(100)
+
+    nodes = [Stream.source(data, dtype="float") for _ in range(n_sources)]
+    consumed = set()
+
+    while len(nodes) < n_nodes:
+        i = int(rng.integers(len(nodes)))
+        j = int(rng.integers(len(nodes)))
+        consumed.update([i, j])
+
+        op = int(rng.integers(4))
+        if op == 0:
+            node = nodes[i] + nodes[j]
+        elif op == 1:
+            node = nodes[i] * nodes[j]
+        elif op == 2:
+            node = nodes[i].cumsum()
+        else:
+            node = nodes[i].abs()
+        nodes += [node]
+
+    outputs = [s.rename(f"f{k}") for k, s in enumerate(nodes) if k not in consumed]
+    return DataFeed(outputs)
+
+
+def main(sizes: "list") -> None:
+    print(f"{'nodes':>8} {'compile (s)':>12}")
+    for n in sizes:
+        feed = build_graph(n)
+        start = time.perf_counter()
+        feed.compile()
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8} {elapsed:>12.4f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 1000, 10000])
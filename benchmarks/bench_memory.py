@@ -0,0 +1,36 @@
+"""
+Benchmarks the memory used by the streams of synthetic graphs of different
+sizes.
+
+Usage::
+
+    python benchmarks/bench_memory.py [sizes ...]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from bench_compile import build_graph
+
+
+def measure(n_nodes: int) -> int:
+    """Measures the bytes allocated to build a feed over a random graph."""
+    gc.collect()
+    tracemalloc.start()
+    feed = build_graph(n_nodes)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del feed
+    return current
+
+
+def main(sizes: "list") -> None:
+    print(f"{'nodes':>8} {'total (KiB)':>12} {'bytes/node':>11}")
+    for n in sizes:
+        total = measure(n)
+        print(f"{n:>8} {total / 1024:>12.1f} {total / n:>11.1f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [1000, 10000, 50000])
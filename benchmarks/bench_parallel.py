@@ -0,0 +1,72 @@
+"""
+Benchmarks running the independent branches of a `DataFeed` on a thread
+pool against running them on the calling thread.
+
+Each branch applies a NumPy computation that releases the GIL to the values
+of its own source, similar to heavy features computed for several assets.
+The cheap graph of `bench_compile` shows the overhead when no stream is
+expensive enough to leave the calling thread.
+
+Usage::
+
+    python benchmarks/bench_parallel.py [workers ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from tensortrade.feed import DataFeed, Stream
+
+from bench_compile import build_graph
+
+
+def build_branches(n_branches: int, size: int, steps: int = 60) -> "DataFeed":
+    """Builds a feed of independent branches, each sorting a large array on
+    every step."""
+    rng = np.random.default_rng(0)
+    streams = []
+    for i in range(n_branches):
+        data = rng.standard_normal(size)
+        source = Stream.source(np.arange(steps, dtype=float), dtype="float")
+        streams += [source.apply(lambda x, d=data: float(np.sort(d + x)[size // 2])).rename(f"branch{i}")]
+    return DataFeed(streams)
+
+
+def measure(feed: "DataFeed", workers: int, repeat: int = 3) -> float:
+    """Measures the best time per step of a feed compiled with `workers`
+    threads, after the calibration steps."""
+    feed.compile(workers=workers)
+    for _ in range(12):
+        feed.next()
+
+    best = float("inf")
+    for _ in range(repeat):
+        feed.reset()
+        steps = 0
+        start = time.perf_counter()
+        while feed.has_next():
+            feed.next()
+            steps += 1
+        best = min(best, (time.perf_counter() - start) / steps)
+    return best
+
+
+def main(workers: "list") -> None:
+    print(f"{'graph':>24} {'workers':>8} {'ms/step':>9} {'speedup':>8}")
+    graphs = [
+        ("8 branches x 1M sort", lambda: build_branches(8, 1_000_000)),
+        ("32 branches x 100k sort", lambda: build_branches(32, 100_000)),
+        ("1000 cheap nodes", lambda: build_graph(1000))
+    ]
+    for name, build in graphs:
+        baseline = measure(build(), 0)
+        print(f"{name:>24} {0:>8} {baseline * 1e3:>9.3f} {1:>8.2f}")
+        for n in workers:
+            elapsed = measure(build(), n)
+            print(f"{name:>24} {n:>8} {elapsed * 1e3:>9.3f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [2, 4, 8])
@@ -0,0 +1,64 @@
+"""
+Benchmarks the time per step of the rolling window aggregations for
+different window sizes, stepping a feed over a random walk.
+
+The median is also computed with `agg(np.nanmedian)`, which sorts the whole
+window on every step, to compare against the incremental operators. The
+mean, standard deviation, minimum, maximum and z-score are computed both by
+separate operators and by one fused `aggregate`.
+
+Usage::
+
+    python benchmarks/bench_rolling.py [windows ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from tensortrade.feed import DataFeed, Stream
+
+
+AGGREGATIONS = {
+    "sum": lambda r: r.sum(),
+    "mean": lambda r: r.mean(),
+    "var": lambda r: r.var(),
+    "std": lambda r: r.std(),
+    "min": lambda r: r.min(),
+    "max": lambda r: r.max(),
+    "median": lambda r: r.median(),
+    "quantile(0.9)": lambda r: r.quantile(0.9),
+    "agg(nanmedian)": lambda r: r.agg(np.nanmedian),
+    "5 separate": lambda r: [r.mean(), r.std(), r.min(), r.max(), (r.inputs[0] - r.mean()) / r.std()],
+    "5 aggregate": lambda r: list(r.aggregate(["mean", "std", "min", "max", "zscore"]).values())
+}
+
+
+def measure(aggregation: str, window: int, steps: int = 20000) -> float:
+    """Measures the time per step of a feed computing rolling aggregations
+    of a random walk."""
+    rng = np.random.default_rng(0)
+    source = Stream.source(rng.standard_normal(steps).cumsum(), dtype="float")
+    streams = AGGREGATIONS[aggregation](source.rolling(window))
+    if not isinstance(streams, list):
+        streams = [streams]
+    feed = DataFeed([s.rename(f"w{i}") for i, s in enumerate(streams)])
+    feed.compile()
+
+    start = time.perf_counter()
+    while feed.has_next():
+        feed.next()
+    return (time.perf_counter() - start) / steps
+
+
+def main(windows: "list") -> None:
+    print(f"{'aggregation':>15} {'window':>8} {'us/step':>9}")
+    for aggregation in AGGREGATIONS:
+        for window in windows:
+            elapsed = measure(aggregation, window)
+            print(f"{aggregation:>15} {window:>8} {elapsed * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 1000, 10000])
@@ -133,6 +133,8 @@ class Observable:
         Removes a listener from receiving alerts.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         self.listeners = []
 
@@ -70,9 +70,12 @@ class SimpleObserver(AbstractObserver):
         :returns: The current observation window.
         :rtype: ObsType
         """
-        state = list(self.trading_env.feed.state.features.values())
+        features = self.trading_env.feed.state.features
 
-        obs = np.array([state])
+        if isinstance(features, np.ndarray):
+            return features.astype(self._observation_dtype).reshape(1, -1)
+
+        obs = np.array([list(features.values())])
         obs = obs.astype(self._observation_dtype)
 
         return obs
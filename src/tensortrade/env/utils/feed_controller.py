@@ -30,8 +30,11 @@ from tensortrade.feed.core.base import IterableStream, Group, NameSpace
 if typing.TYPE_CHECKING:
     from pandas import DataFrame
 
-    from typing import Any, Dict, List, Optional
+    from typing import Any, Callable, Dict, List, Optional, Union
 
+    import numpy as np
+
+    from tensortrade.feed.core.profiler import FeedProfiler
     from tensortrade.oms.wallets import Portfolio, Wallet
 
 
@@ -40,18 +43,52 @@ class State:
     """The actual state of the environment.
 
     :param features: The features at this point in time.
-    :type features: Dict[str, Any]
+    :type features: Union[Dict[str, Any], np.ndarray]
     :param meta: The metadata at this point in time. Could be None.
     :type meta: Optional[Dict[str, Any]]
     :param meta: The portfolio data at this point in time.
     :type meta: Dict[str, Any]
     """
-    features: Dict[str, Any]
+    features: Union[Dict[str, Any], np.ndarray]
     meta: Optional[Dict[str, Any]]
     portfolio: Dict[str, Any]
     step: int
 
 
+class LazyState(State):
+    """A state whose metadata is only evaluated when it is read.
+
+    :param features: The features at this point in time.
+    :type features: Union[Dict[str, Any], np.ndarray]
+    :param resolve: A function returning the metadata at this point in time.
+    :type resolve: Callable[[], Optional[Dict[str, Any]]]
+    :param portfolio: The portfolio data at this point in time.
+    :type portfolio: Dict[str, Any]
+    :param step: The step of this point in time.
+    :type step: int
+    """
+    def __init__(
+            self,
+            features: Union[Dict[str, Any], np.ndarray],
+            resolve: Callable[[], Optional[Dict[str, Any]]],
+            portfolio: Dict[str, Any],
+            step: int
+    ):
+        self._resolve = resolve
+        super().__init__(features=features, meta=None, portfolio=portfolio, step=step)
+
+    @property
+    def meta(self) -> Optional[Dict[str, Any]]:
+        if self._meta is None and self._resolve is not None:
+            self._meta = self._resolve()
+            self._resolve = None
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: Optional[Dict[str, Any]]) -> None:
+        self._meta = value
+
+
 class FeedController(Observable, TimeIndexed):
     """This class is responsible for controlling the global feed in a :class:`TradingEnv`.
 
@@ -61,9 +98,13 @@ class FeedController(Observable, TimeIndexed):
     .. note::
         The feed need to be a group of streams compiled together to a :class:`DataFeed`. It should consists of:
             * features (Group): The features shown to the environment as observation for learning. This data should
-              be normalized and prepared for the environment. If it's missing a :class:`ValueError` is raised.
+              be normalized and prepared for the environment. If it's missing a :class:`ValueError` is raised. A
+              group created with ``Stream.vector`` provides the features as an array instead of a dictionary,
+              which the observers read without converting it.
             * meta (Group): The metadata used by the components, like plotters or plotters. This contains data like
-              raw ohlcv data. It can be omitted but this will display a warning.
+              raw ohlcv data. It can be omitted but this will display a warning. If the group is lazy, it is only
+              evaluated when ``state.meta`` or ``meta_history`` is read. If the feed is created with ``max_pending``,
+              only the metadata of that many steps before the read is kept, the earlier steps have none.
 
     :param feed: The feed to use.
     :type feed: DataFeed
@@ -78,6 +119,9 @@ class FeedController(Observable, TimeIndexed):
         super().__init__()
 
         self._meta_history: List[Dict[str, Any]] = []
+        self._lazy_meta: bool = False
+        self._episode: int = 0
+        self._index: int = -1
 
         self._prepare_feed(feed, portfolio)
         self._update_data()
@@ -98,7 +142,18 @@ class FeedController(Observable, TimeIndexed):
         :return: The metadata history.
         :rtype: DataFrame
         """
-        return pd.DataFrame(self._meta_history)
+        self._flush_meta()
+        return pd.DataFrame([{} if meta is None else meta for meta in self._meta_history])
+
+    @property
+    def profiler(self) -> Optional[FeedProfiler]:
+        """Gets the profiler of the feed, including the portfolio streams. Profiling is enabled when the feed given
+        to the environment has been profiled with ``DataFeed.profile()``.
+
+        :return: The profiler or None if profiling is disabled.
+        :rtype: Optional[FeedProfiler]
+        """
+        return self._feed.profiler
 
     @property
     def features_len(self) -> int:
@@ -109,6 +164,15 @@ class FeedController(Observable, TimeIndexed):
         """
         return self._feature_len
 
+    @property
+    def feature_names(self) -> List[str]:
+        """Gets the names of the features in the order they are observed.
+
+        :return: The names of the features.
+        :rtype: List[str]
+        """
+        return self._feature_names
+
     @property
     def features_size(self) -> int:
         """Gets the number of features per state.
@@ -133,26 +197,62 @@ class FeedController(Observable, TimeIndexed):
     def reset(self, random_start: int = 0) -> None:
         """Resets the feed and gets first data"""
         self._meta_history = []
+        self._episode += 1
+        self._index = -1
         self._feed.reset(random_start=random_start)
         self._update_data()
 
     def _update_data(self) -> None:
         """Updates the data variables"""
         data = self._feed.next()
-        meta = data.get('meta')
-        self._state = State(
-            features=data.get('features'),
-            meta=data.get('meta'),
-            portfolio=data.get('portfolio'),
-            step=self.clock.step
-        )
-
-        if meta is not None:
-            self._meta_history.append(meta)
+        self._index += 1
+
+        if self._lazy_meta:
+            episode, index = self._episode, self._index
+            self._state = LazyState(
+                features=data.get('features'),
+                resolve=lambda: self._get_meta(episode, index),
+                portfolio=data.get('portfolio'),
+                step=self.clock.step
+            )
+        else:
+            meta = data.get('meta')
+            self._state = State(
+                features=data.get('features'),
+                meta=meta,
+                portfolio=data.get('portfolio'),
+                step=self.clock.step
+            )
+
+            if meta is not None:
+                self._meta_history.append(meta)
 
         for listener in self.listeners:
             listener.on_next(self._state)
 
+    def _flush_meta(self) -> None:
+        """Evaluates the lazy metadata of all steps that have not been read yet."""
+        if self._lazy_meta:
+            flushed = self._feed.flush()
+            # The feed drops the steps beyond its ``max_pending`` limit, they have no metadata.
+            self._meta_history += [None] * (self._index + 1 - len(flushed) - len(self._meta_history))
+            self._meta_history += [data['meta'] for data in flushed]
+
+    def _get_meta(self, episode: int, index: int) -> Optional[Dict[str, Any]]:
+        """Gets the lazy metadata of a step.
+
+        :param episode: The episode of the step.
+        :type episode: int
+        :param index: The index of the step within the episode.
+        :type index: int
+        :return: The metadata of the step or None if the episode is over or the feed dropped the step.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        if episode != self._episode:
+            return None
+        self._flush_meta()
+        return self._meta_history[index]
+
     def _prepare_feed(self, input_feed: DataFeed, portfolio: Portfolio) -> None:
         """Prepares the feed to be used by the environment and all other components.
 
@@ -178,6 +278,7 @@ class FeedController(Observable, TimeIndexed):
 
             self._feature_len = len(features_feed.inputs[0].iterable)
             self._feature_size = len(features_feed.inputs)
+            self._feature_names = [fs.name for fs in features_feed.inputs]
 
             # display a warning when the user selects to many features.
             if self._feature_size > 20:
@@ -197,14 +298,22 @@ class FeedController(Observable, TimeIndexed):
                     raise ValueError('Environment only supports IterableStreams.')
 
             feed += [meta_feed]
+            self._lazy_meta = meta_feed.lazy
         except AttributeError:
             warn('Feed has no meta feed. Therefor some components may not work.', UserWarning)
 
         # add portfolio
         feed += [Stream.group(self.create_portfolio_streams(portfolio)).rename('portfolio')]
 
-        self._feed = DataFeed(feed)
-        self._feed.compile()
+        self._feed = DataFeed(feed, max_pending=input_feed.max_pending)
+        self._feed.compile(
+            batch=input_feed.batch,
+            optimize=input_feed.optimize,
+            workers=input_feed.workers,
+            threshold=input_feed.threshold
+        )
+        if input_feed.profiler is not None:
+            self._feed.profile()
         self.attach(portfolio)
 
     @staticmethod
@@ -14,16 +14,19 @@
 from __future__ import annotations
 
 import typing
-from collections import OrderedDict
 
 import numpy as np
 
 if typing.TYPE_CHECKING:
-    from typing import Dict
+    from typing import Dict, Union
 
 class ObservationHistory:
     """Stores observations from a given episode of the environment.
 
+    The observations are written into a preallocated array used as a ring
+    buffer. Every row is stored twice, so the window of the latest
+    observations is always a contiguous slice of the array.
+
     Parameters
     ----------
     window_size : int
@@ -33,54 +36,54 @@ class ObservationHistory:
     ----------
     window_size : int
         The amount of observations to keep stored before discarding them.
-    rows : pd.DataFrame
-        The rows of observations that are used as the environment observation
-        at each step of an episode.
+    rows : np.ndarray, optional
+        The ring buffer of observations, allocated by the first push.
+    index : int
+        The number of observations pushed since the last reset.
 
     """
 
     def __init__(self, window_size: int) -> None:
         self.window_size = window_size
-        self.rows = OrderedDict()
+        self.rows = None
         self.index = 0
 
-    def push(self, row: Dict) -> None:
+    def push(self, row: Union[Dict, np.ndarray]) -> None:
         """Stores an observation.
 
         Parameters
         ----------
-        row : Dict
-            The new observation to store.
+        row : Union[Dict, np.ndarray]
+            The new observation to store, either as a dictionary of features
+            or as an array of feature values.
         """
-        self.rows[self.index] = row
+        if isinstance(row, dict):
+            row = np.fromiter(row.values(), dtype=np.float64, count=len(row))
+
+        if self.rows is None:
+            self.rows = np.zeros((2 * self.window_size, len(row)))
+
+        position = self.index % self.window_size
+        self.rows[position] = row
+        self.rows[position + self.window_size] = row
         self.index += 1
-        if len(self.rows.keys()) > self.window_size:
-            del self.rows[list(self.rows.keys())[0]]
 
     def observe(self) -> np.array:
         """Gets the observation at a given step in an episode
 
+        Observations missing at the start of an episode are filled with
+        zeros.
+
         Returns
         -------
         `np.array`
             The current observation of the environment.
         """
-        rows = self.rows.copy()
-
-        if len(rows) < self.window_size:
-            size = self.window_size - len(rows)
-            padding = np.zeros((size, len(rows[list(rows.keys())[0]])))
-            r = np.array([list(inner_dict.values()) for inner_dict in rows.values()])
-            rows = np.concatenate((padding, r))
-
-        if isinstance(rows, OrderedDict):
-            rows = np.array([list(inner_dict.values()) for inner_dict in rows.values()])
-
-        rows = np.nan_to_num(rows)
-
-        return rows
+        start = self.index % self.window_size
+        return np.nan_to_num(self.rows[start:start + self.window_size])
 
     def reset(self) -> None:
         """Resets the observation history"""
-        self.rows = OrderedDict()
-        self.index = 0
\ No newline at end of file
+        if self.rows is not None:
+            self.rows.fill(0)
+        self.index = 0
@@ -2,4 +2,4 @@
 from . import api
 from . import core
 
-from .core import Stream, NameSpace, DataFeed
+from .core import Stream, NameSpace, NameRegistry, DataFeed
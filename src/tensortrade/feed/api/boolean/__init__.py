@@ -13,7 +13,7 @@ class BooleanMethods(Methods):
 
 @Stream.register_mixin(dtype="bool")
 class BooleanMixin(DataTypeMixin):
-    ...
+    __slots__ = ()
 
 
 class Boolean:
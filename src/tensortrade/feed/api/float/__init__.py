@@ -13,7 +13,7 @@ class FloatMethods(Methods):
 
 @Stream.register_mixin(dtype="float")
 class FloatMixin(DataTypeMixin):
-    ...
+    __slots__ = ()
 
 
 class Float:
@@ -47,3 +47,4 @@ from .imputation import *
 from .operations import *
 from .ordering import *
 from .utils import *
+from .indicators import *
@@ -13,6 +13,8 @@ class CumSum(Stream[float]):
     .. [1] https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.Series.cumsum.html
     """
 
+    _state_attrs = ("c_sum",)
+
     def __init__(self) -> None:
         super().__init__()
         self.c_sum = 0
@@ -24,9 +26,21 @@ class CumSum(Stream[float]):
         self.c_sum += node.value
         return self.c_sum
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        missing = np.isnan(values)
+        if not missing.any():
+            return np.cumsum(values)
+        output = np.cumsum(np.where(missing, 0, values))
+        output[missing] = np.nan
+        return output
+
     def has_next(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        self.c_sum = 0
+        super().reset()
+
 
 class CumProd(Stream[float]):
     """A stream operator that creates a cumulative product of values.
@@ -36,6 +50,8 @@ class CumProd(Stream[float]):
     .. [1] https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.Series.cumprod.html
     """
 
+    _state_attrs = ("c_prod",)
+
     def __init__(self) -> None:
         super().__init__()
         self.c_prod = 1
@@ -47,9 +63,21 @@ class CumProd(Stream[float]):
         self.c_prod *= node.value
         return self.c_prod
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        missing = np.isnan(values)
+        if not missing.any():
+            return np.cumprod(values)
+        output = np.cumprod(np.where(missing, 1, values))
+        output[missing] = np.nan
+        return output
+
     def has_next(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        self.c_prod = 1
+        super().reset()
+
 
 class CumMin(Stream[float]):
     """A stream operator that creates a cumulative minimum of values.
@@ -64,6 +92,8 @@ class CumMin(Stream[float]):
     [1] https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.Series.cummin.html
     """
 
+    _state_attrs = ("c_min",)
+
     def __init__(self, skip_na: bool = True) -> None:
         super().__init__()
         self.skip_na = skip_na
@@ -85,9 +115,21 @@ class CumMin(Stream[float]):
                 self.c_min = node.value
         return self.c_min
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        values = values.astype(np.float64)
+        if not self.skip_na:
+            return np.minimum.accumulate(values)
+        output = np.fmin.accumulate(values)
+        output[np.isnan(values)] = np.nan
+        return output
+
     def has_next(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        self.c_min = np.inf
+        super().reset()
+
 
 class CumMax(Stream[float]):
     """A stream operator that creates a cumulative maximum of values.
@@ -102,6 +144,8 @@ class CumMax(Stream[float]):
     [1] https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.Series.cummax.html
     """
 
+    _state_attrs = ("c_max",)
+
     def __init__(self, skip_na: bool = True) -> None:
         super().__init__()
         self.skip_na = skip_na
@@ -123,9 +167,21 @@ class CumMax(Stream[float]):
                 self.c_max = node.value
         return self.c_max
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        values = values.astype(np.float64)
+        if not self.skip_na:
+            return np.maximum.accumulate(values)
+        output = np.fmax.accumulate(values)
+        output[np.isnan(values)] = np.nan
+        return output
+
     def has_next(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        self.c_max = -np.inf
+        super().reset()
+
 
 @Float.register(["cumsum"])
 def cumsum(s: "Stream[float]") -> "Stream[float]":
@@ -0,0 +1,365 @@
+"""
+indicators.py contains functions and classes for technical indicators of
+float streams, computed with constant state per step.
+"""
+
+from functools import partial
+from typing import Dict
+
+import numpy as np
+
+from tensortrade.feed.core.base import Stream
+from tensortrade.feed.api.float import Float
+from tensortrade.feed.api.float.window.ewm import EWMean, _run
+
+
+class RelativeStrength:
+    """The relative strength index of floats added one after another.
+
+    The average gains and losses are smoothed like the exponential weighted
+    moving average with :math:`\\alpha = 1 / window` and `adjust=False`, and
+    the first difference counts as neither a gain nor a loss.
+
+    Parameters
+    ----------
+    window : int
+        The number of periods of the smoothing, also the number of values
+        needed to have a value.
+    """
+
+    __slots__ = ("prev", "gain", "loss")
+
+    def __init__(self, window: int) -> None:
+        self.prev = np.nan
+        self.gain = EWMean(1 / window, False, False, window)
+        self.loss = EWMean(1 / window, False, False, window)
+
+    def update(self, value: float) -> float:
+        """Adds a value and computes the relative strength index.
+
+        Parameters
+        ----------
+        value : float
+            The value to add.
+
+        Returns
+        -------
+        float
+            The index between 0 and 100, or NaN if there are not enough values.
+        """
+        diff = value - self.prev
+        self.prev = value
+
+        gain = self.gain.update(diff if diff > 0 else 0.0)
+        loss = self.loss.update(-diff if diff < 0 else 0.0)
+
+        if loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + gain / loss))
+
+
+class TrueRangeAverage:
+    """The average true range of bars added one after another.
+
+    The first average is the mean of the first `window` true ranges, every
+    further one is smoothed as `(atr * (window - 1) + tr) / window`. A true
+    range that is missing is skipped.
+
+    Parameters
+    ----------
+    window : int
+        The number of periods of the smoothing.
+    """
+
+    __slots__ = ("window", "prev_close", "count", "atr")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.prev_close = np.nan
+        self.count = 0
+        self.atr = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Adds a bar and computes the average true range.
+
+        Parameters
+        ----------
+        high : float
+            The high of the bar.
+        low : float
+            The low of the bar.
+        close : float
+            The close of the bar.
+
+        Returns
+        -------
+        float
+            The average true range, or NaN if there are not enough bars.
+        """
+        ranges = [r for r in (high - low, abs(high - self.prev_close), abs(low - self.prev_close)) if r == r]
+        self.prev_close = close
+        return self.add(max(ranges) if len(ranges) > 0 else np.nan)
+
+    def add(self, tr: float) -> float:
+        """Adds a true range and computes the average true range.
+
+        Parameters
+        ----------
+        tr : float
+            The true range to add.
+
+        Returns
+        -------
+        float
+            The average true range, or NaN if there are not enough true
+            ranges or `tr` is missing.
+        """
+        if tr != tr:
+            return np.nan
+
+        self.count += 1
+        if self.count < self.window:
+            self.atr += tr
+            return np.nan
+        if self.count == self.window:
+            self.atr = (self.atr + tr) / self.window
+        else:
+            self.atr = (self.atr * (self.window - 1) + tr) / self.window
+        return self.atr
+
+
+class RelativeStrengthIndex(Stream[float]):
+    """A stream operator that computes the relative strength index of a given
+    float stream.
+
+    The batch kernel computes the gains, losses and the index over whole
+    columns, only the smoothing of the gains and losses loops over them.
+
+    Parameters
+    ----------
+    window : int
+        The number of periods of the smoothing.
+    """
+
+    _state_attrs = ("acc",)
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "RelativeStrength":
+        return RelativeStrength(self.window)
+
+    def forward(self) -> float:
+        return self.acc.update(self.inputs[0].value)
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        values = np.asarray(values, dtype=np.float64)
+        diff = np.empty_like(values)
+        diff[:1] = np.nan
+        np.subtract(values[1:], values[:-1], out=diff[1:])
+
+        smoothing = partial(EWMean, 1 / self.window, False, False, self.window)
+        gain = _run(smoothing, np.where(diff > 0, diff, 0.0))
+        loss = _run(smoothing, np.where(diff < 0, -diff, 0.0))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index = 100 - (100 / (1 + gain / loss))
+        return np.where(loss == 0, 100.0, index)
+
+    def has_next(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.acc = self.accumulator()
+        super().reset()
+
+
+class AverageTrueRange(Stream[float]):
+    """A stream operator that computes the average true range of the given
+    high, low and close float streams.
+
+    The batch kernel computes the true ranges over whole columns, only the
+    smoothing of the true ranges loops over them.
+
+    Parameters
+    ----------
+    window : int
+        The number of periods of the smoothing.
+    """
+
+    _state_attrs = ("acc",)
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "TrueRangeAverage":
+        return TrueRangeAverage(self.window)
+
+    def forward(self) -> float:
+        high, low, close = self.inputs
+        return self.acc.update(high.value, low.value, close.value)
+
+    def forward_batch(self, high: "np.ndarray", low: "np.ndarray", close: "np.ndarray") -> "np.ndarray":
+        high, low, close = [np.asarray(c, dtype=np.float64) for c in (high, low, close)]
+        prev_close = np.empty_like(close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close[:-1]
+
+        # The maximum of the ranges that are not missing.
+        tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+        add = self.accumulator().add
+        return np.fromiter(map(add, tr.tolist()), dtype=np.float64, count=len(tr))
+
+    def has_next(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.acc = self.accumulator()
+        super().reset()
+
+
+@Float.register(["rsi"])
+def rsi(s: "Stream[float]", window: int = 14) -> "Stream[float]":
+    """Computes the relative strength index of a float stream.
+
+    Parameters
+    ----------
+    s : `Stream[float]`
+        A float stream.
+    window : int, default 14
+        The number of periods of the smoothing.
+
+    Returns
+    -------
+    `Stream[float]`
+        The relative strength index stream of `s`, missing for the first
+        `window - 1` values.
+    """
+    return RelativeStrengthIndex(window)(s).astype("float")
+
+
+@Float.register(["atr"])
+def atr(s: "Stream[float]",
+        high: "Stream[float]",
+        low: "Stream[float]",
+        window: int = 14) -> "Stream[float]":
+    """Computes the average true range of a float stream of close prices.
+
+    Parameters
+    ----------
+    s : `Stream[float]`
+        A float stream of close prices.
+    high : `Stream[float]`
+        The float stream of high prices.
+    low : `Stream[float]`
+        The float stream of low prices.
+    window : int, default 14
+        The number of periods of the smoothing.
+
+    Returns
+    -------
+    `Stream[float]`
+        The average true range stream, missing for the first `window - 1`
+        values.
+    """
+    return AverageTrueRange(window)(high, low, s).astype("float")
+
+
+@Float.register(["macd"])
+def macd(s: "Stream[float]",
+         fast: int = 12,
+         slow: int = 26,
+         signal: int = 9) -> "Dict[str, Stream[float]]":
+    """Computes the moving average convergence divergence of a float stream.
+
+    The moving averages are exponential weighted moving averages with
+    `adjust=False`, each missing until it has as many values as its span.
+
+    Parameters
+    ----------
+    s : `Stream[float]`
+        A float stream.
+    fast : int, default 12
+        The span of the fast moving average.
+    slow : int, default 26
+        The span of the slow moving average.
+    signal : int, default 9
+        The span of the moving average of the MACD line.
+
+    Returns
+    -------
+    `Dict[str, Stream[float]]`
+        The streams of the MACD line ("macd"), its moving average ("signal")
+        and their difference ("diff").
+    """
+    line = s.ewm(span=fast, min_periods=fast, adjust=False).mean() - \
+        s.ewm(span=slow, min_periods=slow, adjust=False).mean()
+    average = line.ewm(span=signal, min_periods=signal, adjust=False).mean()
+    return {"macd": line, "signal": average, "diff": line - average}
+
+
+@Float.register(["bollinger"])
+def bollinger(s: "Stream[float]",
+              window: int = 20,
+              k: float = 2) -> "Dict[str, Stream[float]]":
+    """Computes the Bollinger bands of a float stream.
+
+    The bands are `k` population standard deviations of a rolling window
+    above and below its mean.
+
+    Parameters
+    ----------
+    s : `Stream[float]`
+        A float stream.
+    window : int, default 20
+        The size of the rolling window, also the number of values needed to
+        have a value.
+    k : float, default 2
+        The number of standard deviations of the bands.
+
+    Returns
+    -------
+    `Dict[str, Stream[float]]`
+        The streams of the rolling mean ("middle") and of the upper ("upper")
+        and lower ("lower") bands.
+    """
+    stats = s.rolling(window, min_periods=window).aggregate(["mean", "var"])
+    width = k * (stats["var"] * ((window - 1) / window)).sqrt()
+    return {"middle": stats["mean"], "upper": stats["mean"] + width, "lower": stats["mean"] - width}
+
+
+@Float.register(["stochastic"])
+def stochastic(s: "Stream[float]",
+               high: "Stream[float]",
+               low: "Stream[float]",
+               window: int = 14,
+               smooth: int = 3) -> "Dict[str, Stream[float]]":
+    """Computes the stochastic oscillator of a float stream of close prices.
+
+    Parameters
+    ----------
+    s : `Stream[float]`
+        A float stream of close prices.
+    high : `Stream[float]`
+        The float stream of high prices.
+    low : `Stream[float]`
+        The float stream of low prices.
+    window : int, default 14
+        The number of periods of the highest high and the lowest low.
+    smooth : int, default 3
+        The size of the rolling mean of the oscillator.
+
+    Returns
+    -------
+    `Dict[str, Stream[float]]`
+        The streams of the oscillator ("k") and its rolling mean ("d").
+    """
+    lowest = low.rolling(window, min_periods=window).min()
+    highest = high.rolling(window, min_periods=window).max()
+    k = 100 * (s - lowest) / (highest - lowest)
+    return {"k": k, "d": k.rolling(smooth, min_periods=smooth).mean()}
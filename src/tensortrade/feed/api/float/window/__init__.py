@@ -1,3 +1,3 @@
-from .ewm import ewm
+from .ewm import ewm, ewm_mean, ewm_var, ewm_std, ewm_cov, ewm_corr
 from .expanding import expanding
 from .rolling import rolling
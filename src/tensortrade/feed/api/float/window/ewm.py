@@ -3,68 +3,110 @@ ewm.py contains functions and classes for exponential weighted moving stream
 operations.
 """
 
-from typing import List, Tuple
+import math
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 
 from tensortrade.feed.core.base import Stream
 from tensortrade.feed.api.float import Float
 
 
-class ExponentialWeightedMovingAverage(Stream[float]):
-    r"""A stream operator that computes an exponential weighted moving average
-    on a given float stream.
+def get_alpha(com: float = None,
+              span: float = None,
+              halflife: float = None,
+              alpha: float = None) -> float:
+    r"""Computes the smoothing factor from exactly one of the decay parameters.
 
     Parameters
     ----------
-    alpha : float
-        The smoothing factor :math:`\alpha` directly,
+    com : float, optional
+        Specify decay in terms of center of mass,
+        :math:`\alpha = 1 / (1 + com)`, for :math:`com \geq 0`.
+    span : float, optional
+        Specify decay in terms of span,
+        :math:`\alpha = 2 / (span + 1)`, for :math:`span \geq 1`.
+    halflife : float, optional
+        Specify decay in terms of half-life,
+        :math:`\alpha = 1 - \exp\left(-\ln(2) / halflife\right)`, for
+        :math:`halflife > 0`.
+    alpha : float, optional
+        Specify smoothing factor :math:`\alpha` directly,
         :math:`0 < \alpha \leq 1`.
+
+    Returns
+    -------
+    float
+        The smoothing factor :math:`\alpha`.
+    """
+    if alpha:
+        assert 0 < alpha <= 1
+        return alpha
+    elif com:
+        assert com >= 0
+        return 1 / (1 + com)
+    elif span:
+        assert span >= 1
+        return 2 / (1 + span)
+    elif halflife:
+        assert halflife > 0
+        return 1 - np.exp(np.log(0.5) / halflife)
+
+
+class EWMean:
+    """The exponential weighted moving average of floats added one after
+    another.
+
+    Parameters
+    ----------
+    alpha : float
+        The smoothing factor.
     adjust : bool
-        Divide by decaying adjustment factor in beginning periods to account
-        for imbalance in relative weightings (viewing EWMA as a moving average).
+        Divide by decaying adjustment factor in beginning periods.
     ignore_na : bool
         Ignore missing values when calculating weights.
     min_periods : int
-        Minimum number of observations in window required to have a value
-        (otherwise result is NA).
+        Minimum number of observations required to have a value.
 
     References
     ----------
     .. [1] https://github.com/pandas-dev/pandas/blob/d9fff2792bf16178d4e450fe7384244e50635733/pandas/_libs/window/aggregations.pyx#L1801
     """
 
-    def __init__(self,
-                 alpha: float,
-                 adjust: bool,
-                 ignore_na: bool,
-                 min_periods: int) -> None:
-        super().__init__()
-        self.alpha = alpha
+    __slots__ = ("factor", "new_wt", "adjust", "ignore_na", "min_periods", "n", "avg", "old_wt")
+
+    def __init__(self, alpha: float, adjust: bool, ignore_na: bool, min_periods: int) -> None:
+        self.factor = 1 - alpha
+        self.new_wt = 1 if adjust else alpha
         self.adjust = adjust
         self.ignore_na = ignore_na
         self.min_periods = max(min_periods, 1)
 
-        self.i = 0
         self.n = 0
-
         self.avg = None
-        self.factor = 1 - alpha
-        self.new_wt = 1 if self.adjust else self.alpha
         self.old_wt = 1
 
-    def forward(self) -> float:
-        value = self.inputs[0].value
+    def update(self, value: float) -> float:
+        """Adds a value and computes the average.
+
+        Parameters
+        ----------
+        value : float
+            The value to add.
+
+        Returns
+        -------
+        float
+            The average, or NaN if there are not enough observations.
+        """
+        is_observation = value == value
+        self.n += int(is_observation)
+
         if self.avg is None:
-            is_observation = (value == value)
-            self.n += int(is_observation)
             self.avg = value
-            return self.avg if self.n >= self.min_periods else np.nan
-
-        is_observation = (value == value)
-        self.n += is_observation
 
-        if self.avg == self.avg:
+        elif self.avg == self.avg:
 
             if is_observation or not self.ignore_na:
 
@@ -86,60 +128,39 @@ class ExponentialWeightedMovingAverage(Stream[float]):
 
         return self.avg if self.n >= self.min_periods else np.nan
 
-    def has_next(self) -> bool:
-        return True
-
-    def reset(self) -> None:
-        self.i = 0
-        self.n = 0
-
-        self.avg = None
-        self.old_wt = 1
-        super().reset()
 
-
-class ExponentialWeightedMovingCovariance(Stream[float]):
-    r"""A stream operator that computes an exponential weighted moving average
-    on a given float stream.
+class EWCovariance:
+    """The exponential weighted moving covariance of pairs of floats added one
+    after another.
 
     Parameters
     ----------
     alpha : float
-        The smoothing factor :math:`\alpha` directly,
-        :math:`0 < \alpha \leq 1`.
+        The smoothing factor.
     adjust : bool
-        Divide by decaying adjustment factor in beginning periods to account
-        for imbalance in relative weightings (viewing EWMA as a moving average).
+        Divide by decaying adjustment factor in beginning periods.
     ignore_na : bool
         Ignore missing values when calculating weights.
     min_periods : int
-        Minimum number of observations in window required to have a value
-        (otherwise result is NA).
+        Minimum number of observations required to have a value.
     bias : bool
-        Use a standard estimation bias correction
+        Use a standard estimation bias correction.
     """
 
-    def __init__(self,
-                 alpha: float,
-                 adjust: bool,
-                 ignore_na: bool,
-                 min_periods: int,
-                 bias: bool) -> None:
-        super().__init__()
-        self.alpha = alpha
+    __slots__ = (
+        "factor", "new_wt", "adjust", "ignore_na", "min_periods", "bias",
+        "n", "old_wt", "mean_x", "mean_y", "cov", "sum_wt", "sum_wt2"
+    )
+
+    def __init__(self, alpha: float, adjust: bool, ignore_na: bool, min_periods: int, bias: bool) -> None:
+        self.factor = 1 - alpha
+        self.new_wt = 1 if adjust else alpha
         self.adjust = adjust
         self.ignore_na = ignore_na
-        self.min_periods = min_periods
+        self.min_periods = max(min_periods, 1)
         self.bias = bias
 
-        self.i = 0
         self.n = 0
-
-        self.minp = max(self.min_periods, 1)
-
-        self.avg = None
-        self.factor = 1 - alpha
-        self.new_wt = 1 if self.adjust else self.alpha
         self.old_wt = 1
 
         self.mean_x = None
@@ -148,23 +169,33 @@ class ExponentialWeightedMovingCovariance(Stream[float]):
         self.cov = 0
         self.sum_wt = 1
         self.sum_wt2 = 1
-        self.old_wt = 1
 
-    def forward(self) -> float:
-        v1 = self.inputs[0].value
-        v2 = self.inputs[1].value
-        if self.mean_x is None and self.mean_y is None:
-            self.mean_x = v1
-            self.mean_y = v2
-            is_observation = (self.mean_x == self.mean_x) and (self.mean_y == self.mean_y)
-            self.n += int(is_observation)
-            if not is_observation:
-                self.mean_x = np.nan
-                self.mean_y = np.nan
-            return (0. if self.bias else np.nan) if self.n >= self.minp else np.nan
+    def update(self, v1: float, v2: float) -> float:
+        """Adds a pair of values and computes the covariance.
+
+        Parameters
+        ----------
+        v1 : float
+            The value of the first series.
+        v2 : float
+            The value of the second series.
 
+        Returns
+        -------
+        float
+            The covariance, or NaN if there are not enough observations.
+        """
         is_observation = (v1 == v1) and (v2 == v2)
-        self.n += is_observation
+        self.n += int(is_observation)
+
+        if self.mean_x is None:
+            if is_observation:
+                self.mean_x = v1
+                self.mean_y = v2
+            else:
+                self.mean_x = np.nan
+                self.mean_y = np.nan
+            return (0. if self.bias else np.nan) if self.n >= self.min_periods else np.nan
 
         if self.mean_x == self.mean_x:
             if is_observation or not self.ignore_na:
@@ -207,39 +238,297 @@ class ExponentialWeightedMovingCovariance(Stream[float]):
             self.mean_x = v1
             self.mean_y = v2
 
-        if self.n >= self.minp:
-            if not self.bias:
-                numerator = self.sum_wt * self.sum_wt
-                denominator = numerator - self.sum_wt2
-                if denominator > 0:
-                    output = ((numerator / denominator) * self.cov)
-                else:
-                    output = np.nan
-            else:
-                output = self.cov
+        if self.n < self.min_periods:
+            return np.nan
+        if self.bias:
+            return self.cov
+
+        numerator = self.sum_wt * self.sum_wt
+        denominator = numerator - self.sum_wt2
+        return (numerator / denominator) * self.cov if denominator > 0 else np.nan
+
+
+class EWCorrelation:
+    """The exponential weighted moving correlation of pairs of floats added one
+    after another.
+
+    Like in pandas, a value missing from either series is treated as missing
+    from both, and the correlation is computed from the biased covariance and
+    variances.
+
+    Parameters
+    ----------
+    alpha : float
+        The smoothing factor.
+    adjust : bool
+        Divide by decaying adjustment factor in beginning periods.
+    ignore_na : bool
+        Ignore missing values when calculating weights.
+    min_periods : int
+        Minimum number of observations required to have a value.
+    """
+
+    __slots__ = ("xy", "xx", "yy")
+
+    def __init__(self, alpha: float, adjust: bool, ignore_na: bool, min_periods: int) -> None:
+        self.xy = EWCovariance(alpha, adjust, ignore_na, min_periods, True)
+        self.xx = EWCovariance(alpha, adjust, ignore_na, min_periods, True)
+        self.yy = EWCovariance(alpha, adjust, ignore_na, min_periods, True)
+
+    def update(self, v1: float, v2: float) -> float:
+        """Adds a pair of values and computes the correlation.
+
+        Parameters
+        ----------
+        v1 : float
+            The value of the first series.
+        v2 : float
+            The value of the second series.
+
+        Returns
+        -------
+        float
+            The correlation, or NaN if there are not enough observations.
+        """
+        if not (v1 == v1 and v2 == v2):
+            v1 = v2 = np.nan
+
+        cov = self.xy.update(v1, v2)
+        var = self.xx.update(v1, v1) * self.yy.update(v2, v2)
+        den = 0.0 if var < 0 else math.sqrt(var)
+
+        if den == 0:
+            return np.nan if cov == 0 or cov != cov else math.copysign(np.inf, cov)
+        return cov / den
+
+
+def _run(accumulator: "Callable[[], object]", *columns: "np.ndarray") -> "np.ndarray":
+    """Computes the values of a fresh accumulator updated with every row of
+    the given columns.
+
+    This is a loop over the rows, not a vectorized computation. The
+    recurrences of the accumulators are sequential, and evaluating them with
+    array arithmetic, e.g. from the powers of the decay, changes the last
+    bits of the values, so the columns would no longer equal the values of
+    the streams stepped one by one. Batch mode only saves the overhead of
+    stepping the graph for these streams.
+    """
+    columns = [np.asarray(c, dtype=np.float64).tolist() for c in columns]
+    update = accumulator().update
+    return np.fromiter(map(update, *columns), dtype=np.float64, count=len(columns[0]))
+
+
+def _vectorized_mean(values: "np.ndarray",
+                     alpha: float,
+                     adjust: bool,
+                     ignore_na: bool,
+                     min_periods: int) -> "Optional[np.ndarray]":
+    """Computes the exponential weighted moving average of an array with
+    linear filters over the whole array.
+
+    The average is the ratio of two first order recursive filters, the
+    weighted sum of the observations and the sum of their weights, or a
+    single filter for `adjust=False`. The values agree with the ones of
+    `EWMean` within a relative tolerance of about `1e-12`, but not in every
+    bit, e.g. a constant series is not reproduced exactly.
+
+    Returns
+    -------
+    `np.ndarray`, optional
+        The averages, or None if the array contains infinite values, or
+        missing values with `adjust=False` and `ignore_na=False`. The weights
+        of these cases do not follow a fixed recursion.
+    """
+    from scipy.signal import lfilter
+
+    x = np.asarray(values, dtype=np.float64)
+    observed = x == x
+    if not np.isfinite(x[observed]).all():
+        return None
+
+    decay = [1.0, alpha - 1.0]
+    if ignore_na or observed.all():
+        # Without gaps in the weights, the observations are filtered on their
+        # own and carried forward over the missing values.
+        obs = x[observed]
+        if len(obs) == 0:
+            return np.full(len(x), np.nan)
+        if adjust:
+            avg = lfilter([1.0], decay, obs) / lfilter([1.0], decay, np.ones_like(obs))
         else:
-            output = np.nan
+            avg = np.empty_like(obs)
+            avg[0] = obs[0]
+            avg[1:], _ = lfilter([alpha], decay, obs[1:], zi=[(1 - alpha) * obs[0]])
+        output = avg[np.maximum(np.cumsum(observed) - 1, 0)]
+    elif adjust:
+        with np.errstate(invalid="ignore"):
+            output = lfilter([1.0], decay, np.where(observed, x, 0.0)) / lfilter([1.0], decay, observed.astype(np.float64))
+    else:
+        return None
+
+    output[np.cumsum(observed) < max(min_periods, 1)] = np.nan
+    return output
+
+
+def _apply(accumulator: "Callable[[], object]",
+           *args: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+           vectorized: "Callable[..., Optional[np.ndarray]]" = None):
+    """Runs an accumulator over arrays, series or the columns of a frame and
+    returns the values in the same kind of container as the first argument.
+
+    If given, `vectorized` computes the values of each column instead of the
+    accumulator, unless it returns None.
+    """
+    first = args[0]
+    if isinstance(first, pd.DataFrame):
+        return first.apply(lambda column: _apply(accumulator, column, *args[1:], vectorized=vectorized))
+
+    values = None if vectorized is None else vectorized(*args)
+    if values is None:
+        values = _run(accumulator, *args)
+    if isinstance(first, pd.Series):
+        return pd.Series(values, index=first.index, name=first.name)
+    return values
+
+
+class ExponentialWeightedMovingAverage(Stream[float]):
+    r"""A stream operator that computes an exponential weighted moving average
+    on a given float stream.
+
+    The batch kernel of the stream loops over the column with the same
+    accumulator as the step by step evaluation (see `_run`).
+
+    Parameters
+    ----------
+    alpha : float
+        The smoothing factor :math:`\alpha` directly,
+        :math:`0 < \alpha \leq 1`.
+    adjust : bool
+        Divide by decaying adjustment factor in beginning periods to account
+        for imbalance in relative weightings (viewing EWMA as a moving average).
+    ignore_na : bool
+        Ignore missing values when calculating weights.
+    min_periods : int
+        Minimum number of observations in window required to have a value
+        (otherwise result is NA).
+    """
+
+    _state_attrs = ("acc",)
+
+    def __init__(self,
+                 alpha: float,
+                 adjust: bool,
+                 ignore_na: bool,
+                 min_periods: int) -> None:
+        super().__init__()
+        self.alpha = alpha
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.min_periods = min_periods
+
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "EWMean":
+        return EWMean(self.alpha, self.adjust, self.ignore_na, self.min_periods)
+
+    def forward(self) -> float:
+        return self.acc.update(self.inputs[0].value)
 
-        return output
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        return _run(self.accumulator, values)
 
     def has_next(self) -> bool:
         return True
 
     def reset(self) -> None:
-        self.avg = None
-        self.new_wt = 1 if self.adjust else self.alpha
-        self.old_wt = 1
+        self.acc = self.accumulator()
+        super().reset()
 
-        self.mean_x = None
-        self.mean_y = None
 
-        self.cov = 0
-        self.sum_wt = 1
-        self.sum_wt2 = 1
-        self.old_wt = 1
+class ExponentialWeightedMovingCovariance(Stream[float]):
+    r"""A stream operator that computes an exponential weighted moving
+    covariance of two given float streams.
+
+    Parameters
+    ----------
+    alpha : float
+        The smoothing factor :math:`\alpha` directly,
+        :math:`0 < \alpha \leq 1`.
+    adjust : bool
+        Divide by decaying adjustment factor in beginning periods to account
+        for imbalance in relative weightings (viewing EWMA as a moving average).
+    ignore_na : bool
+        Ignore missing values when calculating weights.
+    min_periods : int
+        Minimum number of observations in window required to have a value
+        (otherwise result is NA).
+    bias : bool
+        Use a standard estimation bias correction
+    """
+
+    _state_attrs = ("acc",)
+
+    def __init__(self,
+                 alpha: float,
+                 adjust: bool,
+                 ignore_na: bool,
+                 min_periods: int,
+                 bias: bool) -> None:
+        super().__init__()
+        self.alpha = alpha
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.min_periods = min_periods
+        self.bias = bias
+
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "EWCovariance":
+        return EWCovariance(self.alpha, self.adjust, self.ignore_na, self.min_periods, self.bias)
+
+    def forward(self) -> float:
+        return self.acc.update(self.inputs[0].value, self.inputs[1].value)
+
+    def forward_batch(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        return _run(self.accumulator, x, y)
+
+    def has_next(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.acc = self.accumulator()
         super().reset()
 
 
+class ExponentialWeightedMovingCorrelation(ExponentialWeightedMovingAverage):
+    r"""A stream operator that computes an exponential weighted moving
+    correlation of two given float streams.
+
+    Parameters
+    ----------
+    alpha : float
+        The smoothing factor :math:`\alpha` directly,
+        :math:`0 < \alpha \leq 1`.
+    adjust : bool
+        Divide by decaying adjustment factor in beginning periods to account
+        for imbalance in relative weightings (viewing EWMA as a moving average).
+    ignore_na : bool
+        Ignore missing values when calculating weights.
+    min_periods : int
+        Minimum number of observations in window required to have a value
+        (otherwise result is NA).
+    """
+
+    def accumulator(self) -> "EWCorrelation":
+        return EWCorrelation(self.alpha, self.adjust, self.ignore_na, self.min_periods)
+
+    def forward(self) -> float:
+        return self.acc.update(self.inputs[0].value, self.inputs[1].value)
+
+    def forward_batch(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        return _run(self.accumulator, x, y)
+
+
 class EWM(Stream[List[float]]):
     r"""Provide exponential weighted (EW) functions.
 
@@ -297,6 +586,8 @@ class EWM(Stream[List[float]]):
     .. [1] https://github.com/pandas-dev/pandas/blob/d9fff2792bf16178d4e450fe7384244e50635733/pandas/core/window/ewm.py#L65
     """
 
+    _state_attrs = ("history", "weights")
+
     def __init__(
             self,
             com: float = None,
@@ -315,18 +606,7 @@ class EWM(Stream[List[float]]):
         self.adjust = adjust
         self.ignore_na = ignore_na
 
-        if alpha:
-            assert 0 < alpha <= 1
-            self.alpha = alpha
-        elif com:
-            assert com >= 0
-            self.alpha = 1 / (1 + com)
-        elif span:
-            assert span >= 1
-            self.alpha = 2 / (1 + span)
-        elif halflife:
-            assert halflife > 0
-            self.alpha = 1 - np.exp(np.log(0.5) / halflife)
+        self.alpha = get_alpha(com, span, halflife, alpha)
 
         self.history = []
         self.weights = []
@@ -398,6 +678,53 @@ class EWM(Stream[List[float]]):
         """
         return self.var(bias).sqrt()
 
+    def cov(self, other: "Stream[float]", bias: bool = False) -> "Stream[float]":
+        """Computes the exponential weighted moving covariance with another
+        stream.
+
+        Parameters
+        ----------
+        other : `Stream[float]`
+            The other float stream.
+        bias : bool, default False
+            Use a standard estimation bias correction.
+
+        Returns
+        -------
+        `Stream[float]`
+            The exponential weighted moving covariance stream of the
+            underlying stream and `other`.
+        """
+        return ExponentialWeightedMovingCovariance(
+            alpha=self.alpha,
+            adjust=self.adjust,
+            ignore_na=self.ignore_na,
+            min_periods=self.min_periods,
+            bias=bias
+        )(self.inputs[0], other).astype("float")
+
+    def corr(self, other: "Stream[float]") -> "Stream[float]":
+        """Computes the exponential weighted moving correlation with another
+        stream.
+
+        Parameters
+        ----------
+        other : `Stream[float]`
+            The other float stream.
+
+        Returns
+        -------
+        `Stream[float]`
+            The exponential weighted moving correlation stream of the
+            underlying stream and `other`.
+        """
+        return ExponentialWeightedMovingCorrelation(
+            alpha=self.alpha,
+            adjust=self.adjust,
+            ignore_na=self.ignore_na,
+            min_periods=self.min_periods
+        )(self.inputs[0], other).astype("float")
+
     def reset(self) -> None:
         self.history = []
         self.weights = []
@@ -457,3 +784,171 @@ def ewm(s: "Stream[float]",
         adjust=adjust,
         ignore_na=ignore_na
     )(s)
+
+
+def ewm_mean(values: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+             com: float = None,
+             span: float = None,
+             halflife: float = None,
+             alpha: float = None,
+             min_periods: int = 0,
+             adjust: bool = True,
+             ignore_na: bool = False,
+             exact: bool = True) -> "Union[np.ndarray, pd.Series, pd.DataFrame]":
+    r"""Computes the exponential weighted moving average of a whole array.
+
+    By default the values are the ones produced by `s.ewm(...).mean()`
+    stepped through the same array. The decay parameters are the ones of
+    `ewm`.
+
+    Parameters
+    ----------
+    values : `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The values. The columns of a frame are computed separately.
+    com : float, optional
+        Specify decay in terms of center of mass.
+    span : float, optional
+        Specify decay in terms of span.
+    halflife : float, optional
+        Specify decay in terms of half-life.
+    alpha : float, optional
+        Specify smoothing factor :math:`\alpha` directly.
+    min_periods : int, default 0
+        Minimum number of observations in window required to have a value.
+    adjust : bool, default True
+        Divide by decaying adjustment factor in beginning periods.
+    ignore_na : bool, default False
+        Ignore missing values when calculating weights.
+    exact : bool, default True
+        Step the recurrence of the stream through the array. Otherwise the
+        averages are computed with vectorized linear filters, which agree
+        with the stream within a relative tolerance of about `1e-12`. Arrays
+        with infinite values, or with missing values if neither `adjust`
+        nor `ignore_na` is set, are still stepped through.
+
+    Returns
+    -------
+    `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The averages, in the same kind of container as `values`.
+    """
+    alpha = get_alpha(com, span, halflife, alpha)
+    vectorized = None if exact else lambda v: _vectorized_mean(v, alpha, adjust, ignore_na, min_periods)
+    return _apply(lambda: EWMean(alpha, adjust, ignore_na, min_periods), values, vectorized=vectorized)
+
+
+def ewm_cov(x: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+            y: "Union[np.ndarray, pd.Series]",
+            com: float = None,
+            span: float = None,
+            halflife: float = None,
+            alpha: float = None,
+            min_periods: int = 0,
+            adjust: bool = True,
+            ignore_na: bool = False,
+            bias: bool = False) -> "Union[np.ndarray, pd.Series, pd.DataFrame]":
+    r"""Computes the exponential weighted moving covariance of two whole
+    arrays.
+
+    The values are the ones produced by `x.ewm(...).cov(y)` stepped through
+    the same arrays. The decay parameters are the ones of `ewm`.
+
+    Parameters
+    ----------
+    x : `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The first values. The columns of a frame are computed separately.
+    y : `Union[np.ndarray, pd.Series]`
+        The second values, of the same length as `x`.
+    com : float, optional
+        Specify decay in terms of center of mass.
+    span : float, optional
+        Specify decay in terms of span.
+    halflife : float, optional
+        Specify decay in terms of half-life.
+    alpha : float, optional
+        Specify smoothing factor :math:`\alpha` directly.
+    min_periods : int, default 0
+        Minimum number of observations in window required to have a value.
+    adjust : bool, default True
+        Divide by decaying adjustment factor in beginning periods.
+    ignore_na : bool, default False
+        Ignore missing values when calculating weights.
+    bias : bool, default False
+        Use a standard estimation bias correction.
+
+    Returns
+    -------
+    `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The covariances, in the same kind of container as `x`.
+    """
+    alpha = get_alpha(com, span, halflife, alpha)
+    return _apply(lambda: EWCovariance(alpha, adjust, ignore_na, min_periods, bias), x, y)
+
+
+def ewm_var(values: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+            com: float = None,
+            span: float = None,
+            halflife: float = None,
+            alpha: float = None,
+            min_periods: int = 0,
+            adjust: bool = True,
+            ignore_na: bool = False,
+            bias: bool = False) -> "Union[np.ndarray, pd.Series, pd.DataFrame]":
+    """Computes the exponential weighted moving variance of a whole array.
+
+    The parameters are the ones of `ewm_cov`.
+
+    Returns
+    -------
+    `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The variances, in the same kind of container as `values`.
+    """
+    if isinstance(values, pd.DataFrame):
+        return values.apply(lambda column: ewm_var(
+            column, com, span, halflife, alpha, min_periods, adjust, ignore_na, bias
+        ))
+    return ewm_cov(values, values, com, span, halflife, alpha, min_periods, adjust, ignore_na, bias)
+
+
+def ewm_std(values: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+            com: float = None,
+            span: float = None,
+            halflife: float = None,
+            alpha: float = None,
+            min_periods: int = 0,
+            adjust: bool = True,
+            ignore_na: bool = False,
+            bias: bool = False) -> "Union[np.ndarray, pd.Series, pd.DataFrame]":
+    """Computes the exponential weighted moving standard deviation of a whole
+    array.
+
+    The parameters are the ones of `ewm_cov`.
+
+    Returns
+    -------
+    `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The standard deviations, in the same kind of container as `values`.
+    """
+    return np.sqrt(ewm_var(values, com, span, halflife, alpha, min_periods, adjust, ignore_na, bias))
+
+
+def ewm_corr(x: "Union[np.ndarray, pd.Series, pd.DataFrame]",
+             y: "Union[np.ndarray, pd.Series]",
+             com: float = None,
+             span: float = None,
+             halflife: float = None,
+             alpha: float = None,
+             min_periods: int = 0,
+             adjust: bool = True,
+             ignore_na: bool = False) -> "Union[np.ndarray, pd.Series, pd.DataFrame]":
+    """Computes the exponential weighted moving correlation of two whole
+    arrays.
+
+    The parameters are the ones of `ewm_cov`.
+
+    Returns
+    -------
+    `Union[np.ndarray, pd.Series, pd.DataFrame]`
+        The correlations, in the same kind of container as `x`.
+    """
+    alpha = get_alpha(com, span, halflife, alpha)
+    return _apply(lambda: EWCorrelation(alpha, adjust, ignore_na, min_periods), x, y)
@@ -8,45 +8,202 @@ import numpy as np
 
 from tensortrade.feed.core.base import Stream
 from tensortrade.feed.api.float import Float
+from tensortrade.feed.api.float.window.running import Count, KahanSum, Welford, Extremum, DualHeap
 
 
 class ExpandingNode(Stream[float]):
     """A stream operator for aggregating an entire history of a stream.
 
+    The node keeps the history of the stream underlying its expanding stream,
+    leaving out missing values.
+
     Parameters
     ----------
     func : `Callable[[List[float]], float]`
         A function that aggregates the history of a stream.
     """
 
+    reads_state = True
+    _state_attrs = ("history",)
+
     def __init__(self, func: "Callable[[List[float]], float]") -> None:
         super().__init__()
         self.func = func
+        self.history = []
 
     def forward(self) -> float:
         expanding = self.inputs[0]
-        history = expanding.value
-        if len(history) < expanding.min_periods:
+        v = expanding.inputs[0].value
+        if not np.isnan(v):
+            self.history += [v]
+        if len(self.history) < expanding.min_periods:
             return np.nan
-        return self.func(history)
+        return self.func(self.history)
 
     def has_next(self):
         return True
 
+    def reset(self) -> None:
+        self.history = []
+        super().reset()
 
-class ExpandingCount(ExpandingNode):
-    """A stream operator that counts the number of non-missing values."""
+
+class IncrementalExpandingNode(ExpandingNode):
+    """A stream operator updating an aggregation of the history of a stream
+    with each new value, instead of aggregating the whole history on every
+    step. Missing values are left out of the aggregation.
+    """
+
+    reads_state = True
+    _state_attrs = ("acc",)
 
     def __init__(self) -> None:
-        super().__init__(lambda w: (~np.isnan(w)).sum())
+        super().__init__(self.aggregate)
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "object":
+        """Creates the accumulator of the aggregation.
+
+        Returns
+        -------
+        object
+            An accumulator with an `add` method and a `count` of values.
+        """
+        raise NotImplementedError()
+
+    def result(self, acc: "object") -> float:
+        """Computes the aggregation from the accumulator.
+
+        Parameters
+        ----------
+        acc : object
+            The accumulator of the values of the history.
+
+        Returns
+        -------
+        float
+            The aggregation of the history.
+        """
+        raise NotImplementedError()
+
+    def aggregate(self, history: "List[float]") -> float:
+        acc = self.accumulator()
+        for value in history:
+            acc.add(value)
+        return self.result(acc)
+
+    def _output(self, acc: "object", value: float, min_periods: int) -> float:
+        if value == value:
+            acc.add(value)
+        return np.nan if acc.count < min_periods else self.result(acc)
 
     def forward(self) -> float:
-        return self.func(self.inputs[0].value)
+        expanding = self.inputs[0]
+        return self._output(self.acc, expanding.inputs[0].value, expanding.min_periods)
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        min_periods = self.inputs[0].min_periods
+        acc = self.accumulator()
+        output = np.empty(len(values))
+        for i, value in enumerate(values.tolist()):
+            output[i] = self._output(acc, value, min_periods)
+        return output
+
+    def batch_inputs(self) -> "List[Stream]":
+        return [self.inputs[0].inputs[0]]
+
+    def reset(self) -> None:
+        self.acc = self.accumulator()
+        super().reset()
+
+
+class ExpandingCount(IncrementalExpandingNode):
+    """A stream operator that counts the number of non-missing values."""
+
+    def accumulator(self) -> "Count":
+        return Count()
+
+    def result(self, acc: "Count") -> float:
+        return acc.count
+
+    def _output(self, acc: "Count", value: float, min_periods: int) -> float:
+        return super()._output(acc, value, 0)
+
+
+class ExpandingSum(IncrementalExpandingNode):
+    """A stream operator computing the sum of the history of a stream."""
+
+    def accumulator(self) -> "KahanSum":
+        return KahanSum()
+
+    def result(self, acc: "KahanSum") -> float:
+        return acc.total
+
+
+class ExpandingMean(ExpandingSum):
+    """A stream operator computing the mean of the history of a stream."""
+
+    def result(self, acc: "KahanSum") -> float:
+        return acc.total / acc.count if acc.count > 0 else np.nan
+
+
+class ExpandingVar(IncrementalExpandingNode):
+    """A stream operator computing the sample variance of the history of a
+    stream."""
+
+    def accumulator(self) -> "Welford":
+        return Welford()
+
+    def result(self, acc: "Welford") -> float:
+        return acc.m2 / (acc.count - 1) if acc.count > 1 else np.nan
+
+
+class ExpandingStd(ExpandingVar):
+    """A stream operator computing the sample standard deviation of the
+    history of a stream."""
+
+    def result(self, acc: "Welford") -> float:
+        return np.sqrt(super().result(acc))
+
+
+class ExpandingMin(IncrementalExpandingNode):
+    """A stream operator computing the minimum of the history of a stream."""
+
+    def accumulator(self) -> "Extremum":
+        return Extremum()
+
+    def result(self, acc: "Extremum") -> float:
+        return acc.extremum
+
+
+class ExpandingMax(ExpandingMin):
+    """A stream operator computing the maximum of the history of a stream."""
+
+    def accumulator(self) -> "Extremum":
+        return Extremum(-1)
+
+
+class ExpandingMedian(IncrementalExpandingNode):
+    """A stream operator computing the median of the history of a stream.
+
+    Unlike the other expanding aggregations, the median has to keep every
+    value. Each new value is added in O(log n).
+    """
+
+    def accumulator(self) -> "DualHeap":
+        return DualHeap(0.5)
+
+    def result(self, acc: "DualHeap") -> float:
+        return acc.quantile
 
 
 class Expanding(Stream[List[float]]):
     """A stream that generates the entire history of a stream at each time step.
 
+    The stream itself keeps no state. An aggregation created with `agg` keeps
+    its own history of the stream, while the other aggregations keep running
+    statistics of the stream instead.
+
     Parameters
     ----------
     min_periods : int, default 1
@@ -59,13 +216,9 @@ class Expanding(Stream[List[float]]):
     def __init__(self, min_periods: int = 1) -> None:
         super().__init__()
         self.min_periods = min_periods
-        self.history = []
 
-    def forward(self) -> "List[float]":
-        v = self.inputs[0].value
-        if not np.isnan(v):
-            self.history += [v]
-        return self.history
+    def forward(self) -> None:
+        return None
 
     def has_next(self) -> bool:
         return True
@@ -104,7 +257,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding sum stream.
         """
-        return self.agg(np.sum).astype("float")
+        return ExpandingSum()(self).astype("float")
 
     def mean(self) -> "Stream[float]":
         """Computes an expanding mean fo the underlying stream.
@@ -114,7 +267,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding mean stream.
         """
-        return self.agg(np.mean).astype("float")
+        return ExpandingMean()(self).astype("float")
 
     def var(self) -> "Stream[float]":
         """Computes an expanding variance fo the underlying stream.
@@ -124,7 +277,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding variance stream.
         """
-        return self.agg(lambda x: np.var(x, ddof=1)).astype("float")
+        return ExpandingVar()(self).astype("float")
 
     def median(self) -> "Stream[float]":
         """Computes an expanding median fo the underlying stream.
@@ -134,7 +287,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding median stream.
         """
-        return self.agg(np.median).astype("float")
+        return ExpandingMedian()(self).astype("float")
 
     def std(self) -> "Stream[float]":
         """Computes an expanding standard deviation fo the underlying stream.
@@ -144,7 +297,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding standard deviation stream.
         """
-        return self.agg(lambda x: np.std(x, ddof=1)).astype("float")
+        return ExpandingStd()(self).astype("float")
 
     def min(self) -> "Stream[float]":
         """Computes an expanding minimum fo the underlying stream.
@@ -154,7 +307,7 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding minimum stream.
         """
-        return self.agg(np.min).astype("float")
+        return ExpandingMin()(self).astype("float")
 
     def max(self) -> "Stream[float]":
         """Computes an expanding maximum fo the underlying stream.
@@ -164,11 +317,8 @@ class Expanding(Stream[List[float]]):
         `Stream[float]`
             An expanding maximum stream.
         """
-        return self.agg(np.max).astype("float")
+        return ExpandingMax()(self).astype("float")
 
-    def reset(self) -> None:
-        self.history = []
-        super().reset()
 
 
 @Float.register(["expanding"])
@@ -2,12 +2,69 @@
 rolling.py contains functions and classes for rolling stream operations.
 """
 
-from typing import List, Callable
+import functools
+import math
+import warnings
+from typing import Dict, List, Callable, Optional, Sequence, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from tensortrade.feed.core.base import Stream
+from tensortrade.feed.core.operators import History
+from tensortrade.feed.core.batch import as_column
 from tensortrade.feed.api.float import Float
+from tensortrade.feed.api.float.window.running import (
+    KahanSum, Welford, Comoments, MonotonicQueue, DualHeap, RunningStats
+)
+
+
+_AXIS_FUNCS = (
+    np.sum, np.nansum,
+    np.mean, np.nanmean,
+    np.var, np.nanvar,
+    np.median, np.nanmedian,
+    np.min, np.nanmin,
+    np.max, np.nanmax
+)
+
+
+def _supports_axis(func: "Callable") -> bool:
+    if isinstance(func, functools.partial):
+        return func.func in _AXIS_FUNCS and "axis" not in func.keywords
+    return func in _AXIS_FUNCS
+
+
+def _apply_windows(func: "Callable[[List[float]], float]",
+                   values: "np.ndarray",
+                   window: int,
+                   chunk_size: int = 4096) -> "np.ndarray":
+    """Aggregates every rolling window of a column.
+
+    Each window is handed to `func` newest value first, the same way as in the
+    step by step evaluation. Functions that support reductions along an axis
+    are applied to contiguous blocks of windows at once.
+    """
+    n = len(values)
+    output = [None] * n
+
+    for i in range(min(window - 1, n)):
+        output[i] = func(values[i::-1].tolist())
+
+    if n >= window:
+        windows = sliding_window_view(values, window)[:, ::-1]
+        if _supports_axis(func):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                for start in range(0, len(windows), chunk_size):
+                    block = np.ascontiguousarray(windows[start:start + chunk_size])
+                    j = start + window - 1
+                    output[j:j + len(block)] = list(func(block, axis=1))
+        else:
+            for j, w in enumerate(windows, window - 1):
+                output[j] = func(w.tolist())
+
+    return as_column(output)
 
 
 class RollingNode(Stream[float]):
@@ -19,6 +76,8 @@ class RollingNode(Stream[float]):
         A function that aggregates a rolling window.
     """
 
+    _state_attrs = ("n",)
+
     def __init__(self, func: "Callable[[List[float]], float]"):
         super().__init__(dtype="float")
         self.func = func
@@ -26,12 +85,23 @@ class RollingNode(Stream[float]):
 
     def forward(self) -> float:
         rolling = self.inputs[0]
-        history = rolling.value
+        if rolling.n - rolling.nan < rolling.min_periods:
+            return np.nan
 
-        output = np.nan if rolling.n - rolling.nan < rolling.min_periods else self.func(history)
+        history = rolling.value
+        return self.func(history if _supports_axis(self.func) else history.tolist())
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        rolling = self.inputs[0]
+        output = _apply_windows(self.func, values, rolling.window)
+        if output.dtype.kind in "biu":
+            output = output.astype(np.float64)
+        output[np.cumsum(values == values) < rolling.min_periods] = np.nan
         return output
 
+    def batch_inputs(self) -> "List[Stream]":
+        return self.inputs[0].batch_inputs()
+
     def has_next(self) -> bool:
         return True
 
@@ -52,10 +122,355 @@ class RollingCount(RollingNode):
         history = rolling.value
         return self.func(history)
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        window = self.inputs[0].window
+        counts = np.cumsum(values == values)
+        counts[window:] = counts[window:] - counts[:-window]
+        return counts
+
+
+class IncrementalRollingNode(RollingNode):
+    """A stream operator updating an aggregation of a rolling window with
+    the value entering and the value leaving the window, instead of
+    aggregating the whole window on every step.
+
+    Missing values are left out of the aggregation. Unless `skipna` is set,
+    the aggregation is missing while the window holds a missing value, the
+    same way as e.g. `np.sum` compared to `np.nansum`.
+
+    Parameters
+    ----------
+    skipna : bool, default True
+        Whether missing values in the window are skipped.
+    """
+
+    reads_state = True
+    _state_attrs = ("n", "acc")
+
+    def __init__(self, skipna: bool = True) -> None:
+        super().__init__(self.aggregate)
+        self.skipna = skipna
+        self.acc = self.accumulator()
+
+    def accumulator(self) -> "object":
+        """Creates the accumulator of the aggregation.
+
+        Returns
+        -------
+        object
+            An accumulator with `add` and `remove` methods and a `count` of
+            values.
+        """
+        raise NotImplementedError()
+
+    def result(self, acc: "object") -> float:
+        """Computes the aggregation from the accumulator.
+
+        Parameters
+        ----------
+        acc : object
+            The accumulator of the values in the window.
+
+        Returns
+        -------
+        float
+            The aggregation of the window.
+        """
+        raise NotImplementedError()
+
+    def aggregate(self, window: "List[float]") -> float:
+        acc = self.accumulator()
+        for value in window:
+            if value == value:
+                acc.add(value)
+        return self._output(acc, len(window))
+
+    def _output(self, acc: "object", size: int) -> float:
+        if not self.skipna and acc.count < size:
+            return np.nan
+        return self.result(acc)
+
+    def _update(self, acc: "object", value: float, removed: "Optional[float]") -> None:
+        if removed is not None and removed == removed:
+            acc.remove(removed)
+        if value == value:
+            acc.add(value)
+
+    def forward(self) -> float:
+        rolling = self.inputs[0]
+        self._update(self.acc, rolling.inputs[0].value, rolling.removed)
+        if rolling.n - rolling.nan < rolling.min_periods:
+            return np.nan
+        return self._output(self.acc, min(rolling.n, rolling.window))
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        rolling = self.inputs[0]
+        window = rolling.window
+        acc = self.accumulator()
+        output = np.empty(len(values))
+        column = values.tolist()
+        for i, value in enumerate(column):
+            self._update(acc, value, column[i - window] if i >= window else None)
+            output[i] = self._output(acc, min(i + 1, window))
+        output[np.cumsum(values == values) < rolling.min_periods] = np.nan
+        return output
+
+    def reset(self) -> None:
+        self.acc = self.accumulator()
+        super().reset()
+
+
+class RollingSum(IncrementalRollingNode):
+    """A stream operator computing the sum of a rolling window."""
+
+    accumulator = staticmethod(KahanSum)
+
+    def result(self, acc: "KahanSum") -> float:
+        return acc.total
+
+
+class RollingMean(IncrementalRollingNode):
+    """A stream operator computing the mean of a rolling window."""
+
+    accumulator = staticmethod(KahanSum)
+
+    def result(self, acc: "KahanSum") -> float:
+        return acc.total / acc.count if acc.count > 0 else np.nan
+
+
+class RollingVar(IncrementalRollingNode):
+    """A stream operator computing the sample variance of a rolling window."""
+
+    accumulator = staticmethod(Welford)
+
+    def result(self, acc: "Welford") -> float:
+        return acc.m2 / (acc.count - 1) if acc.count > 1 else np.nan
+
+
+class RollingMin(IncrementalRollingNode):
+    """A stream operator computing the minimum of a rolling window."""
+
+    accumulator = staticmethod(MonotonicQueue)
+
+    def result(self, acc: "MonotonicQueue") -> float:
+        return acc.extremum
+
+
+class RollingMax(IncrementalRollingNode):
+    """A stream operator computing the maximum of a rolling window."""
+
+    accumulator = staticmethod(functools.partial(MonotonicQueue, -1))
+
+    def result(self, acc: "MonotonicQueue") -> float:
+        return acc.extremum
+
+
+class RollingQuantile(IncrementalRollingNode):
+    """A stream operator computing a quantile of a rolling window.
+
+    Parameters
+    ----------
+    q : float
+        The quantile to compute, between 0 and 1.
+    skipna : bool, default True
+        Whether missing values in the window are skipped.
+    """
+
+    def __init__(self, q: float, skipna: bool = True) -> None:
+        self.q = q
+        super().__init__(skipna)
+
+    def accumulator(self) -> "DualHeap":
+        return DualHeap(self.q)
+
+    def result(self, acc: "DualHeap") -> float:
+        return acc.quantile
+
+
+class RollingPairNode(IncrementalRollingNode):
+    """A stream operator updating a statistic of the pairs of values of two
+    rolling windows of the same size, e.g. over the prices of two assets.
+
+    A pair is missing if either of its values is missing. Missing pairs and
+    `min_periods` are handled the same way as missing values by the
+    aggregations of a single window.
+
+    Parameters
+    ----------
+    skipna : bool, default True
+        Whether missing pairs in the window are skipped.
+    """
+
+    _state_attrs = ("n", "acc", "observed")
+
+    def __init__(self, skipna: bool = True) -> None:
+        super().__init__(skipna)
+        self.observed = 0
+
+    def accumulator(self) -> "Comoments":
+        return Comoments()
+
+    def aggregate(self, x: "List[float]", y: "List[float]") -> float:
+        acc = self.accumulator()
+        for u, v in zip(x, y):
+            if u == u and v == v:
+                acc.add(u, v)
+        return self._output(acc, len(x))
+
+    def _update(self,
+                acc: "Comoments",
+                value: "Tuple[float, float]",
+                removed: "Optional[Tuple[float, float]]") -> None:
+        if removed is not None and removed[0] == removed[0] and removed[1] == removed[1]:
+            acc.remove(*removed)
+        if value[0] == value[0] and value[1] == value[1]:
+            acc.add(*value)
+
+    def forward(self) -> float:
+        rx, ry = self.inputs
+        x = rx.inputs[0].value
+        y = ry.inputs[0].value
+        self._update(self.acc, (x, y), (rx.removed, ry.removed) if rx.removed is not None else None)
+        self.observed += int(x == x and y == y)
+        if self.observed < rx.min_periods:
+            return np.nan
+        return self._output(self.acc, min(rx.n, rx.window))
+
+    def forward_batch(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        rolling = self.inputs[0]
+        window = rolling.window
+        acc = self.accumulator()
+        output = np.empty(len(x))
+        pairs = list(zip(x.tolist(), y.tolist()))
+        for i, value in enumerate(pairs):
+            self._update(acc, value, pairs[i - window] if i >= window else None)
+            output[i] = self._output(acc, min(i + 1, window))
+        output[np.cumsum((x == x) & (y == y)) < rolling.min_periods] = np.nan
+        return output
+
+    def batch_inputs(self) -> "List[Stream]":
+        return self.inputs[0].batch_inputs() + self.inputs[1].batch_inputs()
+
+    def reset(self) -> None:
+        self.observed = 0
+        super().reset()
+
+
+class RollingCov(RollingPairNode):
+    """A stream operator computing the sample covariance of two rolling
+    windows."""
+
+    def result(self, acc: "Comoments") -> float:
+        return acc.c_xy / (acc.count - 1) if acc.count > 1 else np.nan
+
+
+class RollingCorr(RollingPairNode):
+    """A stream operator computing the correlation of two rolling windows."""
+
+    def result(self, acc: "Comoments") -> float:
+        den = acc.m2_x * acc.m2_y
+        return acc.c_xy / math.sqrt(den) if acc.count > 1 and den > 0 else np.nan
+
+
+class RollingBeta(RollingPairNode):
+    """A stream operator computing the beta of a rolling window against
+    another, i.e. their covariance divided by the variance of the other."""
+
+    def result(self, acc: "Comoments") -> float:
+        return acc.c_xy / acc.m2_y if acc.count > 1 and acc.m2_y > 0 else np.nan
+
+
+class RollingAggregate(IncrementalRollingNode):
+    """A stream operator computing several statistics of a rolling window in
+    one pass.
+
+    The value is a tuple of the statistics in the order of
+    `RunningStats.STATS`, where the statistics that are not requested are
+    missing. Each statistic is read by a `RollingStatistic`.
+
+    Parameters
+    ----------
+    stats : `Sequence[str]`
+        The statistics to compute.
+    skipna : bool, default True
+        Whether missing values in the window are skipped.
+    """
+
+    def __init__(self, stats: "Sequence[str]", skipna: bool = True) -> None:
+        self.stats = tuple(stats)
+        super().__init__(skipna)
+        self.missing = (np.nan,) * len(RunningStats.STATS)
+
+    def accumulator(self) -> "RunningStats":
+        return RunningStats(self.stats)
+
+    def aggregate(self, window: "List[float]") -> "Tuple[float, ...]":
+        acc = self.accumulator()
+        for value in window:
+            if value == value:
+                acc.add(value)
+        return self._output(acc, len(window), window[0])
+
+    def _output(self, acc: "RunningStats", size: int, value: float = np.nan) -> "Tuple[float, ...]":
+        if not self.skipna and acc.count < size:
+            return self.missing
+        return acc.values(value)
+
+    def forward(self) -> "Tuple[float, ...]":
+        rolling = self.inputs[0]
+        value = rolling.inputs[0].value
+        self._update(self.acc, value, rolling.removed)
+        if rolling.n - rolling.nan < rolling.min_periods:
+            return self.missing
+        return self._output(self.acc, min(rolling.n, rolling.window), value)
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        rolling = self.inputs[0]
+        window = rolling.window
+        acc = self.accumulator()
+        output = np.empty((len(values), len(self.missing)))
+        column = values.tolist()
+        for i, value in enumerate(column):
+            self._update(acc, value, column[i - window] if i >= window else None)
+            output[i] = self._output(acc, min(i + 1, window), value)
+        output[np.cumsum(values == values) < rolling.min_periods] = np.nan
+        return output
+
+
+class RollingStatistic(Stream[float]):
+    """A stream operator reading one statistic of a `RollingAggregate`.
+
+    Parameters
+    ----------
+    stat : str
+        The statistic to read, one of `RunningStats.STATS`.
+    """
+
+    pure = True
+
+    def __init__(self, stat: str) -> None:
+        super().__init__()
+        self.stat = stat
+        self.index = RunningStats.STATS.index(stat)
+
+    def forward(self) -> float:
+        return self.inputs[0].value[self.index]
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        return values[:, self.index]
+
+    def has_next(self) -> bool:
+        return True
+
 
 class Rolling(Stream[List[float]]):
     """A stream that generates a rolling window of values from a stream.
 
+    The window is a view of the `History` of the stream, which is shared with
+    the other rolling windows and lags over it and holds every value twice, so
+    the window is always contiguous. The window is generated newest value
+    first and is overwritten by the next step.
+
     Parameters
     ----------
     window : int
@@ -63,9 +478,16 @@ class Rolling(Stream[List[float]]):
     min_periods : int, default 1
         The number of periods to wait before producing values from the aggregation
         function.
+
+    Attributes
+    ----------
+    removed : float, optional
+        The value that has left the window on the last step.
     """
 
     generic_name = "rolling"
+    reads_state = True
+    _state_attrs = ("n", "nan", "removed")
 
     def __init__(self,
                  window: int,
@@ -77,20 +499,28 @@ class Rolling(Stream[List[float]]):
 
         self.n = 0
         self.nan = 0
+        self.removed = None
 
-        self.history = []
+    def __call__(self, *inputs) -> "Stream[List[float]]":
+        history = inputs[0]
+        if not isinstance(history, History):
+            history = History.of(history)
+        history.require(self.window + 1)
+        return super().__call__(history)
 
-    def forward(self) -> "List[float]":
-        node = self.inputs[0]
+    def forward(self) -> "np.ndarray":
+        history = self.inputs[0]
+        value = history.value
+        window = self.window
 
+        self.removed = history.get(window) if self.n >= window else None
         self.n += 1
-        self.nan += int(node.value != node.value)
+        self.nan += int(value != value)
 
-        self.history.insert(0, node.value)
+        return history.latest(min(self.n, window))
 
-        if len(self.history) > self.window:
-            self.history.pop()
-        return self.history
+    def batch_inputs(self) -> "List[Stream]":
+        return list(self.inputs[0].inputs)
 
     def has_next(self) -> bool:
         return True
@@ -128,8 +558,7 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling sum stream.
         """
-        func = np.nansum if self.min_periods < self.window else np.sum
-        return self.agg(func).astype("float")
+        return RollingSum(self.min_periods < self.window)(self).astype("float")
 
     def mean(self) -> "Stream[float]":
         """Computes a rolling mean from the underlying stream.
@@ -139,8 +568,7 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling mean stream.
         """
-        func = np.nanmean if self.min_periods < self.window else np.mean
-        return self.agg(func).astype("float")
+        return RollingMean(self.min_periods < self.window)(self).astype("float")
 
     def var(self) -> "Stream[float]":
         """Computes a rolling variance from the underlying stream.
@@ -150,10 +578,7 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling variance stream.
         """
-        def func1(x): return np.nanvar(x, ddof=1)
-        def func2(x): return np.var(x, ddof=1)
-        func = func1 if self.min_periods < self.window else func2
-        return self.agg(func).astype("float")
+        return RollingVar(self.min_periods < self.window)(self).astype("float")
 
     def median(self) -> "Stream[float]":
         """Computes a rolling median from the underlying stream.
@@ -163,8 +588,27 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling median stream.
         """
-        func = np.nanmedian if self.min_periods < self.window else np.median
-        return self.agg(func).astype("float")
+        return self.quantile(0.5)
+
+    def quantile(self, q: float) -> "Stream[float]":
+        """Computes a rolling quantile from the underlying stream.
+
+        The quantile is interpolated linearly between the closest ranks, the
+        same way as `np.quantile`.
+
+        Parameters
+        ----------
+        q : float
+            The quantile to compute, between 0 and 1.
+
+        Returns
+        -------
+        `Stream[float]`
+            A rolling quantile stream.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1, not {}.".format(q))
+        return RollingQuantile(q, self.min_periods < self.window)(self).astype("float")
 
     def std(self) -> "Stream[float]":
         """Computes a rolling standard deviation from the underlying stream.
@@ -184,8 +628,7 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling minimum stream.
         """
-        func = np.nanmin if self.min_periods < self.window else np.min
-        return self.agg(func).astype("float")
+        return RollingMin(self.min_periods < self.window)(self).astype("float")
 
     def max(self) -> "Stream[float]":
         """Computes a rolling maximum from the underlying stream.
@@ -195,13 +638,98 @@ class Rolling(Stream[List[float]]):
         `Stream[float]`
             A rolling maximum stream.
         """
-        func = np.nanmax if self.min_periods < self.window else np.max
-        return self.agg(func).astype("float")
+        return RollingMax(self.min_periods < self.window)(self).astype("float")
+
+    def cov(self, other: "Stream[float]") -> "Stream[float]":
+        """Computes a rolling sample covariance with another stream.
+
+        Parameters
+        ----------
+        other : `Stream[float]`
+            The other float stream.
+
+        Returns
+        -------
+        `Stream[float]`
+            A rolling covariance stream of the underlying stream and `other`.
+        """
+        return RollingCov(self.min_periods < self.window)(self, self._pair(other)).astype("float")
+
+    def corr(self, other: "Stream[float]") -> "Stream[float]":
+        """Computes a rolling correlation with another stream.
+
+        Parameters
+        ----------
+        other : `Stream[float]`
+            The other float stream.
+
+        Returns
+        -------
+        `Stream[float]`
+            A rolling correlation stream of the underlying stream and `other`.
+        """
+        return RollingCorr(self.min_periods < self.window)(self, self._pair(other)).astype("float")
+
+    def beta(self, other: "Stream[float]") -> "Stream[float]":
+        """Computes a rolling beta against another stream, i.e. the rolling
+        covariance with `other` divided by the rolling variance of `other`.
+
+        Parameters
+        ----------
+        other : `Stream[float]`
+            The float stream to compute the beta against, e.g. the returns of
+            a market index.
+
+        Returns
+        -------
+        `Stream[float]`
+            A rolling beta stream of the underlying stream against `other`.
+        """
+        return RollingBeta(self.min_periods < self.window)(self, self._pair(other)).astype("float")
+
+    def _pair(self, other: "Stream[float]") -> "Rolling":
+        """Creates a rolling window over another stream with the same size and
+        `min_periods` as this one."""
+        return Rolling(self.window, self.min_periods)(other)
+
+    def aggregate(self,
+                  stats: "Sequence[str]" = ("mean", "std", "min", "max", "zscore")) -> "Dict[str, Stream[float]]":
+        """Computes several statistics of a rolling window in one pass.
+
+        The statistics are the same as the ones of the corresponding methods,
+        e.g. `aggregate(["mean", "std"])["std"]` produces the values of
+        `std()`, but are updated together on every step. The z-score of the
+        newest value is `(value - mean) / std`, which is missing while the
+        standard deviation is zero.
+
+        Parameters
+        ----------
+        stats : `Sequence[str]`, default ("mean", "std", "min", "max", "zscore")
+            The statistics to compute, any of "sum", "mean", "var", "std",
+            "min", "max", "median" and "zscore".
+
+        Returns
+        -------
+        `Dict[str, Stream[float]]`
+            A stream for each statistic, keyed by its name.
+
+        Raises
+        ------
+        ValueError
+            Raised if a statistic is unknown.
+        """
+        unknown = [stat for stat in stats if stat not in RunningStats.STATS]
+        if len(unknown) > 0:
+            raise ValueError("Unknown rolling statistics: {}.".format(", ".join(unknown)))
+
+        node = RollingAggregate(tuple(stats), self.min_periods < self.window)(self)
+        return {stat: RollingStatistic(stat)(node).astype("float") for stat in stats}
 
     def reset(self) -> None:
+        self.inputs[0].require(self.window + 1)
         self.n = 0
         self.nan = 0
-        self.history = []
+        self.removed = None
         super().reset()
 
 
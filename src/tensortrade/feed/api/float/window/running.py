@@ -0,0 +1,530 @@
+"""
+running.py contains the accumulators keeping running statistics of a stream
+of floats, shared by the rolling and expanding operators.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class Count:
+    """The number of floats added one after another.
+
+    Attributes
+    ----------
+    count : int
+        The number of values added.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+
+
+class KahanSum:
+    """A sum of floats with compensation for the lost low-order bits, to which
+    values can be added and from which they can be removed.
+
+    Infinite values are counted apart from the sum of the finite values, so
+    removing them restores the sum instead of leaving it NaN.
+
+    Attributes
+    ----------
+    count : int
+        The number of values in the sum.
+    total : float
+        The sum of the values.
+    """
+
+    __slots__ = ("count", "finite", "compensation", "posinf", "neginf")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.finite = 0.0
+        self.compensation = 0.0
+        self.posinf = 0
+        self.neginf = 0
+
+    @property
+    def total(self) -> float:
+        """The sum of the values. (float, read-only)"""
+        if self.posinf or self.neginf:
+            return _infinity(self.posinf, self.neginf)
+        return self.finite
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if not math.isfinite(value):
+            if value > 0:
+                self.posinf += 1
+            else:
+                self.neginf += 1
+            return
+        y = value - self.compensation
+        t = self.finite + y
+        self.compensation = (t - self.finite) - y
+        self.finite = t
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if not math.isfinite(value):
+            if value > 0:
+                self.posinf -= 1
+            else:
+                self.neginf -= 1
+            return
+        if self.count == self.posinf + self.neginf:
+            self.finite = 0.0
+            self.compensation = 0.0
+            return
+        y = -value - self.compensation
+        t = self.finite + y
+        self.compensation = (t - self.finite) - y
+        self.finite = t
+
+
+class Welford:
+    """The mean and the sum of squared deviations of floats, to which values
+    can be added and from which they can be removed.
+
+    Infinite values are counted apart from the moments of the finite values,
+    so removing them restores the moments instead of leaving them NaN.
+
+    Attributes
+    ----------
+    count : int
+        The number of values.
+    mean : float
+        The mean of the values.
+    m2 : float
+        The sum of the squared deviations from the mean, NaN while there are
+        infinite values.
+    """
+
+    __slots__ = ("count", "finite_mean", "finite_m2", "posinf", "neginf")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.finite_mean = 0.0
+        self.finite_m2 = 0.0
+        self.posinf = 0
+        self.neginf = 0
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values. (float, read-only)"""
+        if self.posinf or self.neginf:
+            return _infinity(self.posinf, self.neginf)
+        return self.finite_mean
+
+    @property
+    def m2(self) -> float:
+        """The sum of the squared deviations from the mean. (float, read-only)"""
+        return np.nan if self.posinf or self.neginf else self.finite_m2
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if not math.isfinite(value):
+            if value > 0:
+                self.posinf += 1
+            else:
+                self.neginf += 1
+            return
+        n = self.count - self.posinf - self.neginf
+        delta = value - self.finite_mean
+        self.finite_mean += delta / n
+        self.finite_m2 += delta * (value - self.finite_mean)
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if not math.isfinite(value):
+            if value > 0:
+                self.posinf -= 1
+            else:
+                self.neginf -= 1
+            return
+        n = self.count - self.posinf - self.neginf
+        if n == 0:
+            self.finite_mean = 0.0
+            self.finite_m2 = 0.0
+            return
+        delta = value - self.finite_mean
+        self.finite_mean -= delta / n
+        self.finite_m2 = max(self.finite_m2 - delta * (value - self.finite_mean), 0.0)
+
+
+class Comoments:
+    """The means and the sums of squared deviations and of co-deviations of
+    pairs of floats, to which pairs can be added and from which they can be
+    removed.
+
+    Pairs with an infinite value are counted apart from the moments of the
+    finite pairs, so removing them restores the moments instead of leaving
+    them NaN.
+
+    Attributes
+    ----------
+    count : int
+        The number of pairs.
+    mean_x : float
+        The mean of the first values of the finite pairs.
+    mean_y : float
+        The mean of the second values of the finite pairs.
+    m2_x : float
+        The sum of the squared deviations of the first values from their mean,
+        NaN while there are infinite values.
+    m2_y : float
+        The sum of the squared deviations of the second values from their
+        mean, NaN while there are infinite values.
+    c_xy : float
+        The sum of the products of the deviations of the values of each pair,
+        NaN while there are infinite values.
+    """
+
+    __slots__ = ("count", "infinite", "mean_x", "mean_y", "finite_m2_x", "finite_m2_y", "finite_c_xy")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.infinite = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.finite_m2_x = 0.0
+        self.finite_m2_y = 0.0
+        self.finite_c_xy = 0.0
+
+    @property
+    def m2_x(self) -> float:
+        """The sum of the squared deviations of the first values. (float, read-only)"""
+        return np.nan if self.infinite else self.finite_m2_x
+
+    @property
+    def m2_y(self) -> float:
+        """The sum of the squared deviations of the second values. (float, read-only)"""
+        return np.nan if self.infinite else self.finite_m2_y
+
+    @property
+    def c_xy(self) -> float:
+        """The sum of the products of the deviations. (float, read-only)"""
+        return np.nan if self.infinite else self.finite_c_xy
+
+    def add(self, x: float, y: float) -> None:
+        self.count += 1
+        if not (math.isfinite(x) and math.isfinite(y)):
+            self.infinite += 1
+            return
+        n = self.count - self.infinite
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / n
+        self.mean_y += dy / n
+        self.finite_m2_x += dx * (x - self.mean_x)
+        self.finite_m2_y += dy * (y - self.mean_y)
+        self.finite_c_xy += dx * (y - self.mean_y)
+
+    def remove(self, x: float, y: float) -> None:
+        self.count -= 1
+        if not (math.isfinite(x) and math.isfinite(y)):
+            self.infinite -= 1
+            return
+        n = self.count - self.infinite
+        if n == 0:
+            self.mean_x = self.mean_y = 0.0
+            self.finite_m2_x = self.finite_m2_y = self.finite_c_xy = 0.0
+            return
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x -= dx / n
+        self.mean_y -= dy / n
+        if n == 1:
+            self.finite_m2_x = self.finite_m2_y = self.finite_c_xy = 0.0
+            return
+        self.finite_m2_x = max(self.finite_m2_x - dx * (x - self.mean_x), 0.0)
+        self.finite_m2_y = max(self.finite_m2_y - dy * (y - self.mean_y), 0.0)
+        self.finite_c_xy -= dx * (y - self.mean_y)
+
+
+def _infinity(posinf: int, neginf: int) -> float:
+    """Gets the sum of infinite values given how many of each sign there are."""
+    if posinf and neginf:
+        return np.nan
+    return np.inf if posinf else -np.inf
+
+
+class Extremum:
+    """The minimum of floats added one after another.
+
+    Parameters
+    ----------
+    sign : int, default 1
+        The sign the values are multiplied with, -1 to keep the maximum.
+
+    Attributes
+    ----------
+    count : int
+        The number of values added.
+    """
+
+    __slots__ = ("count", "value", "sign")
+
+    def __init__(self, sign: int = 1) -> None:
+        self.count = 0
+        self.value = np.inf
+        self.sign = sign
+
+    @property
+    def extremum(self) -> float:
+        """The minimum of the values, or the maximum if `sign` is -1. (float, read-only)"""
+        return self.sign * self.value if self.count > 0 else np.nan
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        value = self.sign * value
+        if value < self.value:
+            self.value = value
+
+
+class MonotonicQueue:
+    """The minimum of a sliding window of floats, kept in a deque of the
+    values that can still become the minimum, in increasing order. Values
+    must be removed in the order they have been added.
+
+    Parameters
+    ----------
+    sign : int, default 1
+        The sign the values are multiplied with, -1 to keep the maximum.
+
+    Attributes
+    ----------
+    count : int
+        The number of values in the window.
+    """
+
+    __slots__ = ("count", "queue", "sign")
+
+    def __init__(self, sign: int = 1) -> None:
+        self.count = 0
+        self.queue = deque()
+        self.sign = sign
+
+    @property
+    def extremum(self) -> float:
+        """The minimum of the window, or the maximum if `sign` is -1. (float, read-only)"""
+        return self.sign * self.queue[0] if self.queue else np.nan
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        value = self.sign * value
+        queue = self.queue
+        while queue and queue[-1] > value:
+            queue.pop()
+        queue.append(value)
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if self.queue[0] == self.sign * value:
+            self.queue.popleft()
+
+
+class DualHeap:
+    """A quantile of a sliding window of floats, kept in a max-heap of the
+    lower values and a min-heap of the upper values.
+
+    Removed values stay in their heap until they reach its top, which keeps
+    adding and removing a value in O(log w). A heap is rebuilt without its
+    removed values once they make up most of it. Values must be removed in
+    the order they have been added.
+
+    Parameters
+    ----------
+    q : float
+        The quantile to keep, between 0 and 1.
+
+    Attributes
+    ----------
+    count : int
+        The number of values in the window.
+    """
+
+    __slots__ = ("q", "count", "low", "high", "low_size", "high_size", "low_removed", "high_removed")
+
+    def __init__(self, q: float) -> None:
+        self.q = q
+        self.count = 0
+        self.low = []
+        self.high = []
+        self.low_size = 0
+        self.high_size = 0
+        self.low_removed = {}
+        self.high_removed = {}
+
+    @property
+    def quantile(self) -> float:
+        """The quantile of the window, interpolated linearly between the
+        closest ranks. (float, read-only)"""
+        if self.count == 0:
+            return np.nan
+        h = (self.count - 1) * self.q
+        t = h - int(h)
+        a = -self.low[0]
+        if t == 0:
+            return a
+        b = self.high[0]
+        if not (math.isfinite(a) and math.isfinite(b)):
+            # An infinite rank dominates the interpolation, opposite ones cancel.
+            return a + b
+        return a + (b - a) * t if t < 0.5 else b - (b - a) * (1 - t)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if self.low_size > 0 and value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._balance()
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if value <= -self.low[0]:
+            self.low_removed[value] = self.low_removed.get(value, 0) + 1
+            self.low_size -= 1
+        else:
+            self.high_removed[value] = self.high_removed.get(value, 0) + 1
+            self.high_size -= 1
+        self._prune()
+        self._balance()
+
+    def _balance(self) -> None:
+        size = int((self.count - 1) * self.q) + 1 if self.count > 0 else 0
+        while self.low_size > size:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune()
+        while self.low_size < size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune()
+
+    def _prune(self) -> None:
+        for heap, removed, sign in ((self.low, self.low_removed, -1), (self.high, self.high_removed, 1)):
+            while heap and removed.get(sign * heap[0], 0) > 0:
+                value = sign * heapq.heappop(heap)
+                removed[value] -= 1
+                if removed[value] == 0:
+                    del removed[value]
+
+        if len(self.low) > 2 * self.low_size + 32:
+            self.low = self._compact(self.low, self.low_removed, -1)
+        if len(self.high) > 2 * self.high_size + 32:
+            self.high = self._compact(self.high, self.high_removed, 1)
+
+    @staticmethod
+    def _compact(heap: "List[float]", removed: "Dict[float, int]", sign: int) -> "List[float]":
+        kept = []
+        for item in heap:
+            value = sign * item
+            if removed.get(value, 0) > 0:
+                removed[value] -= 1
+                if removed[value] == 0:
+                    del removed[value]
+            else:
+                kept.append(item)
+        heapq.heapify(kept)
+        return kept
+
+
+class RunningStats:
+    """Several statistics of a sliding window of floats, updated together.
+
+    Only the accumulators needed for the requested statistics are kept: a
+    `KahanSum` for the sum and the mean, a `Welford` for the variance and
+    the standard deviation, a `MonotonicQueue` for each of the minimum and
+    the maximum and a `DualHeap` for the median. The z-score needs both the
+    sum and the moments. Values must be removed in the order they have been
+    added.
+
+    Parameters
+    ----------
+    stats : `Iterable[str]`
+        The statistics to keep, each one of `RunningStats.STATS`.
+
+    Attributes
+    ----------
+    count : int
+        The number of values in the window.
+    """
+
+    STATS = ("sum", "mean", "var", "std", "min", "max", "median", "zscore")
+
+    __slots__ = ("count", "total", "moments", "low", "high", "middle", "accumulators")
+
+    def __init__(self, stats: "Iterable[str]") -> None:
+        stats = set(stats)
+        self.count = 0
+        self.total = KahanSum() if stats & {"sum", "mean", "zscore"} else None
+        self.moments = Welford() if stats & {"var", "std", "zscore"} else None
+        self.low = MonotonicQueue() if "min" in stats else None
+        self.high = MonotonicQueue(-1) if "max" in stats else None
+        self.middle = DualHeap(0.5) if "median" in stats else None
+        self.accumulators = [
+            acc for acc in (self.total, self.moments, self.low, self.high, self.middle) if acc is not None
+        ]
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        for acc in self.accumulators:
+            acc.add(value)
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        for acc in self.accumulators:
+            acc.remove(value)
+
+    def values(self, value: float) -> "Tuple[float, ...]":
+        """Computes the statistics of the window.
+
+        Parameters
+        ----------
+        value : float
+            The newest value of the window, used for the z-score.
+
+        Returns
+        -------
+        `Tuple[float, ...]`
+            The statistics in the order of `RunningStats.STATS`, NaN for the
+            statistics that are not kept.
+        """
+        nan = np.nan
+        count = self.count
+        total = mean = var = std = zscore = nan
+
+        if self.total is not None:
+            total = self.total.total
+            mean = total / count if count > 0 else nan
+        if self.moments is not None:
+            var = self.moments.m2 / (count - 1) if count > 1 else nan
+            std = math.sqrt(var)
+        if self.total is not None and self.moments is not None:
+            zscore = (value - mean) / std if std > 0 else nan
+
+        return (
+            total,
+            mean,
+            var,
+            std,
+            self.low.extremum if self.low is not None else nan,
+            self.high.extremum if self.high is not None else nan,
+            self.middle.quantile if self.middle is not None else nan,
+            zscore
+        )
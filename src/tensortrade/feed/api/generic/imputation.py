@@ -5,12 +5,14 @@ imputation.py contains classes for imputation stream operations.
 import numpy as np
 
 from tensortrade.feed.core.base import Stream, T
+from tensortrade.feed.core.batch import as_column
 
 
 class ForwardFill(Stream[T]):
     """A stream operator that computes the forward fill imputation of a stream."""
 
     generic_name = "ffill"
+    _state_attrs = ("previous",)
 
     def __init__(self) -> None:
         super().__init__()
@@ -22,9 +24,29 @@ class ForwardFill(Stream[T]):
             self.previous = node.value
         return self.previous
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if values.dtype.kind != "f" or np.any(values == 0):
+            output = []
+            for v in values.tolist():
+                if not self.previous or np.isfinite(v):
+                    self.previous = v
+                output += [self.previous]
+            return as_column(output)
+        # Without zeros only the first value and finite values are carried
+        # forward.
+        keep = np.isfinite(values)
+        keep[:1] = True
+        index = np.where(keep, np.arange(len(values)), 0)
+        np.maximum.accumulate(index, out=index)
+        return values[index]
+
     def has_next(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        self.previous = None
+        super().reset()
+
 
 class FillNa(Stream[T]):
     """A stream operator that computes the padded imputation of a stream.
@@ -36,6 +58,7 @@ class FillNa(Stream[T]):
     """
 
     generic_name = "fillna"
+    pure = True
 
     def __init__(self, fill_value: T):
         super().__init__()
@@ -47,5 +70,8 @@ class FillNa(Stream[T]):
             return self.fill_value
         return node.value
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        return np.where(np.isnan(values), self.fill_value, values)
+
     def has_next(self) -> bool:
         return True
@@ -7,6 +7,7 @@ from typing import Callable
 from tensortrade.feed.core.base import Stream, T
 from tensortrade.feed.core.operators import (
     Apply,
+    History,
     Lag,
     Freeze,
     Accumulator,
@@ -46,6 +47,9 @@ def apply(s: "Stream[T]",
 def lag(s: "Stream[T]", lag: int = 1, dtype: str = None) -> "Stream[T]":
     """Creates a lag stream.
 
+    The lags of a float stream read their values from the history of the
+    stream, which is shared with the other lags and rolling windows over it.
+
     Parameters
     ----------
     s : `Stream[T]`
@@ -62,6 +66,8 @@ def lag(s: "Stream[T]", lag: int = 1, dtype: str = None) -> "Stream[T]":
     """
     if dtype is None:
         dtype = s.dtype
+    if s.dtype == "float":
+        s = History.of(s)
     return Lag(lag, dtype=dtype)(s)
 
 
@@ -20,6 +20,7 @@ class Aggregate(Stream[T]):
     """
 
     generic_name = "reduce"
+    pure = True
 
     def __init__(self, func: Callable[[List[T]], T]):
         super().__init__()
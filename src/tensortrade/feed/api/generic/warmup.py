@@ -16,6 +16,8 @@ class WarmUp(Stream[T]):
         Number of periods to warm up.
     """
 
+    _state_attrs = ("count",)
+
     def __init__(self, periods: int) -> None:
         super().__init__()
         self.count = 0
@@ -28,6 +30,11 @@ class WarmUp(Stream[T]):
             return np.nan
         return v
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        output = values.astype(np.result_type(values.dtype, np.float64))
+        output[:self.periods] = np.nan
+        return output
+
     def has_next(self) -> bool:
         return True
 
@@ -13,7 +13,7 @@ class StringMethods(Methods):
 
 @Stream.register_mixin(dtype="string")
 class StringMixin(DataTypeMixin):
-    ...
+    __slots__ = ()
 
 
 class String:
@@ -1,3 +1,3 @@
-from tensortrade.feed.core.base import Stream, NameSpace
+from tensortrade.feed.core.base import Stream, NameSpace, NameRegistry
 from tensortrade.feed.core.feed import DataFeed
 from tensortrade.feed.core.operators import Apply
@@ -6,6 +6,9 @@ class CachedAccessor:
 
     A descriptor for caching accessors.
 
+    The accessor of an instance is created on first access and kept in the
+    `_accessor_cache` dictionary of the instance.
+
     Parameters
     ----------
     name : str
@@ -25,6 +28,11 @@ class CachedAccessor:
     def __get__(self, instance, owner):
         if instance is None:
             return self._accessor
-        accessor = self._accessor(instance)
-        object.__setattr__(instance, self._name, accessor)
+        try:
+            cache = instance._accessor_cache
+        except AttributeError:
+            cache = instance._accessor_cache = {}
+        accessor = cache.get(self._name)
+        if accessor is None:
+            accessor = cache[self._name] = self._accessor(instance)
         return accessor
@@ -0,0 +1,256 @@
+"""
+async_feed.py contains a push feed for live data that is filled by asyncio
+producers through bounded queues.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tensortrade.feed.core.base import Stream, Placeholder
+from tensortrade.feed.core.feed import DataFeed
+
+
+@dataclass
+class PushFeedStats:
+    """The statistics of an `AsyncPushFeed`.
+
+    Parameters
+    ----------
+    steps : int
+        The number of steps generated.
+    timeouts : int
+        The number of steps generated before all placeholders had a value.
+    missing : `Dict[str, int]`
+        The number of steps generated without a new value, per placeholder.
+    dropped : `Dict[str, int]`
+        The number of values discarded by the "drop_oldest" policy, per
+        placeholder.
+    coalesced : `Dict[str, int]`
+        The number of values replaced by the "coalesce" policy, per
+        placeholder.
+    depth : `Dict[str, int]`
+        The number of values waiting in the queue, per placeholder.
+    bar : `Any`, optional
+        The bar of the last step, if the values have been put with bars.
+    lag : float
+        The time in seconds the oldest value of the last step has waited in
+        its queue.
+    max_lag : float
+        The largest `lag` of all steps.
+    """
+
+    steps: int = 0
+    timeouts: int = 0
+    missing: "Dict[str, int]" = field(default_factory=dict)
+    dropped: "Dict[str, int]" = field(default_factory=dict)
+    coalesced: "Dict[str, int]" = field(default_factory=dict)
+    depth: "Dict[str, int]" = field(default_factory=dict)
+    bar: "Any" = None
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+class AsyncPushFeed(DataFeed):
+    """A data feed for live data pushed by asyncio producers.
+
+    Every `Placeholder` of the feed gets a bounded queue. Producers `put`
+    values into the queues independently of each other, and `step` waits
+    until every queue holds a value, takes one value from each and runs the
+    feed on them. If a `timeout` is given, a step is also generated once the
+    oldest value waiting has been queued for that long. Placeholders without
+    a new value then repeat their last value, or get `fill_value`.
+
+    Values put with a `bar`, e.g. the timestamp of the bar they belong to,
+    are aligned by bar instead of by arrival order. A step generates the
+    earliest bar at the head of the queues, and takes a value only from the
+    queues holding a value of that bar. Queues already holding a later bar
+    have missed the bar and keep their value for the next step. A step is
+    generated once every queue holds a value of that bar or a later one.
+
+    Parameters
+    ----------
+    streams : `List[Stream]`
+        A list of streams to be used in the data feed.
+    maxsize : int, default 1
+        The number of values each queue can hold.
+    policy : {"block", "drop_oldest", "coalesce"}, default "block"
+        What happens when a value is put into a full queue. "block" waits until
+        the queue has space again, "drop_oldest" discards the oldest value of
+        the queue and "coalesce" replaces the newest value of the queue.
+    timeout : float, optional
+        The time in seconds after which a step is generated even if not all
+        placeholders have a value.
+    hold : bool, default True
+        Whether placeholders without a new value repeat their last value.
+    fill_value : `Any`, default np.nan
+        The value of placeholders without a new value, if they do not repeat
+        their last value or never had one.
+
+    Raises
+    ------
+    ValueError
+        Raised if `policy` is unknown or `maxsize` is not positive.
+    """
+
+    policies = ("block", "drop_oldest", "coalesce")
+
+    def __init__(self,
+                 streams: "List[Stream]",
+                 maxsize: int = 1,
+                 policy: str = "block",
+                 timeout: float = None,
+                 hold: bool = True,
+                 fill_value: "Any" = np.nan) -> None:
+        if policy not in self.policies:
+            raise ValueError("Unknown policy {}, must be one of {}.".format(policy, self.policies))
+        if maxsize < 1:
+            raise ValueError("The queues must be able to hold at least one value.")
+
+        super().__init__(streams)
+        self.compile()
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.timeout = timeout
+        self.hold = hold
+        self.fill_value = fill_value
+
+        self.start = [s for s in self.process if isinstance(s, Placeholder)]
+        self._placeholders = {s.name: s for s in self.start}
+        self._queues = {s.name: deque() for s in self.start}  # type: Dict[str, Deque[Tuple[float, Any, Any]]]
+        self._last = {}  # type: Dict[str, Any]
+        self._condition = None  # type: Optional[asyncio.Condition]
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._stats = PushFeedStats(
+            missing={name: 0 for name in self._queues},
+            dropped={name: 0 for name in self._queues},
+            coalesced={name: 0 for name in self._queues}
+        )
+
+    @property
+    def stats(self) -> "PushFeedStats":
+        """The statistics of the feed, with the current queue depths. (`PushFeedStats`, read-only)"""
+        self._stats.depth = {name: len(queue) for name, queue in self._queues.items()}
+        return self._stats
+
+    async def put(self, name: str, value: "Any", bar: "Any" = None) -> None:
+        """Puts a value into the queue of a placeholder.
+
+        Parameters
+        ----------
+        name : str
+            The name of the placeholder.
+        value : `Any`
+            The value to put.
+        bar : `Any`, optional
+            The bar the value belongs to, e.g. its timestamp. Bars must be
+            comparable and put in increasing order per placeholder.
+
+        Raises
+        ------
+        KeyError
+            Raised if the feed has no placeholder called `name`.
+        """
+        queue = self._queues[name]
+        condition = self._get_condition()
+        async with condition:
+            if len(queue) >= self.maxsize:
+                if self.policy == "block":
+                    await condition.wait_for(lambda: len(queue) < self.maxsize)
+                elif self.policy == "drop_oldest":
+                    queue.popleft()
+                    self._stats.dropped[name] += 1
+                else:
+                    queue.pop()
+                    self._stats.coalesced[name] += 1
+            queue.append((time.monotonic(), bar, value))
+            condition.notify_all()
+
+    async def put_many(self, data: "Dict[str, Any]", bar: "Any" = None) -> None:
+        """Puts a value into the queue of each of several placeholders.
+
+        Parameters
+        ----------
+        data : `Dict[str, Any]`
+            The values to put by the names of the placeholders.
+        bar : `Any`, optional
+            The bar the values belong to.
+        """
+        for name, value in data.items():
+            await self.put(name, value, bar)
+
+    async def step(self) -> dict:
+        """Waits for the values of the next step and generates it.
+
+        Returns
+        -------
+        dict
+            The next data point generated from the feed.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(self._any_ready)
+            if not self._all_ready():
+                if self.timeout is None:
+                    await condition.wait_for(self._all_ready)
+                else:
+                    opened = min(queue[0][0] for queue in self._queues.values() if queue)
+                    remaining = self.timeout - (time.monotonic() - opened)
+                    try:
+                        await asyncio.wait_for(condition.wait_for(self._all_ready), max(remaining, 0))
+                    except asyncio.TimeoutError:
+                        self._stats.timeouts += 1
+
+            bars = [queue[0][1] for queue in self._queues.values() if queue and queue[0][1] is not None]
+            bar = min(bars) if bars else None
+
+            now = time.monotonic()
+            lag = 0.0
+            for name, queue in self._queues.items():
+                if queue and (bar is None or queue[0][1] is None or queue[0][1] == bar):
+                    pushed, _, value = queue.popleft()
+                    lag = max(lag, now - pushed)
+                else:
+                    value = self._last.get(name, self.fill_value) if self.hold else self.fill_value
+                    self._stats.missing[name] += 1
+                self._placeholders[name].push(value)
+                self._last[name] = value
+            condition.notify_all()
+
+        self._stats.steps += 1
+        self._stats.bar = bar
+        self._stats.lag = lag
+        self._stats.max_lag = max(self._stats.max_lag, lag)
+
+        self.run()
+        return self.value
+
+    async def __aiter__(self) -> "AsyncIterator[dict]":
+        while True:
+            yield await self.step()
+
+    def _get_condition(self) -> "asyncio.Condition":
+        """Gets the condition guarding the queues, created in the running
+        event loop on first use and again whenever the loop changes.
+
+        Returns
+        -------
+        `asyncio.Condition`
+            The condition of the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _any_ready(self) -> bool:
+        return any(len(queue) > 0 for queue in self._queues.values())
+
+    def _all_ready(self) -> bool:
+        return all(len(queue) > 0 for queue in self._queues.values())
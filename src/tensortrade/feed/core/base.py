@@ -11,8 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License
+import copy
 import inspect
+import itertools
 from abc import abstractmethod
+from collections import deque
 from typing import (
     Generic,
     Iterable,
@@ -21,11 +24,17 @@ from typing import (
     Any,
     Callable,
     List,
-    Tuple
+    Optional,
+    Set,
+    Tuple,
+    Union
 )
 
+import numpy as np
+
 from tensortrade.core import Observable
 from tensortrade.feed.core.accessors import CachedAccessor
+from tensortrade.feed.core.memmap import read_column
 from tensortrade.feed.core.mixins import DataTypeMixin
 
 T = TypeVar("T")
@@ -49,19 +58,15 @@ class Named:
         The name of the object.
     """
 
+    __slots__ = ()
+
     generic_name: str = "generic"
     namespaces: List[str] = []
     names: Dict[str, int] = {}
 
     def __init__(self, name: str = None):
         if not name:
-            name = self.generic_name
-
-            if name in Stream.names.keys():
-                Stream.names[name] += 1
-                name += ":/" + str(Stream.names[name] - 1)
-            else:
-                Stream.names[name] = 0
+            name = NameRegistry.current().allocate(self.generic_name)
         self.name = name
 
     def rename(self, name: str, sep: str = ":/") -> "Named":
@@ -94,22 +99,149 @@ class NameSpace(Named):
     same name in a different context. In order to resolve naming conflicts in
     a `DataFeed`, this class provides a way to solve it.
 
+    Names generated for objects created within the namespace without a name
+    are allocated from the `NameRegistry` of the namespace, e.g.
+    `world:/stream:/0`. All namespaces of the same name entered within the
+    same registry share the registry of the namespace, so their names never
+    collide.
+
     Parameters
     ----------
     name : str
         The name for the `NameSpace`.
+
+    Attributes
+    ----------
+    registry : `NameRegistry`, optional
+        The registry generating the names within the namespace, set once the
+        namespace is entered.
     """
 
     def __init__(self, name: str) -> None:
         super().__init__(name)
+        self.registry = None
 
     def __enter__(self) -> None:
         Named.namespaces += [self.name]
+        self.registry = NameRegistry.current().scope(self.name)
+        self.registry.__enter__()
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.registry.__exit__(exc_type, exc_val, exc_tb)
         Named.namespaces.pop()
 
 
+class NameRegistry:
+    """A scope for the names generated for objects created without a name.
+
+    Generated names are made unique by counting the objects created with the
+    same generic name, e.g. `stream`, `stream:/0`, `stream:/1`. Outside of a
+    registry the counts are kept in `Named.names` for the lifetime of the
+    process. Within a registry, the names are counted by the registry and
+    prefixed with its name, e.g. `sweep:/stream:/0`, so they never collide
+    with names generated outside of it. The counts are released along with
+    the registry. A registry created without a name gets a unique name from
+    the enclosing scope when it is first entered, so registries nest with
+    each other and with `NameSpace`.
+
+    Building a graph in a registry of the same name therefore generates the
+    same names every time, no matter how many graphs have been built before.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name prefixing the generated names.
+    counts : `Dict[str, int]`, optional
+        The counts to allocate the names from.
+
+    Attributes
+    ----------
+    name : str, optional
+        The name prefixing the generated names.
+    counts : `Dict[str, int]`
+        The counts of the generated names by generic name.
+    scopes : `Dict[str, NameRegistry]`
+        The registries of the namespaces entered within the registry by name.
+    """
+
+    active: "List[NameRegistry]" = []
+
+    def __init__(self, name: str = None, counts: "Dict[str, int]" = None) -> None:
+        self.name = name
+        self.counts = {} if counts is None else counts
+        self.scopes = {}
+
+    @staticmethod
+    def current() -> "NameRegistry":
+        """Gets the registry of the innermost active scope.
+
+        Returns
+        -------
+        `NameRegistry`
+            The innermost registry entered, or the registry of the process.
+        """
+        if len(NameRegistry.active) > 0:
+            return NameRegistry.active[-1]
+        return _process_registry
+
+    def allocate(self, generic_name: str) -> str:
+        """Generates a name that is unique within the registry.
+
+        Parameters
+        ----------
+        generic_name : str
+            The generic name of the object to name.
+
+        Returns
+        -------
+        str
+            The generated name.
+        """
+        count = self.counts.get(generic_name)
+        if count is None:
+            self.counts[generic_name] = 0
+            name = generic_name
+        else:
+            self.counts[generic_name] = count + 1
+            name = generic_name + ":/" + str(count)
+        return name if self.name is None else self.name + ":/" + name
+
+    def scope(self, name: str) -> "NameRegistry":
+        """Gets the registry of a namespace within the registry.
+
+        Parameters
+        ----------
+        name : str
+            The name of the namespace.
+
+        Returns
+        -------
+        `NameRegistry`
+            The registry generating the names within the namespace.
+        """
+        registry = self.scopes.get(name)
+        if registry is None:
+            registry = self.scopes[name] = NameRegistry(name)
+        return registry
+
+    def clear(self) -> None:
+        """Discards all counts, starting the names over."""
+        self.counts.clear()
+        self.scopes.clear()
+
+    def __enter__(self) -> "NameRegistry":
+        if self.name is None:
+            self.name = NameRegistry.current().allocate("registry")
+        NameRegistry.active += [self]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        NameRegistry.active.pop()
+
+
+_process_registry = NameRegistry(counts=Named.names)
+
+
 class Stream(Generic[T], Named, Observable):
     """A class responsible for creating the inputs necessary to work in a
     `DataFeed`.
@@ -125,8 +257,10 @@ class Stream(Generic[T], Named, Observable):
     -------
     source(iterable, dtype=None)
         Creates a stream from an iterable.
-    group(streams)
+    group(streams, lazy=False)
         Creates a group of streams.
+    vector(streams, dtype=np.float32)
+        Creates a group of streams generating an array.
     sensor(obj,func,dtype=None)
         Creates a stream from observing a value from an object.
     select(streams,func)
@@ -136,11 +270,34 @@ class Stream(Generic[T], Named, Observable):
         Creates a stream to generate a constant value.
     asdtype(dtype)
         Converts the data type to `dtype`.
+
+    Attributes
+    ----------
+    pure : bool
+        Whether the values of the stream only depend on the current values of
+        its inputs, without keeping any state between steps.
+    reads_state : bool
+        Whether the stream reads the state of its inputs (e.g. the values kept
+        by a history), not only their current values.
+    _state_attrs : `Tuple[str, ...]`
+        The names of the attributes holding the state the stream keeps
+        between steps, which are captured by `state_dict`.
+    _records_args : bool
+        Whether the arguments the stream is created with are kept, to
+        describe the stream (see `_arguments`). Sources describe themselves
+        from their state instead, so their data is not kept twice.
     """
 
+    __slots__ = ("name", "dtype", "inputs", "value", "listeners", "_init_args", "_accessor_cache", "__weakref__")
+
     _mixins: "Dict[str, DataTypeMixin]" = {}
+    _mixin_types: "Dict[Tuple[type, type], type]" = {}
     _accessors: "List[CachedAccessor]" = []
     generic_name: str = "stream"
+    pure: bool = False
+    reads_state: bool = False
+    _state_attrs: "Tuple[str, ...]" = ()
+    _records_args: bool = True
 
     def __new__(cls, *args, **kwargs):
         dtype = kwargs.get("dtype")
@@ -148,13 +305,15 @@ class Stream(Generic[T], Named, Observable):
         if dtype in Stream._mixins.keys():
             mixin = Stream._mixins[dtype]
             instance = Stream.extend_instance(instance, mixin)
+        if cls._records_args:
+            instance._init_args = (args, tuple(item for item in kwargs.items() if item[0] != "dtype"))
         return instance
 
     def __init__(self, name: str = None, dtype: str = None):
         Named.__init__(self, name)
-        Observable.__init__(self)
+        self.listeners = ()
         self.dtype = dtype
-        self.inputs = []
+        self.inputs = ()
         self.value = None
 
     def __call__(self, *inputs) -> "Stream[T]":
@@ -174,6 +333,50 @@ class Stream(Generic[T], Named, Observable):
         self.inputs = inputs
         return self
 
+    def _arguments(self) -> "Optional[Tuple[tuple, Tuple[Tuple[str, Any], ...]]]":
+        """Gets the arguments to create an identical stream with, apart from
+        its data type.
+
+        Returns
+        -------
+        `Tuple[tuple, Tuple[Tuple[str, Any], ...]]`, optional
+            The positional arguments and the keyword arguments as pairs, or
+            None if they are not known.
+        """
+        return getattr(self, "_init_args", None)
+
+    def attach(self, listener) -> "Stream[T]":
+        """Adds a listener to receive the values of the stream.
+
+        Parameters
+        ----------
+        listener : a listener object
+
+        Returns
+        -------
+        `Stream[T]`
+            The stream being called.
+        """
+        self.listeners = self.listeners + (listener,)
+        return self
+
+    def detach(self, listener) -> "Stream[T]":
+        """Removes a listener from receiving the values of the stream.
+
+        Parameters
+        ----------
+        listener : a listener object
+
+        Returns
+        -------
+        `Stream[T]`
+            The stream being called.
+        """
+        listeners = list(self.listeners)
+        listeners.remove(listener)
+        self.listeners = tuple(listeners)
+        return self
+
     def run(self) -> None:
         """Runs the underlying streams once and iterates forward."""
         self.value = self.forward()
@@ -191,6 +394,42 @@ class Stream(Generic[T], Named, Observable):
         """
         raise NotImplementedError()
 
+    def forward_batch(self, *inputs: "np.ndarray") -> "np.ndarray":
+        """Generates all values of the stream at once from the full columns of
+        its batch inputs.
+
+        Streams that implement this method can be evaluated by a `DataFeed`
+        compiled in batch mode without being stepped through one value at a
+        time. The values produced must be exactly the ones `forward` would
+        produce when stepped through the same inputs from a fresh state.
+
+        Parameters
+        ----------
+        *inputs : `np.ndarray`
+            The columns of the streams returned by `batch_inputs`.
+
+        Returns
+        -------
+        `np.ndarray`
+            The column of values generated by the stream.
+
+        Raises
+        ------
+        NotImplementedError
+            Raised if the stream can only be evaluated step by step.
+        """
+        raise NotImplementedError()
+
+    def batch_inputs(self) -> "List[Stream]":
+        """Gets the streams whose columns are given to `forward_batch`.
+
+        Returns
+        -------
+        `List[Stream]`
+            The streams the batch kernel of this stream depends on.
+        """
+        return list(self.inputs)
+
     @abstractmethod
     def has_next(self) -> bool:
         """Checks if there is another value.
@@ -220,16 +459,50 @@ class Stream(Generic[T], Named, Observable):
         return Stream.extend_instance(self, mixin)
 
     def reset(self) -> None:
-        """Resets all inputs to and listeners of the stream and sets stream value to None."""
+        """Resets all listeners of the stream and sets stream value to None.
+
+        The inputs of the stream are not reset. A `DataFeed` resets every
+        stream of its graph exactly once.
+        """
         for listener in self.listeners:
             if hasattr(listener, "reset"):
                 listener.reset()
-        
-        for stream in self.inputs:
-            stream.reset()
 
         self.value = None
 
+    def state_dict(self) -> "Dict[str, Any]":
+        """Captures the state of the stream.
+
+        Returns
+        -------
+        `Dict[str, Any]`
+            A copy of the current value of the stream and of the attributes
+            listed in `_state_attrs`.
+        """
+        state = {"value": self.value}
+        for attr in self._state_attrs:
+            state[attr] = getattr(self, attr)
+        return copy.deepcopy(state)
+
+    def load_state_dict(self, state: "Dict[str, Any]") -> None:
+        """Restores a state captured by `state_dict`.
+
+        The listeners of the stream are not notified.
+
+        Parameters
+        ----------
+        state : `Dict[str, Any]`
+            The state to restore.
+
+        Raises
+        ------
+        KeyError
+            Raised if `state` is missing an attribute of the stream.
+        """
+        state = copy.deepcopy(state)
+        for attr in ("value",) + tuple(self._state_attrs):
+            setattr(self, attr, state[attr])
+
     def gather(self) -> "List[Tuple[Stream, Stream]]":
         """Gathers all the edges of the DAG connected in ancestry with this
         stream.
@@ -239,7 +512,7 @@ class Stream(Generic[T], Named, Observable):
         `List[Tuple[Stream, Stream]]`
             The list of edges connected through ancestry to this stream.
         """
-        return self._gather(self, [], [])
+        return self._gather(self, set(), [])
 
     @staticmethod
     def source(iterable: "Iterable[T]", dtype: str = None) -> "Stream[T]":
@@ -256,17 +529,52 @@ class Stream(Generic[T], Named, Observable):
         -------
         `Stream[T]`
             The stream with the data type `dtype` created from `iterable`.
+            One dimensional numeric arrays and series are served from an
+            `ArrayStream`.
         """
+        if ArrayStream.accepts(iterable):
+            return ArrayStream(iterable, dtype=dtype)
         return IterableStream(iterable, dtype=dtype)
 
     @staticmethod
-    def group(streams: "List[Stream[T]]") -> "Stream[dict]":
+    def mmap(path: str, column: "Union[int, str]" = None, dtype: str = None) -> "Stream[T]":
+        """Creates a stream from a column of a memory-mapped file.
+
+        The file is not loaded into memory. Its pages are read by the
+        operating system as the stream advances and are shared between all
+        processes reading the same file.
+
+        Parameters
+        ----------
+        path : str
+            The path of a `.npy` file, or of an Arrow IPC or Feather file. Arrow
+            files require `pyarrow` to be installed.
+        column : Union[int, str], optional
+            The column to read. An index or field name for `.npy` files, a name
+            or index for Arrow files. Not needed for files holding a single
+            column.
+        dtype : str, optional
+            The data type of the stream.
+
+        Returns
+        -------
+        `Stream[T]`
+            The stream with the data type `dtype` generating the values of the
+            column as python scalars.
+        """
+        return MappedArrayStream(path, column, dtype=dtype)
+
+    @staticmethod
+    def group(streams: "List[Stream[T]]", lazy: bool = False) -> "Stream[dict]":
         """Creates a group of streams.
 
         Parameters
         ----------
         streams : `List[Stream[T]]`
             Streams to be grouped together.
+        lazy : bool, default False
+            Whether the group is only evaluated when its values are requested
+            from the `DataFeed` it is part of.
 
         Returns
         -------
@@ -274,7 +582,26 @@ class Stream(Generic[T], Named, Observable):
             A stream of dictionaries with each stream as a key/value in the
             dictionary being generated.
         """
-        return Group()(*streams)
+        return Group(lazy=lazy)(*streams)
+
+    @staticmethod
+    def vector(streams: "List[Stream[float]]", dtype: "np.dtype" = np.float32) -> "Stream[np.ndarray]":
+        """Creates a group of streams generating an array.
+
+        Parameters
+        ----------
+        streams : `List[Stream[float]]`
+            Streams to be grouped together.
+        dtype : `np.dtype`, default np.float32
+            The data type of the array.
+
+        Returns
+        -------
+        `Stream[np.ndarray]`
+            A stream of arrays holding the value of each stream in the given
+            order. The same array is overwritten on every step.
+        """
+        return VectorGroup(dtype)(*streams)
 
     @staticmethod
     def sensor(obj: "Any",
@@ -363,16 +690,19 @@ class Stream(Generic[T], Named, Observable):
 
     @staticmethod
     def _gather(stream: "Stream",
-                vertices: "List[Stream]",
+                vertices: "Set[Stream]",
                 edges: "List[Tuple[Stream, Stream]]") -> "List[Tuple[Stream, Stream]]":
         """Gathers all the edges relating back to this particular node.
 
+        The graph is traversed depth first without recursion, therefore the
+        depth of the graph is not limited by the recursion limit.
+
         Parameters
         ----------
         stream : `Stream`
             The stream to inspect the connections of.
-        vertices : `List[Stream]`
-            The list of streams that have already been inspected.
+        vertices : `Set[Stream]`
+            The set of streams that have already been inspected.
         edges : `List[Tuple[Stream, Stream]]`
             The connections that have been found to be in the graph at the moment
             not including `stream`.
@@ -382,14 +712,17 @@ class Stream(Generic[T], Named, Observable):
         `List[Tuple[Stream, Stream]]`
             The updated list of edges after inspecting `stream`.
         """
-        if stream not in vertices:
-            vertices += [stream]
+        stack = [stream]
 
-            for s in stream.inputs:
-                edges += [(s, stream)]
+        while len(stack) > 0:
+            s = stack.pop()
 
-            for s in stream.inputs:
-                Stream._gather(s, vertices, edges)
+            if s in vertices:
+                continue
+            vertices.add(s)
+
+            edges += [(i, s) for i in s.inputs]
+            stack += reversed(s.inputs)
 
         return edges
 
@@ -397,6 +730,9 @@ class Stream(Generic[T], Named, Observable):
     def toposort(edges: "List[Tuple[Stream, Stream]]") -> "List[Stream]":
         """Sorts the order in which streams should be run.
 
+        Streams without any outgoing edge, e.g. the stream the edges have
+        been gathered from, are not part of the order.
+
         Parameters
         ----------
         edges : `List[Tuple[Stream, Stream]]`
@@ -408,24 +744,28 @@ class Stream(Generic[T], Named, Observable):
             The list of streams sorted with respect to the order in which they
             should be run.
         """
-        src = set([s for s, t in edges])
-        tgt = set([t for s, t in edges])
+        consumers = {}
+        in_degree = {}
+        for s, t in edges:
+            consumers.setdefault(s, []).append(t)
+            consumers.setdefault(t, [])
+            in_degree.setdefault(s, 0)
+            in_degree[t] = in_degree.get(t, 0) + 1
 
-        starting = list(src.difference(tgt))
-        process = starting.copy()
+        starting = deque(v for v, d in in_degree.items() if d == 0)
+        process = []
 
         while len(starting) > 0:
-            start = starting.pop()
-
-            edges = list(filter(lambda e: e[0] != start, edges))
-
-            src = set([s for s, t in edges])
-            tgt = set([t for s, t in edges])
+            start = starting.popleft()
 
-            starting += [v for v in src.difference(tgt) if v not in starting]
+            if len(consumers[start]) == 0:
+                continue
+            process += [start]
 
-            if start not in process:
-                process += [start]
+            for t in consumers[start]:
+                in_degree[t] -= 1
+                if in_degree[t] == 0:
+                    starting.append(t)
 
         return process
 
@@ -500,8 +840,14 @@ class Stream(Generic[T], Named, Observable):
             The `instance` with the injected methods provided by the `mixin`.
         """
         base_cls = instance.__class__
-        base_cls_name = instance.__class__.__name__
-        instance.__class__ = type(base_cls_name, (base_cls, mixin), {})
+        if issubclass(base_cls, mixin):
+            return instance
+
+        cls = Stream._mixin_types.get((base_cls, mixin))
+        if cls is None:
+            cls = type(base_cls.__name__, (base_cls, mixin), {"__slots__": ()})
+            Stream._mixin_types[(base_cls, mixin)] = cls
+        instance.__class__ = cls
         return instance
 
 
@@ -516,7 +862,10 @@ class IterableStream(Stream[T]):
         The data type of the source.
     """
 
+    __slots__ = ("is_gen", "iterable", "gen_fn", "generator", "stop", "current", "_random_start", "_position")
+
     generic_name = "stream"
+    _records_args = False
 
     def __init__(self, source: "Iterable[T]", dtype: str = None):
         super().__init__(dtype=dtype)
@@ -539,40 +888,247 @@ class IterableStream(Stream[T]):
             self.stop = True
 
         self._random_start = 0
+        self._position = 0
+
+    def _arguments(self) -> "Tuple[tuple, Tuple[Tuple[str, Any], ...]]":
+        return (self.gen_fn if self.is_gen else self.iterable,), ()
 
     def forward(self) -> T:
         v = self.current
+        self._position += 1
         try:
             self.current = next(self.generator)
         except StopIteration:
             self.stop = True
         return v
 
+    def forward_batch(self) -> "np.ndarray":
+        if self.is_gen or not hasattr(self.iterable, "__len__"):
+            raise NotImplementedError()
+        values = self.iterable[self._random_start:]
+        column = np.asarray(values)
+        if column.ndim != 1 or column.dtype.kind not in "biuf":
+            column = np.empty(len(values), dtype=object)
+            column[:] = list(values)
+        return column
+
     def has_next(self):
         return not self.stop
 
+    def state_dict(self) -> "Dict[str, Any]":
+        state = super().state_dict()
+        state["random_start"] = self._random_start
+        state["position"] = self._position
+        return state
+
+    def load_state_dict(self, state: "Dict[str, Any]") -> None:
+        super().load_state_dict(state)
+        self._random_start = state["random_start"]
+        self._start(state["position"])
+
     def reset(self, random_start=0):
         if random_start != 0:
             self._random_start = random_start
 
+        self._start(0)
+        super().reset()
+
+    def _start(self, position: int) -> None:
+        """Restarts the iteration over the source at a position.
+
+        Generator functions are called again and advanced to `position`.
+
+        Parameters
+        ----------
+        position : int
+            The number of values to skip after the random start.
+        """
         if self.is_gen:
             self.generator = self.gen_fn()
+            next(itertools.islice(self.generator, position, position), None)
         else:
-            self.generator = iter(self.iterable[self._random_start:])
+            self.generator = iter(self.iterable[self._random_start + position:])
         self.stop = False
+        self._position = position
 
         try:
             self.current = next(self.generator)
         except StopIteration:
             self.stop = True
-        super().reset()
+
+
+class ArrayStream(IterableStream):
+    """A source stream backed by a contiguous array.
+
+    The values are read from the array by position, so the stream can be
+    moved to any position with `seek` and resetting it does not copy the
+    data.
+
+    Parameters
+    ----------
+    source : `Iterable[T]`
+        The one dimensional array, series or sequence to be used for providing
+        the data.
+    dtype : str, optional
+        The data type of the source.
+    native : bool, optional
+        Whether to generate python scalars instead of NumPy scalars. By
+        default only NumPy arrays generate NumPy scalars, as when they are
+        iterated.
+
+    Attributes
+    ----------
+    buffer : `np.ndarray`
+        The values of the source.
+    cursor : int
+        The position of the next value in `buffer`.
+    """
+
+    __slots__ = ("buffer", "cursor", "native", "_get")
+
+    def __init__(self, source: "Iterable[T]", dtype: str = None, native: bool = None):
+        Stream.__init__(self, dtype=dtype)
+        if native is None:
+            # Series and sequences generate python scalars when iterated.
+            native = not isinstance(source, np.ndarray)
+
+        if isinstance(source, np.memmap):
+            # Memory-mapped columns are read in place, even if strided.
+            self.buffer = source
+        elif isinstance(source, np.ndarray):
+            self.buffer = np.ascontiguousarray(source)
+        else:
+            self.buffer = np.ascontiguousarray(source.to_numpy() if hasattr(source, "to_numpy") else source)
+        self.native = native
+        self._get = self.buffer.item if native else self.buffer.__getitem__
+
+        if self.buffer.ndim != 1:
+            raise ValueError("ArrayStream requires one dimensional data.")
+
+        self.is_gen = False
+        self.iterable = self.buffer
+        self.cursor = 0
+        self._random_start = 0
+
+    @staticmethod
+    def accepts(source: "Any") -> bool:
+        """Checks if a source can be served from an `ArrayStream` without
+        changing the values it generates.
+
+        Parameters
+        ----------
+        source : `Any`
+            The source to check.
+
+        Returns
+        -------
+        bool
+            Whether `source` is a one dimensional numeric array or series.
+        """
+        if not isinstance(source, np.ndarray) and not hasattr(source, "to_numpy"):
+            return False
+        dtype = getattr(source, "dtype", None)
+        return isinstance(dtype, np.dtype) and dtype.kind in "biuf" and getattr(source, "ndim", 0) == 1
+
+    def _arguments(self) -> "Tuple[tuple, Tuple[Tuple[str, Any], ...]]":
+        return (self.buffer,), (("native", self.native),)
+
+    @property
+    def remaining(self) -> int:
+        """The number of values left in the stream. (`int`, read-only)"""
+        return max(len(self.buffer) - self.cursor, 0)
+
+    def seek(self, position: int) -> None:
+        """Moves the stream to a position in its source.
+
+        Parameters
+        ----------
+        position : int
+            The position of the next value to generate.
+        """
+        if position < 0:
+            position += len(self.buffer)
+        self.cursor = min(max(position, 0), len(self.buffer))
+
+    def forward(self) -> T:
+        v = self._get(self.cursor)
+        self.cursor += 1
+        return v
+
+    def forward_batch(self) -> "np.ndarray":
+        return self.buffer[self.cursor:]
+
+    def has_next(self) -> bool:
+        return self.cursor < len(self.buffer)
+
+    def state_dict(self) -> "Dict[str, Any]":
+        state = Stream.state_dict(self)
+        state["random_start"] = self._random_start
+        state["cursor"] = self.cursor
+        return state
+
+    def load_state_dict(self, state: "Dict[str, Any]") -> None:
+        Stream.load_state_dict(self, state)
+        self._random_start = state["random_start"]
+        self.seek(state["cursor"])
+
+    def reset(self, random_start=0):
+        if random_start != 0:
+            self._random_start = random_start
+        self.seek(self._random_start)
+        Stream.reset(self)
+
+
+class MappedArrayStream(ArrayStream):
+    """A source stream backed by a column of a memory-mapped file.
+
+    The stream is created from the path of the file and the column, so its
+    description refers to the file instead of holding the values of the
+    column, e.g. when it is serialized.
+
+    Parameters
+    ----------
+    path : str
+        The path of a `.npy` file, or of an Arrow IPC or Feather file.
+    column : Union[int, str], optional
+        The column to read.
+    dtype : str, optional
+        The data type of the source.
+
+    Attributes
+    ----------
+    path : str
+        The path of the file.
+    column : Union[int, str], optional
+        The column read from the file.
+    """
+
+    __slots__ = ("path", "column")
+
+    def __init__(self, path: str, column: "Union[int, str]" = None, dtype: str = None):
+        super().__init__(read_column(path, column), dtype=dtype, native=True)
+        self.path = path
+        self.column = column
+
+    def _arguments(self) -> "Tuple[tuple, Tuple[Tuple[str, Any], ...]]":
+        return (self.path, self.column), ()
 
 
 class Group(Stream[T]):
-    """A stream that groups together other streams into a dictionary."""
+    """A stream that groups together other streams into a dictionary.
+
+    Parameters
+    ----------
+    lazy : bool, default False
+        Whether the group is only evaluated when its values are requested
+        from the `DataFeed` it is part of. See `DataFeed.flush`.
+    """
+
+    __slots__ = ("lazy", "streams")
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
         super().__init__()
+        self.lazy = lazy
 
     def __call__(self, *inputs):
         self.inputs = inputs
@@ -589,9 +1145,52 @@ class Group(Stream[T]):
         return True
 
 
+class VectorGroup(Group):
+    """A group of streams writing the values of its members into an array.
+
+    The values are written in the order of the streams into a buffer that is
+    allocated once and returned on every step, so no dictionary is created.
+    The buffer is overwritten by the next step, copy it to keep the values.
+
+    Parameters
+    ----------
+    array_dtype : `np.dtype`, default np.float32
+        The data type of the buffer.
+
+    Attributes
+    ----------
+    columns : `List[str]`
+        The names of the streams in the order of the buffer.
+    buffer : `np.ndarray`
+        The buffer holding the values of the current step.
+    """
+
+    __slots__ = ("array_dtype", "columns", "buffer")
+
+    def __init__(self, array_dtype: "np.dtype" = np.float32):
+        super().__init__()
+        self.array_dtype = np.dtype(array_dtype)
+        self.columns = []
+        self.buffer = np.empty(0, dtype=self.array_dtype)
+
+    def __call__(self, *inputs):
+        super().__call__(*inputs)
+        self.columns = [s.name for s in inputs]
+        self.buffer = np.zeros(len(inputs), dtype=self.array_dtype)
+        return self
+
+    def forward(self) -> "np.ndarray":
+        buffer = self.buffer
+        for i, s in enumerate(self.inputs):
+            buffer[i] = s.value
+        return buffer
+
+
 class Sensor(Stream[T]):
     """A stream that watches and generates from a particular object."""
 
+    __slots__ = ("obj", "func")
+
     generic_name = "sensor"
 
     def __init__(self, obj, func, dtype=None):
@@ -609,6 +1208,8 @@ class Sensor(Stream[T]):
 class Constant(Stream[T]):
     """A stream that generates a constant value."""
 
+    __slots__ = ("constant",)
+
     generic_name = "constant"
 
     def __init__(self, value, dtype: str = None):
@@ -618,6 +1219,11 @@ class Constant(Stream[T]):
     def forward(self):
         return self.constant
 
+    def forward_batch(self) -> "np.ndarray":
+        if np.ndim(self.constant) != 0:
+            raise NotImplementedError()
+        return np.asarray(self.constant)
+
     def has_next(self):
         return True
 
@@ -626,6 +1232,8 @@ class Placeholder(Stream[T]):
     """A stream that acts as a placeholder for data to be provided at later date.
     """
 
+    __slots__ = ()
+
     generic_name = "placeholder"
 
     def __init__(self, dtype: str = None) -> None:
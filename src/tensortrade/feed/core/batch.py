@@ -0,0 +1,300 @@
+"""
+batch.py contains the plan used by a `DataFeed` to evaluate the parts of its
+graph that only depend on finite sources column by column instead of step by
+step.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tensortrade.feed.core.base import Stream, Group
+
+
+def as_column(values: "List") -> "np.ndarray":
+    """Converts the values generated by a stream into a one dimensional column.
+
+    Parameters
+    ----------
+    values : `List`
+        The values generated by a stream, one for each step.
+
+    Returns
+    -------
+    `np.ndarray`
+        A column holding `values`. If the values do not form a one dimensional
+        numeric array they are kept as objects.
+    """
+    try:
+        column = np.asarray(values)
+    except ValueError:
+        column = None
+    if column is None or column.ndim != 1 or column.dtype.kind not in "biuf":
+        column = np.fromiter(values, dtype=object, count=len(values))
+    return column
+
+
+def has_kernel(stream: "Stream") -> bool:
+    """Checks if a stream provides its own batch kernel.
+
+    Parameters
+    ----------
+    stream : `Stream`
+        The stream to check.
+
+    Returns
+    -------
+    bool
+        Whether the stream overrides `Stream.forward_batch`.
+    """
+    return type(stream).forward_batch is not Stream.forward_batch
+
+
+class BatchPlan:
+    """A vectorized evaluation plan for the finite part of a stream graph.
+
+    On every evaluation the plan generates the complete column of values for
+    each stream that only depends on sources providing a batch kernel (e.g.
+    an `IterableStream` over a list, array or series). Streams with a batch
+    kernel are computed over whole columns at once. All other streams of that
+    part of the graph are replayed step by step over the columns of their
+    inputs, which keeps their values exactly the same as in the step by step
+    evaluation. Everything else, e.g. sensors, placeholders and groups, stays
+    live and is run by the `DataFeed` on every step.
+
+    After evaluation, `run` only writes the precomputed values of the current
+    step into the streams that are read by live streams or by the feed itself.
+
+    Parameters
+    ----------
+    process : `List[Stream]`
+        The streams of the graph in processing order.
+    edges : `List[Tuple[Stream, Stream]]`
+        The edges of the graph.
+    outputs : `List[Stream]`
+        The streams the values of which are read directly by the feed.
+
+    Attributes
+    ----------
+    live : `List[Stream]`
+        The streams that have to be run on every step, in processing order.
+    length : int
+        The number of steps that have been evaluated.
+    cursor : int
+        The step that will be served next.
+    """
+
+    def __init__(self,
+                 process: "List[Stream]",
+                 edges: "List[Tuple[Stream, Stream]]",
+                 outputs: "List[Stream]") -> None:
+        self.process = process
+        self.outputs = outputs
+
+        self.consumers = {}
+        for s, t in edges:
+            self.consumers.setdefault(s, []).append(t)
+
+        self.live = list(process)
+        self.length = 0
+        self.cursor = 0
+
+        self._boundary = []
+        self._columns = {}
+
+    @property
+    def observed(self) -> bool:
+        """Whether any of the boundary streams has listeners. (`bool`, read-only)"""
+        return any(len(s.listeners) > 0 for s, _ in self._boundary)
+
+    def evaluate(self) -> None:
+        """Evaluates the columns of all batched streams from the current state
+        of the sources and rewinds the plan to the first step."""
+        columns = {}
+        for s in self.process:
+            if len(s.inputs) == 0 and has_kernel(s):
+                try:
+                    columns[s] = s.forward_batch()
+                except NotImplementedError:
+                    pass
+
+        lengths = [len(c) for c in columns.values() if c.ndim == 1]
+        if len(lengths) == 0:
+            self.live = list(self.process)
+            self.length = 0
+            self.cursor = 0
+            self._boundary = []
+            self._columns = {}
+            return
+
+        n = min(lengths)
+        for s, c in columns.items():
+            columns[s] = np.broadcast_to(c, (n,)) if c.ndim == 0 else c[:n]
+
+        live = self._live(columns)
+        batched = [s for s in self.process if s not in columns and s not in live]
+        self.live = [s for s in self.process if s in live]
+
+        boundary = [s for s in self.process if s not in live and (
+            s in self.outputs or len(s.listeners) > 0 or any(t in live for t in self.consumers.get(s, []))
+        )]
+
+        self._evaluate(batched, boundary, columns, n)
+
+        self._boundary = [(s, columns[s]) for s in boundary]
+        self._columns = dict(self._boundary)
+        self.length = n
+        self.cursor = 0
+
+    def _live(self, columns: "Dict[Stream, np.ndarray]") -> "set":
+        """Finds the streams that have to be run on every step.
+
+        A stream is live if it is not a source with a column, a group, or has
+        a live input. The inputs of a live stream reading the state of its
+        inputs are live as well, since only the values of the batched streams
+        are written on each step.
+        """
+        forced = set()
+        while True:
+            live = set()
+            for s in self.process:
+                if s in columns:
+                    continue
+                if s in forced or len(s.inputs) == 0 or isinstance(s, Group) or any(i in live for i in s.inputs):
+                    live.add(s)
+
+            required = {i for s in live if s.reads_state for i in s.inputs if i not in live and i not in columns}
+            if len(required) == 0:
+                return live
+            forced |= required
+
+    def run(self) -> None:
+        """Writes the values of the current step into the boundary streams and
+        moves on to the next step."""
+        i = self.cursor
+        for s, column in self._boundary:
+            s.value = column[i]
+            for listener in s.listeners:
+                listener.on_next(s.value)
+        self.cursor += 1
+
+    def column(self, stream: "Stream") -> "Optional[np.ndarray]":
+        """Gets the precomputed column of a boundary stream.
+
+        Parameters
+        ----------
+        stream : `Stream`
+            The stream to get the column of.
+
+        Returns
+        -------
+        `np.ndarray`, optional
+            The column of `stream` or None if it is not precomputed.
+        """
+        return self._columns.get(stream)
+
+    def advance(self, n: int) -> None:
+        """Moves on by `n` steps at once.
+
+        Only the values of the last step are written into the boundary
+        streams and their listeners are not notified.
+
+        Parameters
+        ----------
+        n : int
+            The number of steps to move on by.
+        """
+        if n <= 0:
+            return
+        self.cursor += n
+        for s, column in self._boundary:
+            s.value = column[self.cursor - 1]
+
+    def has_next(self) -> bool:
+        """Checks if there is another precomputed step.
+
+        Returns
+        -------
+        bool
+            If there is another step or not.
+        """
+        return self.cursor < self.length
+
+    def _evaluate(self,
+                  batched: "List[Stream]",
+                  boundary: "List[Stream]",
+                  columns: "Dict[Stream, np.ndarray]",
+                  n: int) -> None:
+        """Computes the columns of the boundary streams in stages.
+
+        A stream with a kernel runs in the first stage in which the columns of
+        all its batch inputs exist. Streams without a kernel are grouped into
+        replay passes that step through all rows together, so that streams
+        reading the state of each other (e.g. a rolling window and its
+        aggregations) stay in sync. The replay pass of a stage runs after its
+        kernels, therefore a kernel consuming a replayed column has to wait
+        for the next stage.
+        """
+        stage = {s: 0 for s in columns}
+        replayed = set()
+        for s in batched:
+            if has_kernel(s):
+                stage[s] = max([stage[i] + int(i in replayed) for i in s.batch_inputs()], default=0)
+            else:
+                stage[s] = max([stage[i] for i in s.inputs], default=0)
+                replayed.add(s)
+
+        required = set(boundary)
+        recorded = set(boundary)
+        for s in reversed(batched):
+            if s not in required:
+                continue
+            if s in replayed:
+                dependencies = [i for i in s.inputs if not (i in replayed and stage[i] == stage[s])]
+                required.update(s.inputs)
+            else:
+                dependencies = s.batch_inputs()
+                required.update(dependencies)
+            recorded.update(dependencies)
+
+        stages = {}
+        for s in batched:
+            if s in required:
+                stages.setdefault(stage[s], []).append(s)
+
+        for k in sorted(stages.keys()):
+            for s in stages[k]:
+                if s not in replayed:
+                    column = s.forward_batch(*[columns[i] for i in s.batch_inputs()])
+                    columns[s] = np.broadcast_to(column, (n,)) if np.ndim(column) == 0 else column
+            streams = [s for s in stages[k] if s in replayed]
+            if len(streams) > 0:
+                self._replay(streams, recorded, columns, n)
+
+    def _replay(self,
+                streams: "List[Stream]",
+                recorded: "set",
+                columns: "Dict[Stream, np.ndarray]",
+                n: int) -> None:
+        """Steps the given streams through all rows of the columns of their
+        inputs and records the columns that are needed afterwards."""
+        members = set(streams)
+        inputs = []
+        for s in streams:
+            for i in s.inputs:
+                if i not in members and all(i is not j for j, _ in inputs):
+                    inputs += [(i, columns[i])]
+
+        recorded = [s for s in streams if s in recorded]
+        values = {s: [None] * n for s in recorded}
+
+        for row in range(n):
+            for i, column in inputs:
+                i.value = column[row]
+            for s in streams:
+                s.value = s.forward()
+            for s in recorded:
+                values[s][row] = s.value
+
+        for s in recorded:
+            columns[s] = as_column(values[s])
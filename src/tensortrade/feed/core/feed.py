@@ -1,58 +1,637 @@
 
 
-from typing import List
+import copy
+import hashlib
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from tensortrade.feed.core.base import Stream, Placeholder, IterableStream
+import numpy as np
+
+from tensortrade.feed.core.base import Stream, Placeholder, IterableStream, Group, Sensor
+from tensortrade.feed.core.batch import BatchPlan
+from tensortrade.feed.core.operators import History
+from tensortrade.feed.core.optimize import optimize as optimize_graph
+from tensortrade.feed.core.parallel import LevelScheduler
+from tensortrade.feed.core.profiler import FeedProfiler
 
 
 class DataFeed(Stream[dict]):
     """A stream the compiles together streams to be run in an organized manner.
 
+    Lazy groups given to the feed (see `Stream.group`) are not part of the
+    values generated on each step. The streams only needed by lazy groups are
+    evaluated when `flush` is called, catching up on all steps since the last
+    call in order. Until then, the values the lazy streams read from the
+    other streams are kept for every step, so a feed whose lazy groups are
+    never flushed grows by one tuple of these values per step, unless
+    `max_pending` is given.
+
     Parameters
     ----------
     streams : `List[Stream]`
         A list of streams to be used in the data feed.
+    max_pending : int, optional
+        The largest number of steps kept for the lazy groups. Once exceeded,
+        the lazy streams catch up on the oldest step right away and its
+        values are discarded, so `flush` returns at most the latest
+        `max_pending` steps. The lazy streams still see every step.
+
+    Attributes
+    ----------
+    batch : bool
+        Whether the feed has been compiled in batch mode.
+    optimize : bool
+        Whether the graph of the feed has been optimized when compiled.
+    report : `OptimizationReport`, optional
+        The report of the last optimization of the graph.
+    workers : int
+        The number of threads running independent streams concurrently.
+    threshold : float
+        The mean time in seconds per step from which a stream is run on a
+        thread.
+    columns : `List[str]`
+        The names of the columns generated by `run_batch`.
+    profiler : `FeedProfiler`, optional
+        The profiler recording the runs of the streams, if profiling is
+        enabled.
+    max_pending : int, optional
+        The largest number of steps kept for the lazy groups.
     """
 
-    def __init__(self, streams: "List[Stream]") -> None:
+    def __init__(self, streams: "List[Stream]", max_pending: int = None) -> None:
         super().__init__()
 
         self.process = None
         self.compiled = False
+        self.batch = False
+        self.optimize = False
+        self.report = None
+        self.profiler = None
+        self.workers = 0
+        self.threshold = 1e-4
+        self.max_pending = max_pending
+
+        self._plan = None
+        self._scheduler = None
+        self._eager = []
+        self._lazy = []
+        self._groups = []
+        self._boundary = []
+        self._pending = []
+        self._leaves = []
+        self._skip = set()
 
         if streams:
             self.__call__(*streams)
 
-    def compile(self) -> None:
+    def compile(self,
+                batch: bool = False,
+                optimize: bool = False,
+                workers: int = 0,
+                threshold: float = 1e-4) -> None:
         """Compiles all the given stream together.
 
         Organizes the order in which streams should be run to get valid output.
+
+        Parameters
+        ----------
+        batch : bool, default False
+            Whether to evaluate the streams that only depend on finite sources
+            (e.g. an `IterableStream` over a list, array or series) column by
+            column on every reset, instead of step by step. The values
+            generated by the feed are exactly the same in both modes. Only
+            the values of the streams read by the feed or by live streams
+            (e.g. sensors, placeholders and groups) are updated on each step.
+        optimize : bool, default False
+            Whether to optimize the graph before compiling it. Pure streams
+            depending only on constants are folded into constants, identical
+            streams are merged and streams no longer in use are dropped. The
+            graph is rewired in place, except for the streams given to the
+            feed, the members of groups and the streams with listeners.
+        workers : int, default 0
+            The number of threads used to run independent streams
+            concurrently. Streams are grouped into levels that do not depend
+            on each other, and the streams of a level taking at least
+            `threshold` seconds per step run on a thread pool. If 0, all
+            streams run on the calling thread.
+        threshold : float, default 1e-4
+            The mean time in seconds per step, measured over the first steps,
+            from which a stream is run on the thread pool.
         """
         edges = self.gather()
 
+        self.optimize = optimize
+        if optimize:
+            self.report = optimize_graph(self, edges)
+            edges = self.gather()
+            self.report.nodes_after = len(self.toposort(edges))
+
+        edges = self._isolate(edges)
         self.process = self.toposort(edges)
+        self._build(edges, batch, workers, threshold)
+
+    def _build(self,
+               edges: "List[Tuple[Stream, Stream]]",
+               batch: bool,
+               workers: int,
+               threshold: float) -> None:
+        """Prepares the evaluation of the graph once the processing order is
+        known.
+
+        Parameters
+        ----------
+        edges : `List[Tuple[Stream, Stream]]`
+            The edges of the graph.
+        batch : bool
+            Whether to compile the feed in batch mode.
+        workers : int
+            The number of threads running independent streams concurrently.
+        threshold : float
+            The mean time in seconds per step from which a stream is run on a
+            thread.
+        """
+        self._split(edges)
+        self._flatten(edges)
+
+        self.batch = batch
+        if batch:
+            outputs = [s for s in self.inputs if s not in self._groups] + self._boundary
+            self._plan = BatchPlan(self._eager, edges, outputs)
+        else:
+            self._plan = None
+
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
+        self.workers = workers
+        self.threshold = threshold
+        self._scheduler = LevelScheduler(workers, threshold, calibration=10) if workers > 0 else None
+
         self.compiled = True
         self.reset()
 
-    def run(self) -> None:
-        """Runs all the streams in processing order."""
+    @property
+    def columns(self) -> "List[str]":
+        """The names of the columns generated by `run_batch`. (`List[str]`, read-only)"""
+        if not self.compiled:
+            self.compile()
+        return [name for name, _ in self._leaves]
+
+    def run_batch(self,
+                  n: int = None,
+                  dtype: "np.dtype" = np.float64,
+                  structured: bool = False) -> "np.ndarray":
+        """Advances the feed by up to `n` steps and returns the generated
+        values as an array.
+
+        The values of each step are written into one row of a preallocated
+        array, without building the dictionaries returned by `next`. The
+        members of groups are flattened into their own columns named
+        `group:/member`. The values are not passed to the listeners of the
+        feed.
+
+        Parameters
+        ----------
+        n : int, optional
+            The maximum number of steps to advance. If not given, the feed is
+            advanced until it has no more values.
+        dtype : `np.dtype`, default np.float64
+            The data type of the array.
+        structured : bool, default False
+            Whether to return a structured array with one field per column
+            instead of a two dimensional array.
+
+        Returns
+        -------
+        `np.ndarray`
+            An array with one row per step and one column, or field, for each
+            name in `columns`.
+        """
+        if not self.compiled:
+            self.compile()
+
+        streams = [s for _, s in self._leaves]
+        if self._plan is None:
+            live = [s for s in self._eager if s not in self._skip]
+        else:
+            live = [s for s in self._plan.live if s not in self._skip]
+            n = self._plan.length - self._plan.cursor if n is None else n
+
+        columns = self._precomputed(live)
+        if columns is not None:
+            start = self._plan.cursor
+            stop = min(start + n, self._plan.length)
+            output = np.empty((stop - start, len(streams)), dtype=dtype)
+            for j, column in enumerate(columns):
+                output[:, j] = column[start:stop]
+            self._plan.advance(stop - start)
+        elif n is None:
+            rows = []
+            while self.has_next():
+                self._step(live)
+                rows += [[s.value for s in streams]]
+            output = np.array(rows, dtype=dtype).reshape(len(rows), len(streams))
+        else:
+            output = np.empty((n, len(streams)), dtype=dtype)
+            i = 0
+            while i < n and self.has_next():
+                self._step(live)
+                output[i] = [s.value for s in streams]
+                i += 1
+            output = output[:i]
+
+        return self._structure(output) if structured else output
+
+    def to_numpy(self, dtype: "np.dtype" = np.float64, structured: bool = False) -> "np.ndarray":
+        """Resets the feed and generates all of its values as an array.
+
+        Parameters
+        ----------
+        dtype : `np.dtype`, default np.float64
+            The data type of the array.
+        structured : bool, default False
+            Whether to return a structured array with one field per column
+            instead of a two dimensional array.
+
+        Returns
+        -------
+        `np.ndarray`
+            An array with one row per step and one column, or field, for each
+            name in `columns`.
+        """
+        if not self.compiled:
+            self.compile()
+        self.reset()
+        return self.run_batch(dtype=dtype, structured=structured)
+
+    def profile(self, enabled: bool = True) -> "Optional[FeedProfiler]":
+        """Enables or disables the profiling of the streams of the feed.
+
+        While enabled, the number of calls, the wall time and the number of
+        NaN values generated are recorded for every stream run by the feed.
+        In batch mode the time spent serving the precomputed values is
+        recorded for the batch plan as a whole.
+
+        Parameters
+        ----------
+        enabled : bool, default True
+            Whether to enable profiling.
+
+        Returns
+        -------
+        `FeedProfiler`, optional
+            The profiler recording the runs, or None if profiling has been
+            disabled. Enabling profiling again keeps the current profiler.
+        """
+        if not enabled:
+            self.profiler = None
+        elif self.profiler is None:
+            self.profiler = FeedProfiler()
+        return self.profiler
+
+    def state_dict(self) -> "Dict[str, Any]":
+        """Captures the state of every stream of the feed.
+
+        The state can be restored with `load_state_dict` on this feed, or on
+        a feed compiled from an identical graph, e.g. in another process, to
+        continue from the same step without replaying the steps before it.
+
+        Returns
+        -------
+        `Dict[str, Any]`
+            The state of the feed.
+        """
+        if not self.compiled:
+            self.compile()
+
+        return {
+            "fingerprint": self._fingerprint(),
+            "streams": [s.state_dict() for s in self.process],
+            "cursor": None if self._plan is None else self._plan.cursor,
+            "pending": copy.deepcopy(self._pending),
+            "value": copy.deepcopy(self.value)
+        }
+
+    def load_state_dict(self, state: "Dict[str, Any]") -> None:
+        """Restores a state captured by `state_dict`.
+
+        In batch mode the columns of the batched streams are evaluated again
+        from the restored sources.
+
+        Parameters
+        ----------
+        state : `Dict[str, Any]`
+            The state to restore.
+
+        Raises
+        ------
+        ValueError
+            Raised if the state has been captured from a different graph.
+        """
         if not self.compiled:
             self.compile()
 
+        if state["fingerprint"] != self._fingerprint():
+            raise ValueError("The state has been captured from a different graph.")
+
+        for s, stream_state in zip(self.process, state["streams"]):
+            s.load_state_dict(stream_state)
+
+        if self._plan is not None:
+            live = set(self._plan.live)
+            for s in self.process:
+                if s not in live and not isinstance(s, IterableStream):
+                    s.reset()
+            self._plan.evaluate()
+            self._plan.advance(state["cursor"])
+
+        self._pending = copy.deepcopy(state["pending"])
+        self.value = copy.deepcopy(state["value"])
+
+    def _fingerprint(self) -> str:
+        """Computes a fingerprint of the compiled graph of the feed.
+
+        Generated names are not part of the fingerprint, since they differ
+        between identical graphs created one after another.
+
+        Returns
+        -------
+        str
+            A digest of the types of the streams in processing order and of
+            the positions of their inputs.
+        """
+        index = {s: i for i, s in enumerate(self.process)}
+        digest = hashlib.sha1()
         for s in self.process:
+            inputs = ",".join(str(index.get(i, -1)) for i in s.inputs)
+            digest.update("{}({});".format(type(s).__name__, inputs).encode())
+        return digest.hexdigest()
+
+    def _structure(self, output: "np.ndarray") -> "np.ndarray":
+        """Converts an array of values generated by the feed into a structured
+        array.
+
+        Parameters
+        ----------
+        output : `np.ndarray`
+            An array with one row per step and one column for each name in
+            `columns`.
+
+        Returns
+        -------
+        `np.ndarray`
+            A structured array with one field for each name in `columns`.
+        """
+        array = np.empty(len(output), dtype=[(name, output.dtype) for name, _ in self._leaves])
+        for j, (name, _) in enumerate(self._leaves):
+            array[name] = output[:, j]
+        return array
+
+    def _precomputed(self, live: "List[Stream]") -> "Optional[List[np.ndarray]]":
+        """Gets the precomputed columns of the batch plan for all columns of
+        the feed, if they can be copied without stepping through the graph.
+
+        Parameters
+        ----------
+        live : `List[Stream]`
+            The streams that would be run on each step.
+
+        Returns
+        -------
+        `List[np.ndarray]`, optional
+            The columns, or None if the feed has to be stepped through.
+        """
+        if self._plan is None or self._plan.observed or len(live) > 0 or len(self._groups) > 0:
+            return None
+
+        columns = [self._plan.column(s) for _, s in self._leaves]
+        if any(c is None for c in columns):
+            return None
+        return columns
+
+    def _step(self, live: "List[Stream]") -> None:
+        """Advances the streams of the feed by one step.
+
+        Parameters
+        ----------
+        live : `List[Stream]`
+            The streams to run on this step.
+        """
+        if self.profiler is None:
+            if self._plan is not None:
+                self._plan.run()
+            if self._scheduler is None:
+                for s in live:
+                    s.run()
+            else:
+                self._scheduler.run(live)
+        else:
+            if self._plan is not None:
+                start = time.perf_counter_ns()
+                self._plan.run()
+                self.profiler.record(self._plan, time.perf_counter_ns() - start)
+            self._profiled_run(live)
+
+        if len(self._groups) > 0:
+            self._pending += [tuple(s.value for s in self._boundary)]
+            if self.max_pending is not None and len(self._pending) > self.max_pending:
+                self._catch_up(len(self._pending) - self.max_pending)
+
+    def _profiled_run(self, streams: "List[Stream]") -> None:
+        """Runs streams once while recording the time spent in each of them.
+
+        Parameters
+        ----------
+        streams : `List[Stream]`
+            The streams to run, in processing order.
+        """
+        clock = time.perf_counter_ns
+        record = self.profiler.record
+        for s in streams:
+            start = clock()
             s.run()
+            record(s, clock() - start, s.value)
+
+    def _flatten(self, edges: "List[Tuple[Stream, Stream]]") -> None:
+        """Finds the streams generating the columns of the feed and the groups
+        that do not have to be run when the feed is advanced by `run_batch`.
+
+        Parameters
+        ----------
+        edges : `List[Tuple[Stream, Stream]]`
+            The edges of the graph.
+        """
+        consumers = {}
+        for s, t in edges:
+            consumers.setdefault(s, []).append(t)
+
+        self._skip = set()
+        for s in reversed(self._eager):
+            if isinstance(s, Group) and len(s.listeners) == 0 and \
+                    all(t is self or t in self._skip for t in consumers.get(s, [])):
+                self._skip.add(s)
+
+        def flatten(stream: "Stream", prefix: str) -> "List[Tuple[str, Stream]]":
+            if isinstance(stream, Group):
+                prefix = prefix + stream.name + ":/"
+                return [leaf for s in stream.inputs for leaf in flatten(s, prefix)]
+            return [(prefix + stream.name, stream)]
+
+        self._leaves = [leaf for s in self.inputs if s not in self._groups for leaf in flatten(s, "")]
+
+    def flush(self) -> "List[dict]":
+        """Evaluates the lazy groups of the feed for every step generated since
+        the last flush.
+
+        Returns
+        -------
+        `List[dict]`
+            For each pending step, the values of the lazy groups by name.
+        """
+        return self._catch_up(len(self._pending))
+
+    def _catch_up(self, n: int) -> "List[dict]":
+        """Runs the lazy streams on the oldest pending steps.
+
+        Parameters
+        ----------
+        n : int
+            The number of pending steps to run.
+
+        Returns
+        -------
+        `List[dict]`
+            For each step run, the values of the lazy groups by name.
+        """
+        outputs = []
+        if n == 0:
+            return outputs
+
+        current = [s.value for s in self._boundary]
+        for values in self._pending[:n]:
+            for s, v in zip(self._boundary, values):
+                s.value = v
+            if self.profiler is not None:
+                self._profiled_run(self._lazy)
+            else:
+                for s in self._lazy:
+                    s.run()
+            outputs += [{g.name: g.value for g in self._groups}]
+
+        for s, v in zip(self._boundary, current):
+            s.value = v
+        del self._pending[:n]
+
+        return outputs
+
+    @staticmethod
+    def _ancestors(streams: "List[Stream]") -> "set":
+        """Finds the streams needed to evaluate the given streams.
+
+        Parameters
+        ----------
+        streams : `List[Stream]`
+            The streams to evaluate.
+
+        Returns
+        -------
+        set
+            The given streams and all the streams they depend on.
+        """
+        found = set()
+        stack = list(streams)
+        while len(stack) > 0:
+            s = stack.pop()
+            if s not in found:
+                found.add(s)
+                stack += s.inputs
+        return found
+
+    def _isolate(self, edges: "List[Tuple[Stream, Stream]]") -> "List[Tuple[Stream, Stream]]":
+        """Gives the streams only needed by lazy groups a history of their own
+        where they share one with the streams run on every step.
+
+        A shared history is advanced on every step, while the lazy streams
+        reading it are only run when the feed is flushed, by which time it no
+        longer holds the values of the steps they catch up on. The lazy
+        consumers are rewired in place to a new history of the same input.
+
+        Parameters
+        ----------
+        edges : `List[Tuple[Stream, Stream]]`
+            The edges of the graph.
+
+        Returns
+        -------
+        `List[Tuple[Stream, Stream]]`
+            The edges of the graph after rewiring.
+        """
+        groups = [s for s in self.inputs if isinstance(s, Group) and s.lazy]
+        if len(groups) == 0:
+            return edges
+        eager = self._ancestors([s for s in self.inputs if s not in groups])
+
+        consumers = {}
+        for s, t in edges:
+            if isinstance(s, History) and s in eager and t not in eager:
+                consumers.setdefault(s, []).append(t)
+        if len(consumers) == 0:
+            return edges
+
+        for history, streams in consumers.items():
+            own = History(history.size, dtype=history.dtype)(*history.inputs)
+            for t in streams:
+                t.inputs = tuple(own if s is history else s for s in t.inputs)
+        return self.gather()
+
+    def _split(self, edges: "List[Tuple[Stream, Stream]]") -> None:
+        """Splits the streams to process into the ones run on every step and
+        the ones only needed by lazy groups.
+
+        Parameters
+        ----------
+        edges : `List[Tuple[Stream, Stream]]`
+            The edges of the graph.
+
+        Raises
+        ------
+        ValueError
+            Raised if a sensor or placeholder is only needed by lazy groups,
+            since its past values cannot be recovered.
+        """
+        self._groups = [s for s in self.inputs if isinstance(s, Group) and s.lazy]
+        eager = self._ancestors([s for s in self.inputs if s not in self._groups])
+
+        self._eager = [s for s in self.process if s in eager]
+        self._lazy = [s for s in self.process if s not in eager]
+
+        for s in self._lazy:
+            if isinstance(s, (Sensor, Placeholder)):
+                raise ValueError(f"Stream {s.name} cannot be evaluated lazily.")
+
+        lazy = set(self._lazy)
+        self._boundary = list(dict.fromkeys(s for s, t in edges if s in eager and t in lazy))
+        self._pending = []
+
+    def run(self) -> None:
+        """Runs all the streams in processing order."""
+        if not self.compiled:
+            self.compile()
+
+        self._step(self._eager if self._plan is None else self._plan.live)
 
         super().run()
 
     def forward(self) -> dict:
-        return {s.name: s.value for s in self.inputs}
+        return {s.name: s.value for s in self.inputs if s not in self._groups}
 
     def next(self) -> dict:
         self.run()
         return self.value
 
     def has_next(self) -> bool:
-        return all(s.has_next() for s in self.process)
+        if self._plan is None:
+            return all(s.has_next() for s in self._eager)
+        return self._plan.has_next() and all(s.has_next() for s in self._plan.live)
 
     def reset(self, random_start=0) -> None:
         for s in self.process:
@@ -61,6 +640,11 @@ class DataFeed(Stream[dict]):
             else:
                 s.reset()
 
+        self._pending = []
+
+        if self._plan is not None:
+            self._plan.evaluate()
+
 
 class PushFeed(DataFeed):
     """A data feed for working with live data in an online manner.
@@ -113,6 +697,60 @@ class PushFeed(DataFeed):
             s.value = None
         return output
 
+    def push_many(self,
+                  data: "Dict[str, Any]",
+                  dtype: "np.dtype" = np.float64,
+                  structured: bool = False) -> "np.ndarray":
+        """Generates the values from the data feed for several steps of data
+        at once.
+
+        The graph is stepped through the rows of `data` in a tight loop, so
+        the state of the streams afterwards is the same as after pushing the
+        rows one by one with `push`. The values are not passed to the
+        listeners of the feed.
+
+        Parameters
+        ----------
+        data : `Dict[str, Any]`
+            A column of values for each of the placeholders in the feed. All
+            columns must have the same length.
+        dtype : `np.dtype`, default np.float64
+            The data type of the array returned.
+        structured : bool, default False
+            Whether to return a structured array with one field per column
+            instead of a two dimensional array.
+
+        Returns
+        -------
+        `np.ndarray`
+            An array with one row per step and one column, or field, for each
+            name in `columns`.
+
+        Raises
+        ------
+        ValueError
+            Raised if the columns of `data` have different lengths.
+        """
+        columns = [(s, np.asarray(data[s.name]).tolist()) for s in self.start]
+        lengths = set(len(column) for _, column in columns)
+        if len(lengths) > 1:
+            raise ValueError("The columns pushed to the feed must have the same length.")
+        n = lengths.pop() if lengths else 0
+
+        streams = [s for _, s in self._leaves]
+        live = [s for s in self._eager if s not in self._skip]
+
+        output = np.empty((n, len(streams)), dtype=dtype)
+        for i in range(n):
+            for s, column in columns:
+                s.value = column[i]
+            self._step(live)
+            output[i] = [s.value for s in streams]
+
+        for s in self.start:
+            s.value = None
+        return self._structure(output) if structured else output
+
     def next(self) -> dict:
         if not self.is_loaded:
             raise Exception("No data has been pushed to the feed.")
@@ -0,0 +1,117 @@
+"""
+memmap.py contains the functions for reading the columns of memory-mapped
+files, which are used as the sources of streams created with `Stream.mmap`.
+"""
+
+import os
+from typing import Union
+
+import numpy as np
+
+
+def read_npy(path: str, column: "Union[int, str]" = None) -> "np.ndarray":
+    """Memory-maps a column of a `.npy` file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    column : Union[int, str], optional
+        The column to read. An index for two dimensional arrays, a field name
+        for structured arrays. Not needed for one dimensional arrays.
+
+    Returns
+    -------
+    `np.ndarray`
+        A read-only view of the column in the file.
+
+    Raises
+    ------
+    ValueError
+        Raised if `column` does not select a one dimensional column.
+    """
+    array = np.load(path, mmap_mode="r")
+
+    if array.dtype.names is not None:
+        if column is None:
+            raise ValueError("A field of the structured array in {} must be given.".format(path))
+        array = array[column]
+    elif array.ndim == 2:
+        if column is None:
+            raise ValueError("A column of the array in {} must be given.".format(path))
+        array = array[:, column]
+    elif column is not None:
+        raise ValueError("The array in {} has no columns.".format(path))
+
+    if array.ndim != 1:
+        raise ValueError("The column of {} is not one dimensional.".format(path))
+    return array
+
+
+def read_arrow(path: str, column: "Union[int, str]" = None) -> "np.ndarray":
+    """Memory-maps a column of an Arrow IPC or Feather file.
+
+    The column is only read without copying if it is not compressed, has no
+    missing values and is stored in a single chunk. Otherwise it is
+    converted into a new array.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    column : Union[int, str], optional
+        The name or index of the column to read. Not needed for files with a
+        single column.
+
+    Returns
+    -------
+    `np.ndarray`
+        The values of the column.
+
+    Raises
+    ------
+    ImportError
+        Raised if `pyarrow` is not installed.
+    ValueError
+        Raised if `column` is not given for a file with several columns.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Reading Arrow files requires pyarrow to be installed.") from e
+
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+    if column is None:
+        if table.num_columns != 1:
+            raise ValueError("A column of the table in {} must be given.".format(path))
+        column = 0
+
+    chunked = table.column(column)
+    if chunked.num_chunks == 1 and chunked.null_count == 0:
+        try:
+            return chunked.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            pass
+    return chunked.to_numpy()
+
+
+def read_column(path: str, column: "Union[int, str]" = None) -> "np.ndarray":
+    """Memory-maps a column of a `.npy`, Arrow IPC or Feather file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file. Files ending in `.npy` are read with NumPy, all
+        other files as Arrow IPC files.
+    column : Union[int, str], optional
+        The column to read.
+
+    Returns
+    -------
+    `np.ndarray`
+        The values of the column.
+    """
+    if os.fspath(path).endswith(".npy"):
+        return read_npy(path, column)
+    return read_arrow(path, column)
@@ -4,6 +4,8 @@ from typing import List, Callable
 
 class DataTypeMixin:
 
+    __slots__ = ()
+
     @classmethod
     def register_method(cls, func: "Callable", names: "List[str]"):
         """Injects methods into a specific stream instance.
@@ -1,10 +1,13 @@
 
-from typing import Callable, TypeVar
+import weakref
+from collections import deque
+from typing import Callable, List, TypeVar
 
 
 import numpy as np
 
 from tensortrade.feed.core.base import Stream, T
+from tensortrade.feed.core.batch import as_column
 
 
 K = TypeVar("K")
@@ -22,6 +25,10 @@ class Apply(Stream[K]):
         The data type of the values after function is applied.
     """
 
+    __slots__ = ("func",)
+
+    pure = True
+
     def __init__(self,
                  func: Callable[[T], K],
                  dtype: str = None) -> None:
@@ -32,13 +39,141 @@ class Apply(Stream[K]):
         node = self.inputs[0]
         return self.func(node.value)
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if isinstance(self.func, np.ufunc):
+            return self.func(values)
+        return as_column([self.func(v) for v in values])
+
     def has_next(self) -> bool:
         return True
 
 
+class History(Stream[T]):
+    """An operator stream that keeps the latest values of a given stream.
+
+    The lags and rolling windows over the same stream share one history,
+    which is sized to the longest lookback of its consumers. The values are
+    kept in a ring buffer holding every value twice, so any window of the
+    latest values is a contiguous view of the buffer. The value of the
+    stream is the value of its input.
+
+    Parameters
+    ----------
+    size : int, default 1
+        The number of latest values to keep.
+    dtype : str, optional
+        The data type of the stream
+    """
+
+    __slots__ = ("size", "n", "buffer")
+
+    generic_name = "history"
+    _state_attrs = ("n", "buffer")
+
+    _shared = weakref.WeakKeyDictionary()
+
+    def __init__(self,
+                 size: int = 1,
+                 dtype: str = None) -> None:
+        super().__init__(dtype=dtype)
+        self.size = size
+        self.n = 0
+        self.buffer = np.full(2 * size, np.nan)
+
+    @staticmethod
+    def of(stream: "Stream[T]") -> "History[T]":
+        """Gets the history shared by the consumers of a stream.
+
+        Parameters
+        ----------
+        stream : `Stream[T]`
+            The stream to get the history of.
+
+        Returns
+        -------
+        `History[T]`
+            The history of `stream`, created on first use.
+        """
+        ref = History._shared.get(stream)
+        history = ref() if ref is not None else None
+        if history is None:
+            history = History(dtype=stream.dtype)(stream)
+            History._shared[stream] = weakref.ref(history)
+        return history
+
+    def require(self, size: int) -> None:
+        """Grows the history to keep at least `size` values.
+
+        Parameters
+        ----------
+        size : int
+            The number of latest values to keep.
+        """
+        if size <= self.size:
+            return
+        kept = self.latest(min(self.n, self.size))[::-1]
+        positions = np.arange(self.n - len(kept), self.n) % size
+
+        self.buffer = np.full(2 * size, np.nan)
+        self.buffer[positions] = kept
+        self.buffer[positions + size] = kept
+        self.size = size
+
+    def get(self, k: int) -> float:
+        """Gets the value `k` steps before the current one.
+
+        Parameters
+        ----------
+        k : int
+            The number of steps to look back, less than the number of values
+            kept.
+
+        Returns
+        -------
+        float
+            The value `k` steps back.
+        """
+        return self.buffer.item((self.n - 1 - k) % self.size)
+
+    def latest(self, m: int) -> "np.ndarray":
+        """Gets a view of the latest `m` values, newest value first.
+
+        The view is overwritten by the next step.
+
+        Parameters
+        ----------
+        m : int
+            The number of values, at most the number of values kept.
+
+        Returns
+        -------
+        `np.ndarray`
+            The latest `m` values.
+        """
+        end = (self.n - 1) % self.size + self.size + 1
+        return self.buffer[end - m:end][::-1]
+
+    def forward(self) -> T:
+        value = self.inputs[0].value
+        i = self.n % self.size
+        self.buffer[i] = self.buffer[i + self.size] = np.nan if value is None else value
+        self.n += 1
+        return value
+
+    def has_next(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.n = 0
+        super().reset()
+
+
 class Lag(Stream[T]):
     """An operator stream that returns the lagged value of a given stream.
 
+    If the input is a `History`, the lagged values are read from it instead of
+    being kept by the stream.
+
     Parameters
     ----------
     lag : int
@@ -47,7 +182,11 @@ class Lag(Stream[T]):
         The data type of the stream
     """
 
+    __slots__ = ("lag", "runs", "history")
+
     generic_name = "lag"
+    reads_state = True
+    _state_attrs = ("runs", "history")
 
     def __init__(self,
                  lag: int = 1,
@@ -55,24 +194,48 @@ class Lag(Stream[T]):
         super().__init__(dtype=dtype)
         self.lag = lag
         self.runs = 0
-        self.history = []
+        self.history = deque()
+
+    def __call__(self, *inputs) -> "Stream[T]":
+        if isinstance(inputs[0], History):
+            inputs[0].require(self.lag + 1)
+        return super().__call__(*inputs)
 
     def forward(self) -> T:
         node = self.inputs[0]
+        if isinstance(node, History):
+            return node.get(self.lag) if node.n > self.lag else np.nan
+
+        self.history.append(node.value)
         if self.runs < self.lag:
             self.runs += 1
-            self.history.insert(0, node.value)
             return np.nan
-
-        self.history.insert(0, node.value)
-        return self.history.pop()
+        return self.history.popleft()
+
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if values.dtype.kind in "biuf":
+            lagged = np.empty(len(values), dtype=np.result_type(values.dtype, np.float64))
+        else:
+            lagged = np.empty(len(values), dtype=object)
+        lag = min(self.lag, len(values))
+        lagged[:lag] = np.nan
+        lagged[lag:] = values[:len(values) - lag]
+        return lagged
+
+    def batch_inputs(self) -> "List[Stream]":
+        node = self.inputs[0]
+        if isinstance(node, History):
+            return list(node.inputs)
+        return [node]
 
     def has_next(self) -> bool:
         return True
 
     def reset(self) -> None:
+        if isinstance(self.inputs[0], History):
+            self.inputs[0].require(self.lag + 1)
         self.runs = 0
-        self.history = []
+        self.history = deque()
 
 
 class Accumulator(Stream[T]):
@@ -86,6 +249,9 @@ class Accumulator(Stream[T]):
         The data type of accumulated value.
     """
 
+    __slots__ = ("func", "past")
+    _state_attrs = ("past",)
+
     def __init__(self,
                  func: "Callable[[T, T], T]",
                  dtype: str = None) -> None:
@@ -102,6 +268,16 @@ class Accumulator(Stream[T]):
         self.past = v
         return v
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if isinstance(self.func, np.ufunc) and values.dtype.kind in "iuf":
+            return self.func.accumulate(values)
+        accumulated = []
+        past = None
+        for v in values:
+            past = v if past is None else self.func(past, v)
+            accumulated += [past]
+        return as_column(accumulated)
+
     def has_next(self) -> bool:
         return True
 
@@ -112,7 +288,10 @@ class Accumulator(Stream[T]):
 class Copy(Stream[T]):
     """A stream operator that copies the values of a given stream."""
 
+    __slots__ = ()
+
     generic_name = "copy"
+    pure = True
 
     def __init__(self) -> None:
         super().__init__()
@@ -120,6 +299,9 @@ class Copy(Stream[T]):
     def forward(self) -> T:
         return self.inputs[0].value
 
+    def forward_batch(self, values: "np.ndarray") -> "np.ndarray":
+        return values
+
     def has_next(self) -> bool:
         return True
 
@@ -128,7 +310,10 @@ class Freeze(Stream[T]):
     """A stream operator that freezes the value of a given stream and generates
     that value."""
 
+    __slots__ = ("freeze_value",)
+
     generic_name = "freeze"
+    _state_attrs = ("freeze_value",)
 
     def __init__(self) -> None:
         super().__init__()
@@ -159,7 +344,10 @@ class BinOp(Stream[T]):
         The data type of the stream.
     """
 
+    __slots__ = ("op",)
+
     generic_name = "bin_op"
+    pure = True
 
     def __init__(self,
                  op: Callable[[T, T], T],
@@ -170,5 +358,10 @@ class BinOp(Stream[T]):
     def forward(self) -> T:
         return self.op(self.inputs[0].value, self.inputs[1].value)
 
+    def forward_batch(self, left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        if isinstance(self.op, np.ufunc):
+            return self.op(left, right)
+        return as_column([self.op(a, b) for a, b in zip(left, right)])
+
     def has_next(self) -> bool:
         return True
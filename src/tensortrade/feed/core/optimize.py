@@ -0,0 +1,217 @@
+"""
+optimize.py contains the optimization passes that can be run on the graph of a
+`DataFeed` before it is compiled.
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from tensortrade.feed.core.base import Stream, Group, Constant
+from tensortrade.feed.core.mixins import DataTypeMixin
+
+
+@dataclass
+class OptimizationReport:
+    """The outcome of optimizing the graph of a `DataFeed`.
+
+    Parameters
+    ----------
+    nodes_before : int
+        The number of streams in the graph before the optimization.
+    nodes_after : int
+        The number of streams in the graph after the optimization.
+    merged : int
+        The number of streams that were replaced by an identical stream.
+    folded : int
+        The number of streams that were replaced by a constant.
+    """
+
+    nodes_before: int = 0
+    nodes_after: int = 0
+    merged: int = 0
+    folded: int = 0
+
+    @property
+    def removed(self) -> int:
+        """The number of streams removed from the graph. (`int`, read-only)"""
+        return self.nodes_before - self.nodes_after
+
+
+def base_class(stream: "Stream") -> type:
+    """Gets the class of a stream without the data type mixins injected into it.
+
+    Parameters
+    ----------
+    stream : `Stream`
+        The stream to get the class of.
+
+    Returns
+    -------
+    type
+        The class the stream has been created from.
+    """
+    cls = type(stream)
+    while len(cls.__bases__) == 2 and issubclass(cls.__bases__[1], DataTypeMixin):
+        cls = cls.__bases__[0]
+    return cls
+
+
+def freeze(value: "Any") -> "Hashable":
+    """Converts a parameter of a stream into a hashable representation.
+
+    Parameters
+    ----------
+    value : `Any`
+        The parameter to convert.
+
+    Returns
+    -------
+    `Hashable`
+        A representation of `value` that is only equal to the representation
+        of equal parameters of the same type.
+
+    Raises
+    ------
+    TypeError
+        Raised if `value` cannot be represented.
+    """
+    if isinstance(value, functools.partial):
+        return functools.partial, freeze(value.func), freeze(value.args), freeze(value.keywords)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    hash(value)
+    return type(value), value
+
+
+def signature(stream: "Stream") -> "Optional[Hashable]":
+    """Computes the signature of a stream.
+
+    Two streams with equal signatures generate the same values. Streams that
+    generate their values from outside of the graph (e.g. sources, sensors and
+    placeholders) as well as groups do not have a signature, except for
+    constants.
+
+    Parameters
+    ----------
+    stream : `Stream`
+        The stream to compute the signature of.
+
+    Returns
+    -------
+    `Hashable`, optional
+        The signature of the stream, or None if the stream cannot be merged
+        with other streams.
+    """
+    arguments = stream._arguments()
+    if isinstance(stream, Group) or arguments is None:
+        return None
+    if len(stream.inputs) == 0 and not isinstance(stream, Constant):
+        return None
+
+    args, kwargs = arguments
+    try:
+        params = freeze(args), freeze(dict(kwargs))
+    except TypeError:
+        return None
+    return base_class(stream), stream.dtype, params, tuple(stream.inputs)
+
+
+def fold(stream: "Stream") -> "Optional[Stream]":
+    """Replaces a pure stream with constant inputs by a constant.
+
+    Parameters
+    ----------
+    stream : `Stream`
+        The stream to fold.
+
+    Returns
+    -------
+    `Stream`, optional
+        A constant stream generating the value of `stream`, or None if the
+        stream cannot be folded.
+    """
+    if not stream.pure or len(stream.inputs) == 0:
+        return None
+    if not all(isinstance(s, Constant) for s in stream.inputs):
+        return None
+
+    for s in stream.inputs:
+        s.value = s.forward()
+    value = stream.forward()
+    for s in stream.inputs:
+        s.value = None
+
+    constant = Constant(value, dtype=stream.dtype)
+    constant.name = stream.name
+    return constant
+
+
+def optimize(root: "Stream", edges: "List[Tuple[Stream, Stream]]") -> "OptimizationReport":
+    """Optimizes the graph connected in ancestry with a stream.
+
+    The graph is rewired in place. Streams are visited in processing order and
+
+    1. pure streams depending only on constants are replaced by a constant,
+    2. streams identical to a previously visited stream, i.e. having the same
+       class, data type, parameters and inputs, are replaced by that stream.
+
+    Streams that are no longer used after the rewiring drop out of the graph
+    the next time it is gathered. The inputs of `root`, the members of groups
+    and streams with listeners are never replaced, since their names or
+    values are read from outside of the graph.
+
+    Parameters
+    ----------
+    root : `Stream`
+        The stream the graph has been gathered from.
+    edges : `List[Tuple[Stream, Stream]]`
+        The edges of the graph.
+
+    Returns
+    -------
+    `OptimizationReport`
+        The report of the optimization.
+    """
+    report = OptimizationReport()
+
+    protected = set()  # type: Set[Stream]
+    for s, t in edges:
+        if t is root or isinstance(t, Group):
+            protected.add(s)
+
+    process = Stream.toposort(edges)
+    report.nodes_before = len(process)
+
+    replacement = {}  # type: Dict[Stream, Stream]
+    streams = {}  # type: Dict[Hashable, Stream]
+
+    for s in process:
+        if any(i in replacement for i in s.inputs):
+            s.inputs = tuple(replacement.get(i, i) for i in s.inputs)
+
+        if s in protected or len(s.listeners) > 0:
+            key = signature(s)
+            if key is not None:
+                streams.setdefault(key, s)
+            continue
+
+        node = fold(s)
+        if node is not None:
+            replacement[s] = node
+            report.folded += 1
+        else:
+            node = s
+
+        key = signature(node)
+        if key is None:
+            continue
+        if key in streams:
+            replacement[s] = streams[key]
+            report.merged += int(node is s)
+        else:
+            streams[key] = node
+
+    return report
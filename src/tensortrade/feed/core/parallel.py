@@ -0,0 +1,138 @@
+"""
+parallel.py contains the scheduler running the independent streams of a
+`DataFeed` on a thread pool.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from tensortrade.feed.core.base import Stream
+
+
+class LevelScheduler:
+    """Runs the streams of a graph level by level, with the expensive streams
+    of each level running concurrently on a thread pool.
+
+    The level of a stream is one more than the highest level of its inputs,
+    so the streams of a level never depend on each other. The cost of each
+    stream is measured while the first `calibration` steps run sequentially.
+    Afterwards, the streams taking at least `threshold` seconds per step on
+    average are run on the pool, while all other streams stay on the calling
+    thread. Only the `forward` method runs on the pool; the values are
+    stored and passed to the listeners on the calling thread.
+
+    This pays off for streams that release the GIL, e.g. large NumPy
+    computations, and for streams waiting on I/O.
+
+    Parameters
+    ----------
+    workers : int
+        The number of threads of the pool.
+    threshold : float
+        The mean time in seconds per step from which a stream is run on the
+        pool.
+    calibration : int
+        The number of steps used to measure the cost of the streams.
+    """
+
+    def __init__(self, workers: int, threshold: float, calibration: int) -> None:
+        self.workers = workers
+        self.threshold = threshold
+        self.calibration = calibration
+
+        self.costs = {}  # type: Dict[Stream, List[int]]
+        self._steps = 0
+        self._schedules = {}  # type: Dict[Tuple[Stream, ...], List[Tuple[List[Stream], List[Stream]]]]
+        self._pool = None
+
+    def run(self, streams: "List[Stream]") -> None:
+        """Runs the streams once.
+
+        Parameters
+        ----------
+        streams : `List[Stream]`
+            The streams to run, in processing order.
+        """
+        if self._steps < self.calibration:
+            self._calibrate(streams)
+            return
+
+        key = tuple(streams)
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            schedule = self._schedules[key] = self.schedule(streams)
+
+        for inline, heavy in schedule:
+            futures = [self._pool.submit(s.forward) for s in heavy]
+            for s in inline:
+                s.run()
+            for s, future in zip(heavy, futures):
+                s.value = future.result()
+                for listener in s.listeners:
+                    listener.on_next(s.value)
+
+    def schedule(self, streams: "List[Stream]") -> "List[Tuple[List[Stream], List[Stream]]]":
+        """Groups streams into levels and splits each level by cost.
+
+        One expensive stream of each level stays on the calling thread, which
+        runs it after the cheap streams of the level. Consecutive levels
+        without streams for the pool are merged.
+
+        Parameters
+        ----------
+        streams : `List[Stream]`
+            The streams to group, in processing order.
+
+        Returns
+        -------
+        `List[Tuple[List[Stream], List[Stream]]]`
+            For each group of levels, the streams to run on the calling thread
+            and the streams to run on the pool at the same time.
+        """
+        levels = {}  # type: Dict[Stream, int]
+        for s in streams:
+            levels[s] = max([levels[i] + 1 for i in s.inputs if i in levels], default=0)
+
+        split = [([], []) for _ in range(max(levels.values(), default=-1) + 1)]
+        for s in streams:
+            calls, elapsed = self.costs.get(s, (0, 0))
+            heavy = calls > 0 and elapsed / calls >= self.threshold * 1e9
+            split[levels[s]][int(heavy)].append(s)
+
+        schedule = []
+        for inline, heavy in split:
+            inline, heavy = inline + heavy[:1], heavy[1:]
+            if len(heavy) == 0 and len(schedule) > 0 and len(schedule[-1][1]) == 0:
+                schedule[-1][0].extend(inline)
+            else:
+                schedule += [(inline, heavy)]
+
+        if any(len(heavy) > 0 for _, heavy in schedule) and self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="feed")
+        return schedule
+
+    def shutdown(self) -> None:
+        """Shuts the thread pool down."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _calibrate(self, streams: "List[Stream]") -> None:
+        """Runs the streams sequentially while measuring their cost.
+
+        Parameters
+        ----------
+        streams : `List[Stream]`
+            The streams to run, in processing order.
+        """
+        clock = time.perf_counter_ns
+        for s in streams:
+            start = clock()
+            s.run()
+            cost = self.costs.get(s)
+            if cost is None:
+                cost = self.costs[s] = [0, 0]
+            cost[0] += 1
+            cost[1] += clock() - start
+        self._steps += 1
@@ -0,0 +1,100 @@
+"""
+profiler.py contains the profiler recording the time spent in each stream
+of a `DataFeed`.
+"""
+
+from typing import Dict, List
+
+import pandas as pd
+
+from tensortrade.feed.core.base import Stream
+from tensortrade.feed.core.optimize import base_class
+
+
+class FeedProfiler:
+    """Records the number of calls, the wall time and the number of missing
+    values for each stream run by a `DataFeed`.
+
+    A profiler is created and attached to a feed by `DataFeed.profile`.
+
+    Attributes
+    ----------
+    stats : `Dict[object, List[int]]`
+        The number of calls, the time in nanoseconds and the number of NaN
+        values for each stream, or for the batch plan of the feed.
+    """
+
+    def __init__(self) -> None:
+        self.stats = {}  # type: Dict[object, List[int]]
+
+    def record(self, node: "object", elapsed: int, value: "object" = None) -> None:
+        """Records a single run of a stream.
+
+        Parameters
+        ----------
+        node : object
+            The stream, or the batch plan, that has been run.
+        elapsed : int
+            The time the run took in nanoseconds.
+        value : object, optional
+            The value generated by the run.
+        """
+        stats = self.stats.get(node)
+        if stats is None:
+            stats = self.stats[node] = [0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        if isinstance(value, float) and value != value:
+            stats[2] += 1
+
+    def reset(self) -> None:
+        """Discards all recorded runs."""
+        self.stats = {}
+
+    def to_frame(self, by: str = "name") -> "pd.DataFrame":
+        """Summarizes the recorded runs.
+
+        Parameters
+        ----------
+        by : {"name", "operator"}, default "name"
+            Whether to summarize the runs for each stream by its name and
+            operator class, or for each operator class.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The number of calls, the total and mean time in seconds and the
+            number of NaN values, sorted by the total time.
+        """
+        if by not in ("name", "operator"):
+            raise ValueError("Cannot summarize the runs by {}.".format(by))
+
+        rows = []
+        for node, (calls, elapsed, nans) in self.stats.items():
+            if isinstance(node, Stream):
+                name, operator = node.name, base_class(node).__name__
+            else:
+                name, operator = "batch", type(node).__name__
+            rows += [{"name": name, "operator": operator, "calls": calls, "time": elapsed / 1e9, "nans": nans}]
+
+        columns = ["name", "operator"] if by == "name" else ["operator"]
+        frame = pd.DataFrame(rows, columns=["name", "operator", "calls", "time", "nans"])
+        frame = frame.groupby(columns, as_index=False)[["calls", "time", "nans"]].sum()
+        frame.insert(frame.columns.get_loc("time") + 1, "mean_time", frame["time"] / frame["calls"])
+        return frame.sort_values("time", ascending=False, ignore_index=True)
+
+    def table(self, by: str = "name") -> str:
+        """Summarizes the recorded runs as a table.
+
+        Parameters
+        ----------
+        by : {"name", "operator"}, default "name"
+            Whether to summarize the runs for each stream or for each operator
+            class.
+
+        Returns
+        -------
+        str
+            The summary of `to_frame` formatted as a table.
+        """
+        return self.to_frame(by=by).to_string(index=False)
@@ -0,0 +1,344 @@
+"""
+serialize.py contains the functions for describing the compiled graph of a
+`DataFeed` as a spec, rebuilding feeds from specs without compiling them
+again, and caching specs on disk.
+"""
+
+import hashlib
+import importlib
+import os
+import pickle
+import tempfile
+from typing import Any, Dict
+
+import numpy as np
+
+from tensortrade.feed.core.base import Group
+from tensortrade.feed.core.feed import DataFeed
+from tensortrade.feed.core.optimize import base_class
+
+
+def to_spec(feed: "DataFeed") -> "Dict[str, Any]":
+    """Describes the compiled graph of a feed.
+
+    Every stream is described by the path of its class, the arguments it has
+    been created with, its data type, its name and the positions of its
+    inputs. The streams are listed in processing order, together with the
+    edges of the graph, so the feed can be rebuilt by `from_spec` without
+    gathering and sorting the graph again. Sources keep their data, except
+    for the sources created with `Stream.mmap`, which refer to their file by
+    path and column. Listeners attached to the streams are not part of the
+    spec.
+
+    Parameters
+    ----------
+    feed : `DataFeed`
+        The feed to describe. It is compiled first if it has not been yet.
+
+    Returns
+    -------
+    `Dict[str, Any]`
+        The spec of the feed.
+
+    Raises
+    ------
+    ValueError
+        Raised if a stream is an instance of a class that cannot be imported,
+        e.g. a class defined inside a function, or if the arguments a stream
+        has been created with are not known.
+    """
+    if not feed.compiled:
+        feed.compile()
+
+    index = {s: i for i, s in enumerate(feed.process)}
+    index[feed] = len(feed.process)
+
+    nodes = []
+    for s in feed.process:
+        cls = base_class(s)
+        if "<locals>" in cls.__qualname__:
+            raise ValueError(f"Stream {s.name} of local class {cls.__qualname__} cannot be described.")
+        arguments = s._arguments()
+        if arguments is None:
+            raise ValueError(f"The arguments of stream {s.name} are not known.")
+        args, kwargs = arguments
+        nodes += [{
+            "type": cls.__module__ + ":" + cls.__qualname__,
+            "args": args,
+            "kwargs": dict(kwargs),
+            "dtype": s.dtype,
+            "name": s.name,
+            "inputs": [index[i] for i in s.inputs]
+        }]
+
+    return {
+        "version": 1,
+        "nodes": nodes,
+        "edges": [(index[s], index[t]) for s, t in feed.gather()],
+        "outputs": [index[s] for s in feed.inputs],
+        "options": {
+            "batch": feed.batch,
+            "optimize": feed.optimize,
+            "workers": feed.workers,
+            "threshold": feed.threshold
+        }
+    }
+
+
+def from_spec(spec: "Dict[str, Any]") -> "DataFeed":
+    """Rebuilds a feed from a spec created by `to_spec`.
+
+    The streams are created in the stored processing order and the feed is
+    compiled with the stored options, skipping `gather`, `toposort` and the
+    optimization of the graph.
+
+    Parameters
+    ----------
+    spec : `Dict[str, Any]`
+        The spec of the feed.
+
+    Returns
+    -------
+    `DataFeed`
+        The compiled feed.
+    """
+    process = []
+    for node in spec["nodes"]:
+        cls = _resolve(node["type"])
+        s = cls(*node["args"], **node["kwargs"])
+        if node["dtype"] is not None and s.dtype != node["dtype"]:
+            s.astype(node["dtype"])
+        s.name = node["name"]
+        if len(node["inputs"]) > 0:
+            s(*[process[i] for i in node["inputs"]])
+        process += [s]
+
+    feed = DataFeed([process[i] for i in spec["outputs"]])
+    nodes = process + [feed]
+
+    options = spec["options"]
+    feed.process = process
+    feed.optimize = options["optimize"]
+    feed._build(
+        [(nodes[s], nodes[t]) for s, t in spec["edges"]],
+        options["batch"],
+        options["workers"],
+        options["threshold"]
+    )
+    return feed
+
+
+def _resolve(path: str) -> type:
+    """Imports the class of a stream from its path in a spec.
+
+    Parameters
+    ----------
+    path : str
+        The path of the class, e.g. `module:Class`.
+
+    Returns
+    -------
+    type
+        The class.
+    """
+    module, qualname = path.split(":")
+    cls = importlib.import_module(module)
+    for attr in qualname.split("."):
+        cls = getattr(cls, attr)
+    return cls
+
+
+def _serialize(spec: "Dict[str, Any]") -> bytes:
+    """Pickles a spec after checking that the arguments of every stream can
+    be pickled."""
+    for node in spec["nodes"]:
+        try:
+            pickle.dumps((node["args"], node["kwargs"]))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(f"Stream {node['name']} cannot be serialized: {e}") from e
+    return pickle.dumps(spec)
+
+
+def dumps(feed: "DataFeed") -> bytes:
+    """Serializes the spec of a feed with `pickle`.
+
+    Parameters
+    ----------
+    feed : `DataFeed`
+        The feed to serialize.
+
+    Returns
+    -------
+    bytes
+        The serialized spec.
+
+    Raises
+    ------
+    ValueError
+        Raised if a stream has been created with arguments that cannot be
+        pickled, e.g. a lambda.
+    """
+    return _serialize(to_spec(feed))
+
+
+def loads(data: bytes) -> "DataFeed":
+    """Rebuilds a feed serialized by `dumps`.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized spec.
+
+    Returns
+    -------
+    `DataFeed`
+        The compiled feed.
+    """
+    return from_spec(pickle.loads(data))
+
+
+def graph_hash(spec: "Dict[str, Any]") -> str:
+    """Computes a structural hash of a spec.
+
+    The hash covers the types, arguments, data types and inputs of the
+    streams, the edges and options of the feed and the names of the values
+    it generates. The names of the other streams are left out, since
+    generated names differ between identical graphs. Arrays given as
+    arguments are hashed by their contents without being pickled, and the
+    sources created with `Stream.mmap` by the path and column of their file,
+    so hashing never reads a memory-mapped file.
+
+    Parameters
+    ----------
+    spec : `Dict[str, Any]`
+        The spec to hash.
+
+    Returns
+    -------
+    str
+        A digest of the structure of the spec.
+    """
+    nodes = spec["nodes"]
+
+    named = set()
+    stack = list(spec["outputs"])
+    while len(stack) > 0:
+        i = stack.pop()
+        if i not in named:
+            named.add(i)
+            if issubclass(_resolve(nodes[i]["type"]), Group):
+                stack += nodes[i]["inputs"]
+
+    digest = hashlib.sha1()
+    for i, node in enumerate(nodes):
+        digest.update("{}:{}:{}:{}(".format(
+            node["type"], node["dtype"], node["name"] if i in named else "", node["inputs"]
+        ).encode())
+        for value in list(node["args"]) + sorted(node["kwargs"].items()):
+            _update(digest, value)
+        digest.update(b");")
+    digest.update(pickle.dumps((spec["version"], spec["edges"], spec["outputs"], spec["options"])))
+    return digest.hexdigest()
+
+
+def _update(digest: "Any", value: "Any") -> None:
+    """Adds an argument of a stream to a digest, hashing arrays and series by
+    their contents."""
+    if hasattr(value, "to_numpy") and not isinstance(value, np.ndarray):
+        value = value.to_numpy()
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biufcmM":
+        digest.update("array({}, {})".format(value.dtype.str, value.shape).encode())
+        digest.update(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+    elif isinstance(value, (list, tuple)) and any(isinstance(v, np.ndarray) for v in value):
+        for v in value:
+            _update(digest, v)
+    else:
+        digest.update(pickle.dumps(value))
+
+
+class GraphCache:
+    """A directory of serialized feeds keyed by the structural hash of their
+    spec (see `graph_hash`).
+
+    A feed built once, e.g. by the driver of a distributed job, is stored
+    with `save`. Worker processes then `load` the feed by its key instead of
+    building and compiling the graph again. Sources created with
+    `Stream.mmap` are stored as references to their files, which have to be
+    readable by the workers under the same path.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the cache. It is created if it does not exist.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Gets the path of the file of a cached feed.
+
+        Parameters
+        ----------
+        key : str
+            The key of the feed.
+
+        Returns
+        -------
+        str
+            The path of the file.
+        """
+        return os.path.join(self.directory, key + ".graph")
+
+    def save(self, feed: "DataFeed") -> str:
+        """Stores a feed in the cache.
+
+        The file is replaced atomically, so processes loading the same key
+        concurrently never read a partial file.
+
+        Parameters
+        ----------
+        feed : `DataFeed`
+            The feed to store.
+
+        Returns
+        -------
+        str
+            The key of the feed.
+        """
+        spec = to_spec(feed)
+        key = graph_hash(spec)
+        if key not in self:
+            data = _serialize(spec)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path(key))
+        return key
+
+    def load(self, key: str) -> "DataFeed":
+        """Rebuilds a feed stored in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the feed.
+
+        Returns
+        -------
+        `DataFeed`
+            The compiled feed.
+
+        Raises
+        ------
+        KeyError
+            Raised if no feed is stored under `key`.
+        """
+        if key not in self:
+            raise KeyError(key)
+        with open(self.path(key), "rb") as f:
+            return loads(f.read())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
@@ -1,10 +1,11 @@
+import numpy as np
 import pandas as pd
 import pytest
 import ta
 
 from tensortrade.env import TradingEnv
 from tensortrade.env.actions import ManagedRiskOrders
-from tensortrade.env.observers import WindowObserver
+from tensortrade.env.observers import SimpleObserver, WindowObserver
 from tensortrade.env.rewards import SimpleProfit
 
 from tensortrade.feed import DataFeed, Stream, NameSpace
@@ -149,3 +150,179 @@ def test_runs_with_random_start(portfolio):
         obs, _, terminated, _, _ = env.step(action)
 
     assert obs.shape[0] == 50
+
+
+def test_runs_with_lazy_meta(portfolio):
+    df = pd.read_csv(get_path("../../data/input/bitfinex_(BTC,ETH)USD_d.csv")).tail(100)
+
+    close = Stream.source(list(df['BTC:close']), dtype="float").rename("close")
+
+    feed = DataFeed([
+        Stream.group([
+            Stream.source(list(df['BTC:open']), dtype="float").rename("open")
+        ]).rename('features'),
+        Stream.group([
+            close,
+            close.rolling(5).mean().rename("sma")
+        ], lazy=True).rename('meta')
+    ])
+
+    env = TradingEnv(
+        portfolio=portfolio,
+        action_scheme=ManagedRiskOrders(),
+        reward_scheme=SimpleProfit(),
+        observer=WindowObserver(window_size=5),
+        feed=feed
+    )
+
+    env.reset()
+    for _ in range(10):
+        env.step(env.action_space.sample())
+
+    state = env.feed.state
+    meta_history = env.feed.meta_history
+
+    sma = df['BTC:close'].rolling(5, min_periods=1).mean()
+
+    n = len(meta_history)
+
+    assert n > 10
+    assert list(meta_history['close']) == list(df['BTC:close'][:n])
+    assert list(meta_history['sma']) == pytest.approx(list(sma[:n]))
+    assert state.meta == {"close": df['BTC:close'].iloc[n - 1], "sma": pytest.approx(sma.iloc[n - 1])}
+
+
+def test_lazy_meta_with_max_pending(portfolio):
+    df = pd.read_csv(get_path("../../data/input/bitfinex_(BTC,ETH)USD_d.csv")).tail(100)
+
+    close = Stream.source(list(df['BTC:close']), dtype="float").rename("close")
+
+    feed = DataFeed([
+        Stream.group([
+            Stream.source(list(df['BTC:open']), dtype="float").rename("open")
+        ]).rename('features'),
+        Stream.group([close], lazy=True).rename('meta')
+    ], max_pending=3)
+
+    env = TradingEnv(
+        portfolio=portfolio,
+        action_scheme=ManagedRiskOrders(),
+        reward_scheme=SimpleProfit(),
+        observer=SimpleObserver(),
+        feed=feed
+    )
+
+    assert env.feed._feed.max_pending == 3
+
+    env.reset()
+    states = []
+    for _ in range(10):
+        env.step(env.action_space.sample())
+        states += [env.feed.state]
+
+    assert states[0].meta is None
+    assert states[-1].meta == {"close": df['BTC:close'].iloc[10]}
+
+    meta_history = env.feed.meta_history
+    assert len(meta_history) == 11
+    assert meta_history['close'][:8].isna().all()
+    assert list(meta_history['close'][8:]) == list(df['BTC:close'][8:11])
+
+    for _ in range(5):
+        env.step(env.action_space.sample())
+
+    meta_history = env.feed.meta_history
+    assert len(meta_history) == 16
+    assert meta_history['close'][11:13].isna().all()
+    assert list(meta_history['close'][13:]) == list(df['BTC:close'][13:16])
+
+
+def test_runs_with_memory_mapped_features(portfolio, tmp_path):
+    df = pd.read_csv(get_path("../../data/input/bitfinex_(BTC,ETH)USD_d.csv")).tail(100)
+
+    path = str(tmp_path / "features.npy")
+    np.save(path, df[['BTC:open', 'BTC:close']].to_numpy())
+
+    feed = DataFeed([
+        Stream.group([
+            Stream.mmap(path, column=0, dtype="float").rename("open"),
+            Stream.mmap(path, column=1, dtype="float").rename("close")
+        ]).rename('features')
+    ])
+
+    env = TradingEnv(
+        portfolio=portfolio,
+        action_scheme=ManagedRiskOrders(),
+        reward_scheme=SimpleProfit(),
+        observer=WindowObserver(window_size=5),
+        feed=feed
+    )
+
+    obs, _ = env.reset()
+    assert env.feed.features_len == 100
+    assert obs.shape == (5, 2)
+
+    env.step(env.action_space.sample())
+
+
+def test_runs_with_profiler(portfolio):
+    df = pd.read_csv(get_path("../../data/input/bitfinex_(BTC,ETH)USD_d.csv")).tail(100)
+
+    feed = DataFeed([
+        Stream.group([
+            Stream.source(list(df['BTC:open']), dtype="float").rename("open")
+        ]).rename('features')
+    ])
+    feed.profile()
+
+    env = TradingEnv(
+        portfolio=portfolio,
+        action_scheme=ManagedRiskOrders(),
+        reward_scheme=SimpleProfit(),
+        observer=WindowObserver(window_size=5),
+        feed=feed
+    )
+
+    env.reset()
+    for _ in range(10):
+        env.step(env.action_space.sample())
+
+    frame = env.feed.profiler.to_frame()
+
+    assert "net_worth" in set(frame["name"])
+    assert "Sensor" in set(frame["operator"])
+    assert (frame["calls"] > 10).all()
+
+
+@pytest.mark.parametrize("observer", [lambda: SimpleObserver(), lambda: WindowObserver(window_size=5)])
+def test_runs_with_vector_features(observer):
+    df = pd.read_csv(get_path("../../data/input/bitfinex_(BTC,ETH)USD_d.csv")).tail(100)
+
+    def run(group):
+        ex = Exchange("bitfinex", service=execute_order)(
+            Stream.source(list(df['BTC:close']), dtype="float").rename("USD-BTC")
+        )
+        env = TradingEnv(
+            portfolio=Portfolio(USD, [Wallet(ex, 10000 * USD), Wallet(ex, 10 * BTC)]),
+            action_scheme=ManagedRiskOrders(),
+            reward_scheme=SimpleProfit(),
+            observer=observer(),
+            feed=DataFeed([group([
+                Stream.source(list(df['BTC:open']), dtype="float").rename("open"),
+                Stream.source(list(df['BTC:close']), dtype="float").rename("close")
+            ]).rename('features')])
+        )
+        obs, _ = env.reset()
+        observations = [obs]
+        for _ in range(10):
+            obs, _, _, _, _ = env.step(0)
+            observations += [obs]
+        return env, np.array(observations)
+
+    env, vector = run(Stream.vector)
+    _, grouped = run(Stream.group)
+
+    assert env.feed.feature_names == ["open", "close"]
+    assert isinstance(env.feed.state.features, np.ndarray)
+    assert vector.dtype == np.float32
+    np.testing.assert_array_equal(vector, grouped)
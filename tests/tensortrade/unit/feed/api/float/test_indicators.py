@@ -0,0 +1,112 @@
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.feed import PushFeed
+
+from tests.tensortrade.unit.utils import get_path
+
+
+@pytest.fixture
+def bars():
+    df = pd.read_csv(get_path("../../data/input/bitfinex-1h-btc-usd.csv"))
+    return df.iloc[::-1].tail(2000).reset_index(drop=True)
+
+
+def create_indicators(close, high, low):
+    macd = close.macd()
+    bands = close.bollinger()
+    stochastic = close.stochastic(high, low)
+    return {
+        "rsi": close.rsi(),
+        "atr": close.atr(high, low),
+        "macd": macd["macd"],
+        "macd_signal": macd["signal"],
+        "macd_diff": macd["diff"],
+        "bb_middle": bands["middle"],
+        "bb_upper": bands["upper"],
+        "bb_lower": bands["lower"],
+        "stoch_k": stochastic["k"],
+        "stoch_d": stochastic["d"]
+    }
+
+
+def test_indicators_match_pandas(bars):
+    close, high, low = bars["Close"], bars["High"], bars["Low"]
+
+    macd = ta.trend.MACD(close)
+    bands = ta.volatility.BollingerBands(close)
+    stochastic = ta.momentum.StochasticOscillator(high, low, close)
+    atr = ta.volatility.AverageTrueRange(high, low, close).average_true_range()
+    atr[:13] = np.nan
+
+    expected = pd.DataFrame({
+        "rsi": ta.momentum.RSIIndicator(close).rsi(),
+        "atr": atr,
+        "macd": macd.macd(),
+        "macd_signal": macd.macd_signal(),
+        "macd_diff": macd.macd_diff(),
+        "bb_middle": bands.bollinger_mavg(),
+        "bb_upper": bands.bollinger_hband(),
+        "bb_lower": bands.bollinger_lband(),
+        "stoch_k": stochastic.stoch(),
+        "stoch_d": stochastic.stoch_signal()
+    })
+
+    streams = create_indicators(*[Stream.source(list(bars[k]), dtype="float") for k in ["Close", "High", "Low"]])
+    feed = DataFeed([s.rename(k) for k, s in streams.items()])
+
+    feed.compile()
+    actual = pd.DataFrame([feed.next() for _ in range(len(bars))])
+    pd.testing.assert_frame_equal(actual, expected, rtol=1e-12)
+
+    feed.compile(batch=True)
+    pd.testing.assert_frame_equal(pd.DataFrame([feed.next() for _ in range(len(bars))]), actual, check_exact=True)
+
+
+def test_indicators_online_match_offline(bars):
+    sources = [Stream.source(list(bars[k]), dtype="float") for k in ["Close", "High", "Low"]]
+    offline = DataFeed([s.rename(k) for k, s in create_indicators(*sources).items()])
+    offline.compile(batch=True)
+
+    placeholders = [Stream.placeholder(dtype="float").rename(k) for k in ["close", "high", "low"]]
+    online = PushFeed([s.rename(k) for k, s in create_indicators(*placeholders).items()])
+
+    for row in bars.itertuples():
+        expected = offline.next()
+        actual = online.push({"close": row.Close, "high": row.High, "low": row.Low})
+        assert str(actual) == str(expected)
+
+
+def test_indicators_with_missing_and_infinite_values(bars):
+    bars = bars.head(200).copy()
+    bars.loc[[20, 21, 90], "Close"] = np.nan
+    bars.loc[[40, 120], "High"] = np.nan
+    bars.loc[60, "Low"] = -np.inf
+    bars.loc[150, "Close"] = np.inf
+
+    streams = create_indicators(*[Stream.source(list(bars[k]), dtype="float") for k in ["Close", "High", "Low"]])
+    feed = DataFeed([s.rename(k) for k, s in streams.items()])
+
+    feed.compile()
+    with np.errstate(invalid="ignore"):
+        actual = pd.DataFrame([feed.next() for _ in range(len(bars))])
+
+        feed.compile(batch=True)
+        batch = pd.DataFrame([feed.next() for _ in range(len(bars))])
+    pd.testing.assert_frame_equal(batch, actual, check_exact=True)
+
+
+def test_bollinger_with_infinite_values():
+    array = [1.0, 2.0, 3.0, np.inf, 4.0, 5.0, 6.0, 7.0]
+    bands = Stream.source(array, dtype="float").bollinger(window=3, k=1)
+
+    feed = DataFeed([bands["middle"].rename("middle"), bands["upper"].rename("upper")])
+    values = [feed.next() for _ in range(len(array))]
+
+    expected = [np.nan, np.nan, 2, np.inf, np.inf, np.inf, 5, 6]
+    np.testing.assert_array_equal([v["middle"] for v in values], expected)
+    np.testing.assert_allclose([v["upper"] for v in values][-2:], [5 + np.sqrt(2 / 3), 6 + np.sqrt(2 / 3)])
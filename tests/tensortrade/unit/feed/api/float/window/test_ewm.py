@@ -1,9 +1,12 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from tensortrade.feed import Stream
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.api.float.window.ewm import ewm_mean, ewm_var, ewm_std, ewm_cov, ewm_corr
 
+from tests.tensortrade.unit.utils import get_path
 from tests.utils.ops import assert_op
 
 
@@ -68,3 +71,75 @@ def test_ewm_std():
         expected = list(pd.Series(array).ewm(**config).std(bias=True))
 
         assert_op([w], expected)
+
+
+def test_ewm_cov_corr():
+
+    x = [1, np.nan, 3, 4, 5, 6, np.nan, 7]
+    y = [2, 1, np.nan, 5, 3, 8, 9, 6]
+
+    s1 = Stream.source(x, dtype="float")
+    s2 = Stream.source(y, dtype="float")
+
+    for config in configurations:
+        for bias in [False, True]:
+            w = s1.ewm(**config).cov(s2, bias=bias).rename("w")
+            expected = list(pd.Series(x).ewm(**config).cov(pd.Series(y), bias=bias))
+
+            assert_op([w], expected)
+
+        w = s1.ewm(**config).corr(s2).rename("w")
+        expected = list(pd.Series(x).ewm(**config).corr(pd.Series(y)))
+
+        assert_op([w], expected)
+
+
+@pytest.mark.parametrize("path,columns", [
+    ("../../data/input/bitfinex_(BTC,ETH)USD_d.csv", ["BTC:close", "ETH:close"]),
+    ("../../data/input/bitstamp_(BTC,ETH,LTC)USD_d.csv", ["BTC:close", "ETH:close", "LTC:close"])
+])
+@pytest.mark.parametrize("config", [
+    {"span": 20},
+    {"com": 5, "min_periods": 10, "ignore_na": True},
+    {"alpha": 0.1, "adjust": False},
+    {"halflife": 7, "adjust": False, "ignore_na": True}
+])
+def test_ewm_functions_match_pandas(path, columns, config):
+    df = pd.read_csv(get_path(path), index_col=0)[columns]
+    ewm = df.ewm(**config)
+
+    pd.testing.assert_frame_equal(ewm_mean(df, **config), ewm.mean(), rtol=1e-12)
+    pd.testing.assert_frame_equal(ewm_mean(df, **config, exact=False), ewm.mean(), rtol=1e-12)
+    pd.testing.assert_frame_equal(ewm_var(df, **config), ewm.var(), rtol=1e-12)
+    pd.testing.assert_frame_equal(ewm_std(df, **config, bias=True), ewm.std(bias=True), rtol=1e-12)
+
+    x, y = df[columns[0]], df[columns[-1]]
+    pd.testing.assert_series_equal(ewm_cov(x, y, **config), x.ewm(**config).cov(y), rtol=1e-12, check_names=False)
+    pd.testing.assert_series_equal(ewm_corr(x, y, **config), x.ewm(**config).corr(y), rtol=1e-12, check_names=False)
+
+    s = Stream.source(list(y), dtype="float")
+    feed = DataFeed([s.ewm(**config).mean().rename("w")])
+    feed.compile(batch=True)
+    actual = [feed.next()["w"] for _ in range(len(y))]
+    np.testing.assert_array_equal(actual, ewm_mean(y.values, **config))
+
+
+@pytest.mark.parametrize("config", [
+    {"span": 3},
+    {"alpha": 0.5, "min_periods": 3},
+    {"com": 2, "ignore_na": True},
+    {"alpha": 0.3, "adjust": False},
+    {"alpha": 0.3, "adjust": False, "ignore_na": True}
+])
+def test_ewm_mean_vectorized(config):
+    rng = np.random.default_rng(0)
+    x = 100 + rng.normal(size=500).cumsum()
+    x[:3] = np.nan
+    x[rng.random(500) < 0.1] = np.nan
+
+    exact = ewm_mean(x, **config)
+    np.testing.assert_allclose(ewm_mean(x, **config, exact=False), exact, rtol=1e-12)
+    np.testing.assert_allclose(exact, pd.Series(x).ewm(**config).mean(), rtol=1e-12)
+
+    x[10] = np.inf
+    np.testing.assert_array_equal(ewm_mean(x, **config, exact=False), ewm_mean(x, **config))
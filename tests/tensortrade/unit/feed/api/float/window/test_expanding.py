@@ -1,12 +1,13 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from itertools import product
 
-from tensortrade.feed import Stream
+from tensortrade.feed import Stream, DataFeed
 
-from tests.utils.ops import assert_op
+from tests.utils.ops import assert_op, run_feed
 
 configurations = [
     {"min_periods": 0},
@@ -90,3 +91,63 @@ def test_expanding_max():
         expected = list(pd.Series(array).expanding(**config).max())
 
         assert_op([w], expected)
+
+
+@pytest.mark.parametrize("op", ["sum", "mean", "var", "std", "min", "max", "median"])
+def test_expanding_matches_pandas(op):
+    rng = np.random.default_rng(0)
+    array = 1e4 + rng.normal(size=3000).cumsum()
+    array[rng.random(3000) < 0.05] = np.nan
+
+    s = Stream.source(array, dtype="float")
+    w = getattr(s.expanding(min_periods=5), op)().rename("w")
+    expected = getattr(pd.Series(array).expanding(min_periods=5), op)()
+
+    feed = DataFeed([w])
+    feed.compile()
+    actual = run_feed(feed)
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    feed.compile(batch=True)
+    np.testing.assert_array_equal(run_feed(feed), actual)
+
+
+def test_expanding_keeps_history_only_for_agg():
+    s = Stream.source([1.0, np.nan, 3.0, 4.0], dtype="float")
+    e = s.expanding()
+
+    feed = DataFeed([e.mean().rename("mean"), e.count().rename("count")])
+    values = [feed.next() for _ in range(4)]
+
+    assert not hasattr(e, "history")
+    assert [v["count"] for v in values] == [1, 1, 2, 3]
+
+    feed = DataFeed([e.agg(lambda h: h[-1] - h[0]).rename("range")])
+    assert [feed.next()["range"] for _ in range(4)] == [0.0, 0.0, 2.0, 3.0]
+
+
+def test_expanding_agg_with_optimize():
+    array = [1.0, np.nan, 3.0, 4.0, 5.0]
+    s = Stream.source(array, dtype="float")
+
+    feed = DataFeed([
+        s.expanding().mean().rename("mean"),
+        s.expanding().agg(np.sum).rename("sum")
+    ])
+    feed.compile(optimize=True)
+    values = [feed.next() for _ in range(len(array))]
+
+    expected = pd.Series(array).expanding()
+    np.testing.assert_allclose([v["mean"] for v in values], expected.mean())
+    np.testing.assert_allclose([v["sum"] for v in values], expected.sum())
+
+
+def test_expanding_with_infinite_values():
+    array = [1, 2, np.inf, 3, -np.inf, 4]
+    s = Stream.source(array, dtype="float")
+
+    w = s.expanding().sum().rename("w")
+    assert_op([w], [1, 3, np.inf, np.inf, np.nan, np.nan])
+
+    w = s.expanding().max().rename("w")
+    assert_op([w], [1, 2, np.inf, np.inf, np.inf, np.inf])
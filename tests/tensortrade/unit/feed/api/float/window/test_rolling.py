@@ -5,9 +5,9 @@ import pytest
 import numpy as np
 import pandas as pd
 
-from tensortrade.feed import Stream
+from tensortrade.feed import Stream, DataFeed
 
-from tests.utils.ops import assert_op
+from tests.utils.ops import assert_op, run_feed
 
 
 arrays = [
@@ -77,6 +77,19 @@ def test_rolling_median():
         assert_op([w], expected)
 
 
+@pytest.mark.parametrize("q", [0, 0.1, 0.75, 1])
+def test_rolling_quantile(q):
+    for array, config in product(arrays, configurations):
+        s = Stream.source(array, dtype="float")
+        w = s.rolling(**config).quantile(q).rename("w")
+        expected = list(pd.Series(array).rolling(**config).quantile(q))
+
+        assert_op([w], expected)
+
+    with pytest.raises(ValueError):
+        Stream.source(arrays[0], dtype="float").rolling(3).quantile(1.5)
+
+
 def test_rolling_std():
     for array, config in product(arrays, configurations):
         s = Stream.source(array, dtype="float")
@@ -102,3 +115,197 @@ def test_rolling_max():
         expected = list(pd.Series(array).rolling(**config).max())
 
         assert_op([w], expected)
+
+
+@pytest.mark.parametrize("window,min_periods", [(1, 1), (5, 1), (5, 5), (250, 10), (250, 250)])
+@pytest.mark.parametrize("op", ["sum", "mean", "var", "std", "min", "max", "median"])
+def test_rolling_moments_match_pandas(window, min_periods, op):
+    rng = np.random.default_rng(0)
+    array = 1e4 + rng.normal(size=2000).cumsum()
+    array[rng.random(2000) < 0.05] = np.nan
+    array[700:703] = np.nan
+
+    s = Stream.source(array, dtype="float")
+    w = getattr(s.rolling(window, min_periods=min_periods), op)().rename("w")
+    expected = getattr(pd.Series(array).rolling(window, min_periods=min_periods), op)()
+
+    feed = DataFeed([w])
+    feed.compile()
+    actual = run_feed(feed)
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    feed.compile(batch=True)
+    np.testing.assert_array_equal(run_feed(feed), actual)
+
+
+def test_rolling_windows_and_lags_share_history():
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=500).cumsum()
+    array[rng.random(500) < 0.05] = np.nan
+
+    s = Stream.source(array, dtype="float")
+    rollings = [s.rolling(3), s.rolling(50, min_periods=10)]
+    streams = [
+        rollings[0].mean().rename("mean"),
+        rollings[1].agg(np.nanmax).rename("max"),
+        s.lag(2).rename("lag2"),
+        s.lag(80).rename("lag80")
+    ]
+
+    history = rollings[0].inputs[0]
+    assert all(r.inputs[0] is history for r in rollings)
+    assert all(w.inputs[0] is history for w in streams[2:])
+    assert history.size == 81
+
+    series = pd.Series(array)
+    expected = pd.DataFrame({
+        "mean": series.rolling(3, min_periods=1).mean(),
+        "max": series.rolling(50, min_periods=10).max(),
+        "lag2": series.shift(2),
+        "lag80": series.shift(80)
+    })
+
+    feed = DataFeed(streams)
+    for batch in [False, True]:
+        feed.compile(batch=batch)
+        actual = pd.DataFrame([feed.next() for _ in range(len(array))])
+        pd.testing.assert_frame_equal(actual, expected, rtol=1e-9)
+
+    feed.compile()
+    [feed.next() for _ in range(200)]
+    state = feed.state_dict()
+    resumed = [feed.next() for _ in range(100)]
+    feed.load_state_dict(state)
+    assert str([feed.next() for _ in range(100)]) == str(resumed)
+
+
+@pytest.mark.parametrize("window,min_periods", [(5, 1), (5, 5), (50, 10)])
+def test_rolling_aggregate_matches_separate_operators(window, min_periods):
+    rng = np.random.default_rng(0)
+    array = 1e4 + rng.normal(size=1000).cumsum()
+    array[rng.random(1000) < 0.05] = np.nan
+
+    s = Stream.source(array, dtype="float")
+    r = s.rolling(window, min_periods=min_periods)
+    stats = r.aggregate(["sum", "mean", "var", "std", "min", "max", "median", "zscore"])
+    separate = {
+        "sum": r.sum(),
+        "mean": r.mean(),
+        "var": r.var(),
+        "std": r.std(),
+        "min": r.min(),
+        "max": r.max(),
+        "median": r.median(),
+        "zscore": (s - r.mean()) / r.std()
+    }
+
+    feed = DataFeed([stats[k].rename(k) for k in stats] + [separate[k].rename("_" + k) for k in stats])
+    for batch in [False, True]:
+        feed.compile(batch=batch)
+        actual = pd.DataFrame([feed.next() for _ in range(len(array))])
+        for k in stats:
+            np.testing.assert_array_equal(actual[k], actual["_" + k])
+
+
+def test_rolling_aggregate_unknown_statistic():
+    s = Stream.source([1.0, 2.0, 3.0], dtype="float")
+
+    with pytest.raises(ValueError):
+        s.rolling(2).aggregate(["mean", "skew"])
+
+
+@pytest.mark.parametrize("window,min_periods", [(5, 1), (5, 5), (50, 10), (250, 250)])
+@pytest.mark.parametrize("op", ["cov", "corr", "beta"])
+def test_rolling_pair_statistics_match_pandas(window, min_periods, op):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=2000)
+    y = 0.5 * x + rng.normal(size=2000)
+    x[rng.random(2000) < 0.05] = np.nan
+    y[rng.random(2000) < 0.05] = np.nan
+    x[700:703] = np.nan
+
+    s = Stream.source(x, dtype="float")
+    w = getattr(s.rolling(window, min_periods=min_periods), op)(Stream.source(y, dtype="float")).rename("w")
+
+    rx = pd.Series(x).rolling(window, min_periods=min_periods)
+    if op == "beta":
+        expected = rx.cov(pd.Series(y)) / pd.Series(y + 0 * x).rolling(window, min_periods=min_periods).var()
+    else:
+        expected = getattr(rx, op)(pd.Series(y))
+
+    feed = DataFeed([w])
+    feed.compile()
+    actual = run_feed(feed)
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    feed.compile(batch=True)
+    np.testing.assert_array_equal(run_feed(feed), actual)
+
+
+@pytest.mark.parametrize("op", ["cov", "corr", "beta"])
+def test_rolling_pair_statistics_with_live_input(op):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=100)
+    y = 0.5 * x + rng.normal(size=100)
+
+    class Cursor:
+        def __init__(self):
+            self.step = -1
+
+    def create_streams(cursor):
+        s = Stream.source(x, dtype="float")
+        t = Stream.sensor(cursor, lambda c: y[c.step], dtype="float")
+        return [
+            getattr(t.rolling(3), op)(s).rename("live_batched"),
+            getattr(s.rolling(3), op)(t).rename("batched_live"),
+            s.rolling(3).mean().rename("mean")
+        ]
+
+    outputs = {}
+    for batch in [False, True]:
+        cursor = Cursor()
+        feed = DataFeed(create_streams(cursor))
+        feed.compile(batch=batch)
+
+        rows = []
+        while feed.has_next():
+            cursor.step += 1
+            rows += [feed.next()]
+        outputs[batch] = pd.DataFrame(rows)
+
+    pd.testing.assert_frame_equal(outputs[True], outputs[False], check_exact=True)
+    assert not outputs[False].isna().all().any()
+
+
+@pytest.mark.parametrize("op", ["sum", "mean", "var", "std", "min", "max", "median"])
+def test_rolling_with_infinite_values(op):
+    array = [1, 2, np.inf, 3, 4, 5, -np.inf, np.inf, 6, 7, 8]
+    windows = [array[max(i - 1, 0):i + 1] for i in range(len(array))]
+    func = {"var": lambda w: np.var(w, ddof=1) if len(w) > 1 else np.nan,
+            "std": lambda w: np.std(w, ddof=1) if len(w) > 1 else np.nan}.get(op, getattr(np, op))
+    with np.errstate(invalid="ignore"):
+        expected = [func(w) for w in windows]
+
+    s = Stream.source(array, dtype="float")
+    r = s.rolling(2)
+    assert_op([getattr(r, op)().rename("w")], expected)
+
+    feed = DataFeed([r.aggregate([op])[op].rename("w")])
+    feed.compile()
+    np.testing.assert_array_equal(run_feed(feed), run_feed(DataFeed([getattr(r, op)().rename("w")])))
+
+
+def test_rolling_pair_statistics_with_infinite_values():
+    x = np.array([1, 2, np.inf, 3, 4, 5, 6, 7])
+    y = np.array([2, 1, 4, 3, 6, 5, 8, 9])
+    s = Stream.source(x, dtype="float")
+    t = Stream.source(y, dtype="float")
+
+    feed = DataFeed([s.rolling(2).cov(t).rename("cov"), s.rolling(2).corr(t).rename("corr")])
+    feed.compile()
+    actual = pd.DataFrame([feed.next() for _ in range(len(x))])
+
+    expected = pd.Series(x).rolling(2).cov(pd.Series(y))
+    np.testing.assert_array_equal(actual["cov"].isna(), [True, False, True, True, False, False, False, False])
+    np.testing.assert_allclose(actual["cov"][4:], expected[4:])
+    np.testing.assert_allclose(actual["corr"][4:], pd.Series(x).rolling(2).corr(pd.Series(y))[4:])
@@ -0,0 +1,142 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from tensortrade.feed import Stream
+from tensortrade.feed.core.async_feed import AsyncPushFeed
+
+
+def create_feed(**kwargs):
+    a = Stream.placeholder(dtype="float").rename("a")
+    b = Stream.placeholder(dtype="float").rename("b")
+    return AsyncPushFeed([a, b, (a + b).rename("sum")], **kwargs)
+
+
+def test_step_waits_for_all_placeholders():
+    feed = create_feed()
+
+    async def main():
+        async def produce():
+            await feed.put("a", 1)
+            await asyncio.sleep(0.01)
+            await feed.put("b", 2)
+
+        producer = asyncio.create_task(produce())
+        output = await feed.step()
+        await producer
+        return output
+
+    assert asyncio.run(main()) == {"a": 1, "b": 2, "sum": 3}
+    assert feed.stats.steps == 1
+    assert feed.stats.timeouts == 0
+
+
+def test_block_policy_applies_backpressure():
+    feed = create_feed(maxsize=1)
+
+    async def main():
+        await feed.put("a", 1)
+        blocked = asyncio.create_task(feed.put("a", 2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert feed.stats.depth == {"a": 1, "b": 0}
+
+        await feed.put("b", 10)
+        first = await feed.step()
+        await blocked
+        await feed.put("b", 20)
+        return first, await feed.step()
+
+    assert asyncio.run(main()) == ({"a": 1, "b": 10, "sum": 11}, {"a": 2, "b": 20, "sum": 22})
+
+
+@pytest.mark.parametrize("policy,expected", [("drop_oldest", [2, 3]), ("coalesce", [1, 3])])
+def test_full_queue_policies(policy, expected):
+    feed = create_feed(maxsize=2, policy=policy)
+
+    async def main():
+        await feed.put_many({"a": 1, "b": 0})
+        await feed.put_many({"a": 2, "b": 0})
+        await feed.put("a", 3)
+        await feed.put("b", 0)
+        return [(await feed.step())["a"] for _ in range(2)]
+
+    assert asyncio.run(main()) == expected
+    assert feed.stats.dropped["a"] == int(policy == "drop_oldest")
+    assert feed.stats.coalesced["a"] == int(policy == "coalesce")
+
+
+def test_timeout():
+    feed = create_feed(timeout=0.02)
+
+    async def main():
+        await feed.put_many({"a": 1, "b": 2})
+        await feed.step()
+        await feed.put("a", 5)
+        return await feed.step()
+
+    assert asyncio.run(main()) == {"a": 5, "b": 2, "sum": 7}
+    assert feed.stats.timeouts == 1
+    assert feed.stats.missing == {"a": 0, "b": 1}
+    assert feed.stats.max_lag >= 0.02
+
+    feed = create_feed(timeout=0.01, hold=False)
+
+    async def missing():
+        await feed.put("a", 1)
+        return await feed.step()
+
+    output = asyncio.run(missing())
+    assert np.isnan(output["b"]) and np.isnan(output["sum"])
+
+
+def test_iterate():
+    feed = create_feed(maxsize=3)
+
+    async def main():
+        for i in range(3):
+            await feed.put_many({"a": i, "b": i})
+        outputs = []
+        async for output in feed:
+            outputs += [output["sum"]]
+            if len(outputs) == 3:
+                break
+        return outputs
+
+    assert asyncio.run(main()) == [0, 2, 4]
+
+
+def test_bars_are_aligned():
+    feed = create_feed(maxsize=4)
+
+    async def main():
+        await feed.put("a", 1, bar=1)
+        await feed.put("a", 2, bar=2)
+        await feed.put("b", 20, bar=2)
+        await feed.put("b", 30, bar=3)
+        await feed.put("a", 3, bar=3)
+        return [await feed.step() for _ in range(3)]
+
+    first, second, third = asyncio.run(main())
+
+    assert first["a"] == 1 and np.isnan(first["b"])
+    assert second == {"a": 2, "b": 20, "sum": 22}
+    assert third == {"a": 3, "b": 30, "sum": 33}
+    assert feed.stats.bar == 3
+    assert feed.stats.missing == {"a": 0, "b": 1}
+
+
+def test_runs_in_several_event_loops():
+    feed = create_feed()
+
+    async def main(value):
+        await feed.put_many({"a": value, "b": value})
+        return (await feed.step())["sum"]
+
+    assert [asyncio.run(main(i)) for i in range(2)] == [0, 2]
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        create_feed(policy="newest")
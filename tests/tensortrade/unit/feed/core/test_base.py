@@ -1,8 +1,13 @@
 
 
-from tensortrade.feed.core import Stream, NameSpace
+import numpy as np
+import pandas as pd
+import pytest
 
-from tensortrade.feed.core.base import Placeholder
+from tensortrade.feed.core import Stream, NameSpace, NameRegistry
+
+from tensortrade.feed.core.base import Placeholder, ArrayStream, IterableStream
+from tensortrade.feed.core.feed import DataFeed
 
 
 class Counter(Stream):
@@ -51,6 +56,66 @@ def test_stream_head():
     assert c2.name == "world:/c1"
 
 
+def test_name_registry():
+    before = Stream.source([1]).name
+    counts = dict(Stream.names)
+
+    def build():
+        with NameRegistry("build") as registry:
+            names = [Stream.source([1]).name for _ in range(3)]
+            assert len(registry.counts) > 0
+        return names
+
+    first = build()
+    assert build() == first
+    assert before not in first
+    assert len(set(first)) == 3
+    assert all(name.startswith("build:/") for name in first)
+    assert Stream.names == counts
+
+
+def test_name_registry_names_are_unique():
+    with NameRegistry() as registry:
+        inner = [Stream.source([1]).name for _ in range(2)]
+        with NameRegistry() as nested:
+            inner += [Stream.source([1]).name for _ in range(2)]
+    outer = [Stream.source([1]).name for _ in range(2)]
+
+    with registry:
+        inner += [Stream.source([1]).name]
+
+    assert nested.name.startswith(registry.name + ":/")
+    assert len(set(inner + outer)) == 7
+
+
+def test_name_space_generates_names():
+    with NameSpace("world"):
+        s = Stream.source([1])
+        t = Stream.source([1])
+        u = Stream.source([1]).rename("u")
+
+    assert s.name.startswith("world:/")
+    assert s.name != t.name
+    assert u.name == "world:/u"
+
+
+def test_repeated_name_space_generates_unique_names():
+    with NameSpace("ex"):
+        s = Stream.source([1, 2])
+    with NameSpace("ex"):
+        t = Stream.source([3, 4])
+
+    assert s.name != t.name
+
+    feed = DataFeed([s, t])
+    assert feed.next() == {s.name: 1, t.name: 3}
+
+    with NameRegistry("build"):
+        with NameSpace("ex"):
+            u = Stream.source([1])
+
+    assert u.name == "ex:/stream"
+
 
 def test_stream_source():
 
@@ -85,6 +150,72 @@ def test_stream_source():
     assert s.forward() == 1
 
 
+def test_array_stream():
+    series = pd.Series([1.5, 2.5, 3.5, 4.5])
+    s = Stream.source(series, dtype="float")
+
+    assert isinstance(s, ArrayStream)
+    assert s.remaining == 4
+    assert [s.forward() for _ in range(2)] == [1.5, 2.5]
+    assert type(s.forward()) is float
+
+    s.seek(1)
+    assert s.remaining == 3
+    assert s.forward() == 2.5
+
+    s.reset(random_start=2)
+    assert [s.forward() for _ in range(2)] == [3.5, 4.5]
+    assert not s.has_next()
+    np.testing.assert_array_equal(s.iterable, series.to_numpy())
+
+    s = Stream.source(np.arange(3), dtype="float")
+    assert isinstance(s, ArrayStream)
+    assert isinstance(s.forward(), np.integer)
+
+    assert not isinstance(Stream.source([1, 2, 3]), ArrayStream)
+    assert not isinstance(Stream.source(pd.Series(["a", "b"])), ArrayStream)
+    assert not isinstance(Stream.source(pd.Series([1, None], dtype="Int64")), ArrayStream)
+    assert isinstance(Stream.source(pd.Series(["a", "b"])), IterableStream)
+
+
+def test_source_arguments():
+    values = [1.5, 2.5, 3.5]
+    s = Stream.source(np.array(values), dtype="float")
+
+    assert not hasattr(s, "_init_args")
+    assert s._arguments()[0][0] is s.buffer
+
+    s = Stream.source(values)
+    assert s._arguments() == ((values,), ())
+    assert s.lag(2)._arguments() == ((2,), ())
+
+
+def test_accessor_is_cached():
+    s = Stream.source([1.5, 2.5], dtype="float")
+
+    assert s.float is s.float
+    assert s.str is not s.float
+
+
+def test_source_state_dict():
+    def g():
+        yield from range(5)
+
+    # generator functions do not support a random start
+    for source, expected in [([0, 1, 2, 3, 4], 2), (g, 1), (np.arange(5), 2)]:
+        s = Stream.source(source, dtype="float")
+        s.reset(random_start=1)
+        s.run()
+        state = s.state_dict()
+
+        assert s.forward() == expected
+
+        t = Stream.source(source, dtype="float")
+        t.load_state_dict(state)
+        assert t.value == s.value
+        assert t.forward() == expected
+
+
 def test_placholder():
 
     s = Stream.placeholder(dtype="float")
@@ -92,3 +223,81 @@ def test_placholder():
     s.push(5)
 
     assert s.value == 5
+
+
+def test_gather_and_toposort():
+
+    s = Stream.source([1, 2, 3], dtype="float")
+    a = s + 1
+    b = s * 2
+    c = (a + b).rename("c")
+    d = (a - s).rename("d")
+    root = Stream.group([c, d])
+
+    edges = root.gather()
+
+    assert len(edges) == len(set(edges)) == 10
+    assert (s, a) in edges and (b, c) in edges and (d, root) in edges
+
+    process = Stream.toposort(edges)
+    position = {v: i for i, v in enumerate(process)}
+
+    assert len(process) == 7
+    assert root not in position
+    assert all(position[u] < position[v] for u, v in edges if v is not root)
+    assert Stream.toposort(edges) == process
+
+
+def test_deep_graph():
+
+    s = Stream.source(range(5), dtype="float")
+
+    node = s
+    for _ in range(10000):
+        node = node + 1
+
+    feed = DataFeed([node.rename("out")])
+    feed.compile()
+
+    assert len(feed.process) == 20001
+    assert [feed.next()["out"] for _ in range(5)] == [10000, 10001, 10002, 10003, 10004]
+
+
+def test_mixin_types_are_cached():
+
+    s = Stream.source([1, 2, 3], dtype="float")
+    a = s + 1
+    b = s * 2
+
+    assert type(a) is type(b)
+    assert type(a.astype("float")) is type(b)
+    assert type(s) is type(Stream.source([4, 5, 6], dtype="float"))
+
+
+def test_core_streams_are_slotted():
+
+    s = Stream.source([1, 2, 3], dtype="float")
+
+    for stream in [s, s + 1, s.lag(), Stream.constant(1), Stream.placeholder(dtype="float")]:
+        assert not hasattr(stream, "__dict__")
+
+    with pytest.raises(AttributeError):
+        s.unknown = 1
+
+    assert s.float.sqrt() is not None
+
+
+def test_vector_group():
+    x = Stream.source([1.0, 2.0, 3.0], dtype="float").rename("x")
+    y = Stream.source([4.0, 5.0, 6.0], dtype="float").rename("y")
+    vector = Stream.vector([x, (x + y).rename("sum")]).rename("features")
+
+    feed = DataFeed([vector, y])
+    first = feed.next()
+
+    assert vector.columns == ["x", "sum"]
+    assert vector["sum"].name == "sum"
+    assert first["features"].dtype == np.float32
+    assert first["features"].tolist() == [1.0, 5.0]
+    assert feed.next()["features"] is first["features"]
+    assert first["features"].tolist() == [2.0, 7.0]
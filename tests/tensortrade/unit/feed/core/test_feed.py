@@ -1,7 +1,12 @@
+import pickle
 
+import numpy as np
+import pandas as pd
+import pytest
 
 from tensortrade.feed import Stream
-from tensortrade.feed.core.feed import PushFeed
+from tensortrade.feed.core.feed import DataFeed, PushFeed
+from tensortrade.feed.core.operators import History
 
 
 def test_init_push_feed():
@@ -61,3 +66,334 @@ def test_push_one_datum():
             "v3": expected["v3"][i],
             "v4": expected["v4"][i]
         }
+
+
+def run(feed, random_start=0):
+    feed.reset(random_start=random_start)
+    outputs = []
+    while feed.has_next():
+        outputs += [feed.next()]
+    return outputs
+
+
+def run_to_end(feed):
+    outputs = []
+    while feed.has_next():
+        outputs += [feed.next()]
+    return outputs
+
+
+def assert_outputs_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.keys() == e.keys()
+        for k in e.keys():
+            np.testing.assert_array_equal(a[k], e[k])
+
+
+def create_streams():
+    rng = np.random.default_rng(1)
+    values = 100 + rng.standard_normal(250).cumsum()
+    values[rng.choice(250, 20, replace=False)] = np.nan
+
+    s = Stream.source(pd.Series(values), dtype="float").rename("s")
+    c = Stream.source(list(values[::-1]), dtype="float").rename("c")
+
+    return [
+        s,
+        s.lag(3).rename("lag"),
+        (s + c).rename("add"),
+        (s / c).log().rename("log_ratio"),
+        s.ffill().pct_change().rename("pct"),
+        s.fillna(0).cumsum().rename("cumsum"),
+        s.cummax().rename("cummax"),
+        s.rolling(10).mean().rename("r_mean"),
+        s.rolling(10, min_periods=3).std().rename("r_std"),
+        s.rolling(7, min_periods=2).median().rename("r_median"),
+        s.rolling(5).count().rename("r_count"),
+        s.rolling(4).agg(lambda w: w[0] - w[-1]).rename("r_agg"),
+        s.expanding().max().rename("e_max"),
+        s.ewm(span=12).mean().rename("ewm"),
+        s.clamp(95, 105).warmup(20).rename("clamp"),
+        s.apply(lambda x: round(x, 2)).freeze().rename("freeze")
+    ]
+
+
+def test_batch_matches_step_by_step():
+    feed = DataFeed(create_streams())
+    feed.compile()
+
+    expected = run(feed)
+    expected_random_start = run(feed, random_start=17)
+
+    feed = DataFeed(create_streams())
+    feed.compile(batch=True)
+
+    assert feed.batch
+    assert_outputs_equal(run(feed), expected)
+    assert_outputs_equal(run(feed, random_start=17), expected_random_start)
+
+
+def test_batch_with_live_streams():
+
+    class Counter:
+        def __init__(self):
+            self.count = 0
+
+    counter = Counter()
+
+    s = Stream.source([1, 2, 3, 4, 5, 6], dtype="float").rename("s")
+    t = Stream.sensor(counter, lambda c: c.count, dtype="float").rename("t")
+    lagged = s.lag().rename("lagged")
+
+    feed = DataFeed([
+        lagged,
+        (s.rolling(2).sum() + t).rename("live"),
+        Stream.group([s.cumsum().rename("a"), t]).rename("group")
+    ])
+    feed.compile(batch=True)
+
+    outputs = []
+    while feed.has_next():
+        counter.count += 10
+        outputs += [feed.next()]
+
+    assert [o["lagged"] for o in outputs][1:] == [1, 2, 3, 4, 5]
+    assert [o["live"] for o in outputs] == [11, 23, 35, 47, 59, 71]
+    assert [o["group"] for o in outputs][-1] == {"a": 21, "t": 60}
+
+
+def test_lazy_group():
+    s = Stream.source([1, 2, 3, 4, 5, 6], dtype="float").rename("s")
+    m = Stream.source([6, 5, 4, 3, 2, 1], dtype="float").rename("m")
+    a = s.cumsum().rename("a")
+
+    feed = DataFeed([
+        a,
+        Stream.group([
+            (a + m).rename("b"),
+            m.rolling(2).sum().rename("c"),
+        ], lazy=True).rename("meta")
+    ])
+    feed.compile()
+
+    assert [feed.next() for _ in range(3)] == [{"a": 1}, {"a": 3}, {"a": 6}]
+    assert feed.flush() == [
+        {"meta": {"b": 7, "c": 6}},
+        {"meta": {"b": 8, "c": 11}},
+        {"meta": {"b": 10, "c": 9}}
+    ]
+    assert feed.flush() == []
+
+    feed.next()
+    assert feed.value == {"a": 10}
+    assert feed.flush() == [{"meta": {"b": 13, "c": 7}}]
+    assert a.value == 10
+
+    feed.reset()
+    feed.next()
+    assert feed.flush() == [{"meta": {"b": 7, "c": 6}}]
+
+
+@pytest.mark.parametrize("max_pending", [None, 2])
+def test_lazy_group_pending_steps(max_pending):
+    s = Stream.source(np.arange(1, 11, dtype=float), dtype="float").rename("s")
+    feed = DataFeed([
+        s,
+        Stream.group([s.cumsum().rename("c"), s.lag(3).rename("l")], lazy=True).rename("meta")
+    ], max_pending=max_pending)
+    feed.compile()
+
+    for i in range(8):
+        feed.next()
+        assert len(feed._pending) == (i + 1 if max_pending is None else min(i + 1, max_pending))
+
+    outputs = feed.flush()
+    sums = [1, 3, 6, 10, 15, 21, 28, 36]
+    lags = [np.nan] * 3 + [1, 2, 3, 4, 5]
+    expected = [{"meta": {"c": float(c), "l": float(l)}} for c, l in zip(sums, lags)]
+    assert str(outputs) == str(expected if max_pending is None else expected[-2:])
+    assert feed._pending == []
+
+    feed.next()
+    assert feed.flush() == [{"meta": {"c": 45, "l": 6}}]
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_lazy_group_sharing_history(batch):
+    s = Stream.source([1, 5, 2, 8, 3, 9, 4], dtype="float").rename("s")
+    rolling = s.rolling(3, min_periods=1)
+
+    feed = DataFeed([
+        s.lag().rename("lag"),
+        Stream.group([
+            rolling.mean().rename("mean"),
+            rolling.max().rename("max")
+        ], lazy=True).rename("meta")
+    ])
+    feed.compile(batch=batch)
+
+    lags = [feed.next()["lag"] for _ in range(7)]
+    outputs = feed.flush()
+
+    assert lags[1:] == [1, 5, 2, 8, 3, 9]
+    np.testing.assert_allclose([o["meta"]["mean"] for o in outputs], [1, 3, 8 / 3, 5, 13 / 3, 20 / 3, 16 / 3])
+    assert [o["meta"]["max"] for o in outputs] == [1, 5, 5, 8, 8, 9, 9]
+
+
+def test_reset_clears_history():
+    s = Stream.source([1, 5, 2], dtype="float").rename("s")
+    feed = DataFeed([s.lag().rename("lag")])
+    feed.compile()
+
+    history = History.of(s)
+    assert history in feed.process
+
+    feed.next()
+    feed.next()
+    assert history.value == 5
+
+    feed.reset()
+    assert history.value is None
+    assert history.n == 0
+    assert [feed.next()["lag"] for _ in range(3)][1:] == [1, 5]
+
+
+def test_lazy_group_with_sensor():
+    s = Stream.source([1, 2, 3], dtype="float").rename("s")
+    t = Stream.sensor(s, lambda x: x.value, dtype="float").rename("t")
+
+    feed = DataFeed([s, Stream.group([t], lazy=True).rename("meta")])
+
+    with pytest.raises(ValueError):
+        feed.compile()
+
+
+def create_grouped_streams():
+    s = Stream.source(np.arange(1, 11, dtype=float), dtype="float").rename("s")
+
+    return [
+        s.lag().rename("lag"),
+        Stream.group([
+            s.rolling(3).mean().rename("mean"),
+            s.cumsum().rename("cumsum")
+        ]).rename("features")
+    ]
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_run_batch(batch):
+    feed = DataFeed(create_grouped_streams())
+    feed.compile()
+    expected = [[o["lag"], o["features"]["mean"], o["features"]["cumsum"]] for o in run(feed)]
+
+    feed = DataFeed(create_grouped_streams())
+    feed.compile(batch=batch)
+
+    assert feed.columns == ["lag", "features:/mean", "features:/cumsum"]
+
+    head = feed.run_batch(4)
+    assert head.shape == (4, 3)
+    np.testing.assert_array_equal(head, expected[:4])
+
+    np.testing.assert_array_equal(feed.run_batch(100), expected[4:])
+    assert not feed.has_next()
+    assert feed.run_batch(5).shape == (0, 3)
+
+    np.testing.assert_array_equal(feed.to_numpy(), expected)
+
+    array = feed.to_numpy(structured=True)
+    assert array.dtype.names == ("lag", "features:/mean", "features:/cumsum")
+    np.testing.assert_array_equal(array["features:/cumsum"], np.cumsum(np.arange(1, 11)))
+
+
+def test_run_batch_with_lazy_group():
+    s = Stream.source([1, 2, 3, 4], dtype="float").rename("s")
+
+    feed = DataFeed([
+        s.cumsum().rename("a"),
+        Stream.group([s.lag().rename("b")], lazy=True).rename("meta")
+    ])
+    feed.compile(batch=True)
+
+    np.testing.assert_array_equal(feed.run_batch(3), [[1], [3], [6]])
+    assert [o["meta"]["b"] for o in feed.flush()][1:] == [1, 2]
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_state_dict(batch):
+    feed = DataFeed(create_streams())
+    feed.compile(batch=batch)
+
+    for _ in range(100):
+        feed.next()
+    state = pickle.loads(pickle.dumps(feed.state_dict()))
+    expected = [feed.next() for _ in range(150)]
+
+    restored = DataFeed(create_streams())
+    restored.compile(batch=batch)
+    restored.load_state_dict(state)
+
+    assert_outputs_equal(run_to_end(restored), expected)
+
+    feed.load_state_dict(state)
+    assert_outputs_equal(run_to_end(feed), expected)
+
+
+def test_state_dict_with_lazy_group():
+    s = Stream.source([1, 2, 3, 4], dtype="float").rename("s")
+    feed = DataFeed([s, Stream.group([s.cumsum().rename("c")], lazy=True).rename("meta")])
+    feed.compile()
+
+    feed.next()
+    feed.next()
+    state = feed.state_dict()
+
+    assert feed.flush() == [{"meta": {"c": 1}}, {"meta": {"c": 3}}]
+    feed.next()
+
+    feed.load_state_dict(state)
+    assert feed.value == {"s": 2}
+    assert feed.flush() == [{"meta": {"c": 1}}, {"meta": {"c": 3}}]
+
+
+def test_load_state_dict_of_other_graph():
+    feed = DataFeed([Stream.source([1, 2, 3], dtype="float").lag().rename("a")])
+    other = DataFeed([Stream.source([1, 2, 3], dtype="float").rename("a")])
+
+    with pytest.raises(ValueError):
+        other.load_state_dict(feed.state_dict())
+
+
+def test_push_many():
+
+    def create_feed():
+        p = Stream.placeholder(dtype="float").rename("p")
+        v = Stream.placeholder(dtype="float").rename("v")
+        return PushFeed([
+            p.rolling(3).mean().rename("mean"),
+            p.ewm(span=4).mean().rename("ewm"),
+            Stream.group([(p * v).rename("pv")]).rename("g")
+        ])
+
+    prices = [1.0, 2.0, 4.0, 3.0, 5.0]
+    volumes = np.array([10.0, 20.0, 10.0, 40.0, 30.0])
+
+    expected = create_feed()
+    rows = []
+    for p, v in zip(prices, volumes.tolist()):
+        output = expected.push({"p": p, "v": v})
+        rows += [[output["mean"], output["ewm"], output["g"]["pv"]]]
+
+    feed = create_feed()
+    output = feed.push_many({"p": prices, "v": volumes})
+
+    assert feed.columns == ["mean", "ewm", "g:/pv"]
+    np.testing.assert_array_equal(output, rows)
+    assert feed.push({"p": 6.0, "v": 1.0}) == expected.push({"p": 6.0, "v": 1.0})
+
+    array = create_feed().push_many({"p": prices, "v": volumes}, structured=True)
+    np.testing.assert_array_equal(array["g:/pv"], np.array(prices) * volumes)
+
+    with pytest.raises(ValueError):
+        feed.push_many({"p": prices, "v": volumes[:2]})
@@ -1,6 +1,11 @@
 
 
+import numpy as np
+
 from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.operators import BinOp
+
+from tests.utils.ops import assert_op
 
 
 def test_generic():
@@ -16,3 +21,14 @@ def test_generic():
 
     feed.next()
     assert feed.next() == {"g1": "m", "g2": 1}
+
+
+def test_generic_kernels_pass_numpy_scalars():
+    s = Stream.source(np.array([1.0, 0.0, 2.0]), dtype="float")
+
+    t = Stream.source(np.array([0.0, 1.0, 0.0]), dtype="float")
+
+    with np.errstate(divide="ignore"):
+        assert_op([s.apply(lambda x: 1 / x).rename("w")], [1.0, np.inf, 0.5])
+        assert_op([BinOp(lambda a, b: a / b)(s, t).rename("w")], [np.inf, 0.0, np.inf])
+        assert_op([s.accumulate(lambda a, b: b / a).rename("w")], [1.0, 0.0, np.inf])
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.base import ArrayStream, MappedArrayStream
+
+
+def test_mmap_npy(tmp_path):
+    path = str(tmp_path / "data.npy")
+    np.save(path, np.arange(12, dtype=float).reshape(6, 2))
+
+    s = Stream.mmap(path, column=1, dtype="float").rename("s")
+
+    assert isinstance(s, MappedArrayStream)
+    assert isinstance(s.buffer, np.memmap)
+    assert s._arguments() == ((path, 1), ())
+    assert len(s.iterable) == 6
+
+    feed = DataFeed([Stream.group([s, s.lag().rename("lag")]).rename("features")])
+    feed.compile()
+
+    assert feed.next()["features"]["s"] == 1.0
+    np.testing.assert_array_equal(feed.to_numpy()[:, 0], [1, 3, 5, 7, 9, 11])
+
+
+def test_mmap_npy_columns(tmp_path):
+    path = str(tmp_path / "data.npy")
+    np.save(path, np.array([1.5, 2.5, 3.5]))
+    assert Stream.mmap(path).forward() == 1.5
+
+    with pytest.raises(ValueError):
+        Stream.mmap(path, column=0)
+
+    records = np.zeros(3, dtype=[("open", float), ("close", float)])
+    records["close"] = [1, 2, 3]
+    np.save(path, records)
+
+    s = Stream.mmap(path, column="close", dtype="float")
+    assert [s.forward() for _ in range(3)] == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        Stream.mmap(path)
+
+
+def test_mmap_arrow(tmp_path):
+    pa = pytest.importorskip("pyarrow", exc_type=ImportError)
+    feather = pytest.importorskip("pyarrow.feather", exc_type=ImportError)
+
+    path = str(tmp_path / "data.feather")
+    table = pa.table({"open": [1.0, 2.0, 3.0], "close": [4.0, 5.0, 6.0]})
+    feather.write_feather(table, path, compression="uncompressed")
+
+    s = Stream.mmap(path, column="close", dtype="float")
+    assert [s.forward() for _ in range(3)] == [4.0, 5.0, 6.0]
+
+    with pytest.raises(ValueError):
+        Stream.mmap(path)
@@ -0,0 +1,80 @@
+import functools
+
+import numpy as np
+
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.base import Constant
+from tensortrade.feed.core.optimize import freeze, signature
+
+
+def run(feed, steps):
+    return [feed.next() for _ in range(steps)]
+
+
+def test_signature():
+    s = Stream.source([1, 2, 3], dtype="float")
+
+    assert signature(s) is None
+    assert signature(s.lag(2)) == signature(s.lag(2))
+    assert signature(s.lag(2)) != signature(s.lag(3))
+    assert signature(s.rolling(3)) == signature(s.rolling(3))
+
+    r = s.rolling(3)
+    assert signature(r.var()) == signature(r.var())
+    assert signature(Stream.constant(1, dtype="float")) != signature(Stream.constant(1.0, dtype="float"))
+    assert freeze(functools.partial(np.var, ddof=1)) == freeze(functools.partial(np.var, ddof=1))
+
+
+def create_streams():
+    s = Stream.source(np.arange(1, 11, dtype=float), dtype="float").rename("s")
+
+    return [
+        s.pct_change().rename("a"),
+        s.pct_change().rename("b"),
+        s.clamp_min(3).rename("c"),
+        s.clamp_min(3).clamp_max(6).rename("d"),
+        s.rolling(3).mean().rename("e"),
+        s.rolling(3).max().rename("f")
+    ]
+
+
+def test_merge_identical_streams():
+    expected = DataFeed(create_streams())
+    expected.compile()
+    assert expected.report is None
+
+    feed = DataFeed(create_streams())
+    feed.compile(optimize=True)
+
+    assert feed.report.merged > 0
+    assert feed.report.removed == feed.report.nodes_before - len(feed.process)
+    assert feed.report.removed > 0
+
+    np.testing.assert_equal(run(feed, 10), run(expected, 10))
+
+
+def test_fold_constants():
+    s = Stream.source([1, 2, 3], dtype="float").rename("s")
+    c = (Stream.constant(2, dtype="float") * 3 + 1).rename("c")
+    out = (s + c).rename("out")
+
+    feed = DataFeed([out, c])
+    feed.compile(optimize=True)
+
+    assert feed.report.folded == 1
+    assert out.inputs[1] is c
+    assert isinstance(c.inputs[0], Constant)
+    assert run(feed, 3) == [{"out": 8, "c": 7}, {"out": 9, "c": 7}, {"out": 10, "c": 7}]
+
+
+def test_protected_streams_are_kept():
+    s = Stream.source([1, 2, 3], dtype="float").rename("s")
+    a = s.lag().rename("a")
+    b = s.lag().rename("b")
+    group = Stream.group([s.lag().rename("x"), s.lag().rename("y")]).rename("g")
+
+    feed = DataFeed([a, b, group])
+    feed.compile(optimize=True)
+
+    assert feed.report.removed == 0
+    assert run(feed, 2)[1] == {"a": 1, "b": 1, "g": {"x": 1, "y": 1}}
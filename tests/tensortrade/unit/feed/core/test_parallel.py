@@ -0,0 +1,61 @@
+import threading
+
+import numpy as np
+
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.parallel import LevelScheduler
+
+from tests.tensortrade.unit.feed.core.test_feed import create_streams, run, assert_outputs_equal
+
+
+def test_parallel_matches_sequential():
+    feed = DataFeed(create_streams())
+    feed.compile()
+    expected = run(feed)
+
+    feed = DataFeed(create_streams())
+    feed.compile(workers=4, threshold=0)
+
+    assert_outputs_equal(run(feed), expected)
+    assert_outputs_equal(run(feed), expected)
+
+
+def test_expensive_streams_run_on_pool():
+    threads = {}
+
+    def record(name):
+        def func(x):
+            threads[name] = threading.current_thread().name
+            return x
+        return func
+
+    s = Stream.source(np.arange(20, dtype=float), dtype="float").rename("s")
+    feed = DataFeed([s.apply(record(name)).rename(name) for name in ["a", "b", "c"]])
+    feed.compile(workers=2, threshold=0)
+
+    outputs = run(feed)
+
+    assert outputs[-1] == {"a": 19, "b": 19, "c": 19}
+    assert sum(name.startswith("feed") for name in threads.values()) == 2
+
+
+def test_schedule():
+    s = Stream.source([1, 2, 3], dtype="float")
+    t = Stream.source([4, 5, 6], dtype="float")
+    a, b = s + t, s * t
+    c = a - b
+
+    feed = DataFeed([c])
+    feed.compile()
+    process = feed.process
+
+    scheduler = LevelScheduler(workers=2, threshold=0, calibration=1)
+    scheduler.run(process)
+
+    schedule = scheduler.schedule(process)
+    assert [set(inline + heavy) for inline, heavy in schedule] == [{s, t}, {a, b}, {c}]
+    assert [(len(inline), len(heavy)) for inline, heavy in schedule] == [(1, 1), (1, 1), (1, 0)]
+
+    scheduler.threshold = float("inf")
+    assert scheduler.schedule(process) == [(process, [])]
+    scheduler.shutdown()
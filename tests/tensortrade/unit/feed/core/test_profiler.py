@@ -0,0 +1,49 @@
+import numpy as np
+
+from tensortrade.feed import Stream, DataFeed
+
+
+def test_profile():
+    s = Stream.source([1, np.nan, 3, 4], dtype="float").rename("s")
+    feed = DataFeed([
+        s.rolling(2).mean().rename("mean"),
+        s.apply(lambda x: x * 2).rename("double")
+    ])
+    feed.compile()
+
+    profiler = feed.profile()
+    assert feed.profile() is profiler
+
+    while feed.has_next():
+        feed.next()
+
+    frame = profiler.to_frame().set_index("name")
+    assert frame.loc["double", "operator"] == "Apply"
+    assert frame.loc["double", "calls"] == 4
+    assert frame.loc["double", "nans"] == 1
+    assert frame.loc["mean", "operator"] == "RollingMean"
+    assert (frame["time"] >= 0).all()
+    assert list(frame.columns) == ["operator", "calls", "time", "mean_time", "nans"]
+
+    by_operator = profiler.to_frame(by="operator").set_index("operator")
+    assert by_operator.loc["IterableStream", "calls"] == 4
+    assert "double" in profiler.table()
+
+    assert feed.profile(False) is None
+    feed.reset()
+    feed.next()
+    assert profiler.to_frame().set_index("name").loc["double", "calls"] == 4
+
+
+def test_profile_batch():
+    s = Stream.source([1, 2, 3], dtype="float").rename("s")
+    feed = DataFeed([s.lag().rename("lag")])
+    feed.compile(batch=True)
+
+    profiler = feed.profile()
+    while feed.has_next():
+        feed.next()
+
+    frame = profiler.to_frame()
+    assert list(frame["operator"]) == ["BatchPlan"]
+    assert list(frame["calls"]) == [3]
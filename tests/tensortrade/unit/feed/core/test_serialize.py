@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from tensortrade.feed import Stream, DataFeed
+from tensortrade.feed.core.serialize import to_spec, from_spec, dumps, loads, graph_hash, GraphCache
+
+
+def create_feed():
+    x = Stream.source([1.0, 2.0, 4.0, 7.0, 11.0, 16.0], dtype="float").rename("x")
+    y = Stream.source([2.0, 3.0, 1.0, 5.0, 8.0, 3.0], dtype="float").rename("y")
+    return DataFeed([
+        x.rolling(2).mean().rename("mean"),
+        (x * y + 1).rename("product"),
+        x.lag().rename("lag"),
+        y.ewm(span=3).mean().rename("ewm"),
+        Stream.group([x.rename("gx"), y.diff().rename("diff")]).rename("group")
+    ])
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_round_trip(batch):
+    feed = create_feed()
+    feed.compile(batch=batch, optimize=True)
+    rebuilt = loads(dumps(feed))
+
+    assert rebuilt.batch == batch
+    assert rebuilt.optimize
+    assert [s.name for s in rebuilt.process] == [s.name for s in feed.process]
+    assert rebuilt._fingerprint() == feed._fingerprint()
+    assert str([rebuilt.next() for _ in range(5)]) == str([feed.next() for _ in range(5)])
+
+
+def test_spec():
+    feed = create_feed()
+    spec = to_spec(feed)
+
+    assert len(spec["nodes"]) == len(feed.process)
+    assert spec["nodes"][0]["type"] == "tensortrade.feed.core.base:IterableStream"
+    assert [spec["nodes"][i]["name"] for i in spec["outputs"]] == ["mean", "product", "lag", "ewm", "group"]
+    assert graph_hash(spec) == graph_hash(to_spec(feed))
+    assert str(from_spec(spec).next()) == str(create_feed().next())
+
+
+def test_lambda_cannot_be_serialized():
+    feed = DataFeed([Stream.source([1, 2, 3]).apply(lambda x: x + 1).rename("inc")])
+
+    with pytest.raises(ValueError):
+        dumps(feed)
+
+
+def test_graph_cache(tmp_path):
+    cache = GraphCache(tmp_path / "graphs")
+    feed = create_feed()
+    key = cache.save(feed)
+
+    assert key in cache
+    assert cache.save(feed) == key
+    assert cache.save(create_feed()) == key
+    assert str(cache.load(key).next()) == str(create_feed().next())
+
+    with pytest.raises(KeyError):
+        cache.load("missing")
+
+
+def test_graph_hash_is_structural():
+    def create(data, window):
+        s = Stream.source(np.array(data), dtype="float").rename("s")
+        return DataFeed([s.rolling(window).mean().rename("mean")])
+
+    key = graph_hash(to_spec(create([1.0, 2.0, 3.0], 2)))
+
+    assert graph_hash(to_spec(create([1.0, 2.0, 3.0], 2))) == key
+    assert graph_hash(to_spec(create([1.0, 2.0, 4.0], 2))) != key
+    assert graph_hash(to_spec(create([1.0, 2.0, 3.0], 3))) != key
+
+
+def test_mmap_source_is_serialized_by_reference(tmp_path):
+    path = str(tmp_path / "data.npy")
+    np.save(path, np.arange(20000, dtype=float).reshape(10000, 2))
+
+    feed = DataFeed([Stream.mmap(path, column=1, dtype="float").lag().rename("lag")])
+    spec = to_spec(feed)
+
+    assert spec["nodes"][0]["args"] == (path, 1)
+    assert len(dumps(feed)) < 10000
+
+    cache = GraphCache(tmp_path / "graphs")
+    key = cache.save(feed)
+    assert key == graph_hash(spec)
+    np.testing.assert_array_equal(cache.load(key).to_numpy()[1:4, 0], [1, 3, 5])
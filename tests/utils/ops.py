@@ -3,11 +3,7 @@ import numpy as np
 from tensortrade.feed.core import DataFeed
 
 
-def assert_op(streams, expected):
-
-    feed = DataFeed(streams)
-    feed.compile()
-
+def run_feed(feed):
     actual = []
     while feed.has_next():
         d = feed.next()
@@ -19,5 +15,18 @@ def assert_op(streams, expected):
             else:
                 assert d[k] == v
         actual += [v]
+    return actual
+
+
+def assert_op(streams, expected):
+
+    feed = DataFeed(streams)
+    feed.compile()
+
+    actual = run_feed(feed)
 
     np.testing.assert_allclose(actual, expected)
+
+    feed.compile(batch=True)
+
+    np.testing.assert_array_equal(run_feed(feed), actual)